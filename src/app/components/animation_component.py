@@ -1,43 +1,61 @@
+from typing import List
 import pygame
 from app.core.animator import Animator, AnimationData
 from app.core.animation_state import AnimationState
 from app.seedwork.path_helper import asset_path
+from app.seedwork.asset_cache import AssetKey, asset_cache
+
+DEFAULT_SCALE = 1.5
+
+# Mapeia estados de animação para pastas e contagens de frames
+ANIMATION_MAP = {
+    "potato": {
+        AnimationState.IDLE: ("idle", 6),
+        AnimationState.RUN: ("run", 5),
+        AnimationState.JUMP: ("jump", 1),
+    },
+    "butter": {AnimationState.IDLE: ("idle", 5)},
+    "cheese": {AnimationState.IDLE: ("idle", 5)},
+    "dried_meat": {AnimationState.IDLE: ("idle", 5)},
+    "milk": {AnimationState.IDLE: ("idle", 5)},
+}
+
+
+def character_frames(character_name: str) -> List[str]:
+    """Arquivos dos frames do personagem, em todas as animações."""
+    return [
+        asset_path("images", "characters", character_name, folder, f"{i}.png")
+        for folder, frame_count in ANIMATION_MAP.get(character_name, {}).values()
+        for i in range(1, frame_count + 1)
+    ]
 
 
 class AnimationComponent:
-    def __init__(self, character_name: str, scale: float = 1.5):
+    def __init__(self, character_name: str, scale: float = DEFAULT_SCALE):
         self.character_name = character_name
         self.scale = scale
         self.state = AnimationState.IDLE
         self.facing_right = True
+        # Referências no cache tomadas pelos frames, devolvidas em release()
+        self._asset_keys: List[AssetKey] = []
         self.animator = self._create_animator()
 
-    def _load_image_and_scale(self, scale: float, *path_parts: str) -> pygame.Surface:
-        image_path = asset_path(*path_parts)
-        image = pygame.image.load(image_path).convert_alpha()
-        scaled_image = pygame.transform.scale(
-            image,
-            (int(image.get_width() * scale), int(image.get_height() * scale)),
-        )
-        return scaled_image
+    def _load_image_and_scale(
+        self, scale: float, *path_parts: str, flip_x: bool = False
+    ) -> pygame.Surface:
+        path = asset_path(*path_parts)
+        self._asset_keys.append(asset_cache.image_key(path, scale=scale, flip_x=flip_x))
+        return asset_cache.image(path, scale=scale, flip_x=flip_x)
+
+    def release(self) -> None:
+        """Devolve os frames ao cache; o componente não deve mais ser desenhado."""
+        for key in self._asset_keys:
+            asset_cache.release(key)
+        self._asset_keys = []
 
     def _create_animator(self) -> Animator:
         animations = {}
-
-        # Mapeia estados de animação para pastas e contagens de frames
-        animation_map = {
-            "potato": {
-                AnimationState.IDLE: ("idle", 6),
-                AnimationState.RUN: ("run", 5),
-                AnimationState.JUMP: ("jump", 1),
-            },
-            "butter": {AnimationState.IDLE: ("idle", 5)},
-            "cheese": {AnimationState.IDLE: ("idle", 5)},
-            "dried_meat": {AnimationState.IDLE: ("idle", 5)},
-            "milk": {AnimationState.IDLE: ("idle", 5)},
-        }
-
-        char_animations = animation_map.get(self.character_name, {})
+        char_animations = ANIMATION_MAP.get(self.character_name, {})
 
         for state, (folder, frame_count) in char_animations.items():
             path_parts = ["images", "characters", self.character_name, folder]
@@ -46,10 +64,18 @@ class AnimationComponent:
                 self._load_image_and_scale(self.scale, *path_parts, f"{i}.png")
                 for i in range(1, frame_count + 1)
             ]
+            flipped_frames = [
+                self._load_image_and_scale(
+                    self.scale, *path_parts, f"{i}.png", flip_x=True
+                )
+                for i in range(1, frame_count + 1)
+            ]
 
             frame_duration = 0.1 if state == AnimationState.IDLE else 0.2
             animations[state] = AnimationData(
-                frames=frames, frame_duration=frame_duration
+                frames=frames,
+                frame_duration=frame_duration,
+                flipped_frames=flipped_frames,
             )
 
         return Animator(animations)
@@ -63,12 +89,7 @@ class AnimationComponent:
         self.facing_right = facing_right
 
     def get_current_frame(self) -> pygame.Surface:
-        frame = self.animator.get_current_frame()
-
-        if not self.facing_right:
-            frame = pygame.transform.flip(frame, True, False)
-
-        return frame
+        return self.animator.get_current_frame(flipped=not self.facing_right)
 
     def get_frame_dimensions(self) -> tuple[int, int]:
         frame = self.get_current_frame()
@@ -7,12 +7,35 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
 @dataclass
 class Config:
     WINDOW_WIDTH: int = 1920
     WINDOW_HEIGHT: int = 1080
     FPS: int = 60
     WINDOW_TITLE: str = "A Odisséia de um Prato"
+    FIXED_TIMESTEP: bool = False
+    TICK_RATE: int = 60
+    MAX_STEPS_PER_FRAME: int = 5
+    VSYNC: bool = False
+    # Caminho do arquivo de replay; vazio desliga a gravação
+    RECORD_REPLAY: str = ""
+    # Exporta o profile de quadros ao sair (.json ou .csv); vazio desliga
+    PROFILE_EXPORT: str = ""
+    # Orçamento do cache de imagens decodificadas, em MB; 0 tira o limite.
+    # Todos os assets do jogo somam ~46 MB: abaixo disso, níveis fora da
+    # tela são decodificados de novo ao voltar
+    IMAGE_CACHE_MB: int = 64
+    # Mixer: frequência (Hz) e buffer (amostras). Buffers menores reduzem a
+    # latência dos efeitos, mas podem falhar em máquinas lentas
+    AUDIO_FREQUENCY: int = 44100
+    AUDIO_BUFFER: int = 512
 
     @classmethod
     def load(cls) -> "Config":
@@ -31,4 +54,13 @@ class Config:
             WINDOW_HEIGHT=int(os.getenv("WINDOW_HEIGHT", 1080)),
             FPS=int(os.getenv("FPS", 60)),
             WINDOW_TITLE=os.getenv("WINDOW_TITLE", "A Odisséia de um Prato"),
+            FIXED_TIMESTEP=_env_bool("FIXED_TIMESTEP", False),
+            TICK_RATE=int(os.getenv("TICK_RATE", 60)),
+            MAX_STEPS_PER_FRAME=int(os.getenv("MAX_STEPS_PER_FRAME", 5)),
+            VSYNC=_env_bool("VSYNC", False),
+            RECORD_REPLAY=os.getenv("RECORD_REPLAY", ""),
+            PROFILE_EXPORT=os.getenv("PROFILE_EXPORT", ""),
+            IMAGE_CACHE_MB=int(os.getenv("IMAGE_CACHE_MB", 64)),
+            AUDIO_FREQUENCY=int(os.getenv("AUDIO_FREQUENCY", 44100)),
+            AUDIO_BUFFER=int(os.getenv("AUDIO_BUFFER", 512)),
         )
@@ -1,13 +1,15 @@
 import pygame
 from typing import Dict, List
 from app.core.animation_state import AnimationState
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
 class AnimationData:
     frames: List[pygame.Surface]
     frame_duration: float
+    # Cópias espelhadas horizontalmente, geradas uma única vez no carregamento
+    flipped_frames: List[pygame.Surface] = field(default_factory=list)
 
 
 class Animator:
@@ -37,5 +39,8 @@ class Animator:
             self._elapsed %= frame_duration
             self._frame_index = (self._frame_index + 1) % len(animation_data.frames)
 
-    def get_current_frame(self) -> pygame.Surface:
-        return self._animations[self._state].frames[self._frame_index]
+    def get_current_frame(self, flipped: bool = False) -> pygame.Surface:
+        animation_data = self._animations[self._state]
+        if flipped and animation_data.flipped_frames:
+            return animation_data.flipped_frames[self._frame_index]
+        return animation_data.frames[self._frame_index]
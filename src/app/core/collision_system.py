@@ -1,55 +1,78 @@
 import pygame
-from typing import List
+from typing import List, Optional, Union
+from app.core.events import Boundary
 from app.entities.tile import Tile
+from app.core.solid_grid import SolidGrid
+from app.core.tile_grid import TileGrid
 from app.components.transform import Transform
 from app.components.movement import Movement
 
+# O que pode ser passado como tiles de colisão: a máscara do nível (o backend
+# usado pelo jogo) ou tiles soltos
+CollisionTiles = Union[SolidGrid, TileGrid, List[Tile]]
+
 
 class CollisionHandler:
     def handle_collisions(
-        self, transform: Transform, movement: Movement, tiles: List[Tile], dt: float
+        self,
+        transform: Transform,
+        movement: Movement,
+        tiles: CollisionTiles,
+        dt: float,
     ):
+        grid = self._as_grid(tiles)
+
         # Movimento horizontal
         transform.x += movement.vx * dt
         transform.update_rect()
 
-        for tile in tiles:
-            if transform.rect.colliderect(tile.rect):
-                # Colidiu se movendo para a direita
-                if movement.vx > 0:
-                    transform.rect.right = tile.rect.left
-                    movement.vx = 0
-                # Colidiu se movendo para a esquerda
-                elif movement.vx < 0:
-                    transform.rect.left = tile.rect.right
-                    movement.vx = 0
-                transform.x = transform.rect.x  # Atualiza a posição do transform
+        # Percorre os tiles na mesma ordem da lista, mas só os das células que
+        # o rect cobre; a busca é refeita a partir do último tile resolvido
+        # porque a correção de posição pode levar o rect para outras células
+        index = grid.first_collision(transform.rect)
+        while index >= 0:
+            tile_rect = grid.rect(index)
+            # Colidiu se movendo para a direita
+            if movement.vx > 0:
+                transform.rect.right = tile_rect.left
+                movement.vx = 0
+            # Colidiu se movendo para a esquerda
+            elif movement.vx < 0:
+                transform.rect.left = tile_rect.right
+                movement.vx = 0
+            transform.x = transform.rect.x  # Atualiza a posição do transform
+            index = grid.first_collision(transform.rect, after=index)
 
         # Movimento vertical
         transform.y += movement.vy * dt
         transform.update_rect()
 
-        for tile in tiles:
-            if transform.rect.colliderect(tile.rect):
-                # Colidiu caindo
-                if movement.vy > 0:
-                    transform.rect.bottom = tile.rect.top
-                    movement.vy = 0
-                # Colidiu pulando
-                elif movement.vy < 0:
-                    transform.rect.top = tile.rect.bottom
-                    movement.vy = 0
-                transform.y = transform.rect.y  # Atualiza a posição do transform
+        index = grid.first_collision(transform.rect)
+        while index >= 0:
+            tile_rect = grid.rect(index)
+            # Colidiu caindo
+            if movement.vy > 0:
+                transform.rect.bottom = tile_rect.top
+                movement.vy = 0
+            # Colidiu pulando
+            elif movement.vy < 0:
+                transform.rect.top = tile_rect.bottom
+                movement.vy = 0
+            transform.y = transform.rect.y  # Atualiza a posição do transform
+            index = grid.first_collision(transform.rect, after=index)
 
-    def check_on_ground(self, transform: Transform, tiles: List[Tile]) -> bool:
+    def check_on_ground(self, transform: Transform, tiles: CollisionTiles) -> bool:
         # cria um retângulo de 1 pixel de altura logo abaixo do personagem
         ground_check_rect = pygame.Rect(
             transform.rect.x, transform.rect.bottom, transform.rect.width, 1
         )
-        for tile in tiles:
-            if ground_check_rect.colliderect(tile.rect):
-                return True
-        return False
+        return self._as_grid(tiles).first_collision(ground_check_rect) >= 0
+
+    def _as_grid(self, tiles: CollisionTiles) -> Union[SolidGrid, TileGrid]:
+        # Listas soltas ainda são aceitas, mas o Level já entrega a máscara pronta
+        if isinstance(tiles, (SolidGrid, TileGrid)):
+            return tiles
+        return TileGrid(tiles)
 
     def check_bounds(
         self,
@@ -57,16 +80,16 @@ class CollisionHandler:
         movement: Movement,
         window_width: int,
         window_height: int,
-    ):
+    ) -> Optional[Boundary]:
         boundary_hit = None
 
         # Borda de cima (para transição de nível)
         if transform.y < 0:
-            boundary_hit = "hit_top_wall"
+            boundary_hit = Boundary.TOP
 
         # Borda de baixo (para transição de nível)
         elif transform.y + transform.height > window_height:
-            boundary_hit = "hit_bottom_wall"
+            boundary_hit = Boundary.BOTTOM
 
         # Bordas laterais (impede o jogador de sair da tela)
         if transform.x < 0:
@@ -1,34 +1,41 @@
 import random
 import logging
 from typing import Set, List
-import pygame
 from app.pplay.window import Window
 from app.pplay.gameimage import GameImage
 from app.ui.menu_button import MenuButton
-from app.core.observer import Observable, Observer
+from app.core.event_bus import EventBus
+from app.core.events import ReturnToMainMenu
+from app.core.scene_stack import Scene
 from app.entities.jumping_character import JumpingCharacter
-from app.pplay.sound import Sound
+from app.pplay.music import Music
 from app.seedwork.path_helper import asset_path
+from app.seedwork.text_cache import text_cache
 
 
-class EndGameState(Observable, Observer):
+class EndGameState(Scene):
+    # Fundo estático: só os personagens pulando e o botão mudam
+    uses_dirty_rects = True
+
     def __init__(
-        self, window: Window, rescued_characters: Set[str], initial_volume: int = 5
+        self,
+        window: Window,
+        rescued_characters: Set[str],
+        events: EventBus,
     ):
-        super().__init__()
         self.window = window
         self.logger = logging.getLogger(__name__)
         self.background = GameImage(asset_path("images", "fim.png"))
 
-        self.menu_music = Sound(asset_path("musics", "fim.mp3"))
-        self.menu_music.set_volume(initial_volume)
+        self.menu_music = Music(asset_path("musics", "fim.mp3"))
         self.menu_music.set_repeat(True)
 
         self.main_menu_button = MenuButton(
             asset_path("images", "main_menu_button.png"),
             0,
             50,
-            "main_menu",
+            ReturnToMainMenu(),
+            events,
         )
         # Centraliza o botão e corrige a posição original para o hover
         self.main_menu_button.x = (
@@ -36,8 +43,6 @@ class EndGameState(Observable, Observer):
         )
         self.main_menu_button.original_x = self.main_menu_button.x
 
-        self.main_menu_button.add_observer(self)
-
         self.characters: List[JumpingCharacter] = []
         self.rescued_text_info: dict | None = None
         self._create_characters(rescued_characters)
@@ -55,8 +60,9 @@ class EndGameState(Observable, Observer):
         all_possible_friends = {"butter", "cheese", "dried_meat", "milk"}
         if len(rescued_characters) < len(all_possible_friends):
             text = f"Amigos resgatados: {len(rescued_characters)}/{len(all_possible_friends)}"
-            font = pygame.font.SysFont("Segoe UI", 36, bold=True)
-            text_surface = font.render(text, True, (255, 255, 255))
+            text_surface = text_cache.render(
+                text, "Segoe UI", 36, (255, 255, 255), bold=True
+            )
             x = self.window.width / 2 - text_surface.get_width() / 2
             y = self.window.height - 250
             self.rescued_text_info = {
@@ -98,16 +104,19 @@ class EndGameState(Observable, Observer):
 
     def update(self, delta_time: float):
         for char in self.characters:
+            before = char.rect
             char.update(delta_time)
             # Colisão com a borda inferior
             if char.transform.y >= self.window.height - char.sprite.height:
                 char.transform.y = self.window.height - char.sprite.height
                 char.movement.vy = -random.randint(500, 700)
+            self.window.mark_dirty(before.union(char.rect))
 
         mouse = self.window.get_mouse()
         mouse_x, mouse_y = mouse.get_position()
 
-        self.main_menu_button.update_hover_state(mouse_x, mouse_y)
+        if self.main_menu_button.update_hover_state(mouse_x, mouse_y):
+            self.window.mark_dirty(self.main_menu_button.dirty_rect)
 
         if mouse.is_button_pressed(1):
             self.stop_music()
@@ -122,8 +131,13 @@ class EndGameState(Observable, Observer):
             char.draw()
         self.main_menu_button.draw()
 
-    def on_notification(self, message: str) -> None:
-        self.notify_observers(message)
+    def close(self) -> None:
+        """Devolve as imagens da tela ao cache."""
+        self.background.release()
+        self.main_menu_button.release()
+        for character in self.characters:
+            character.release()
+        self.characters = []
 
     def on_exit(self):
         self.logger.info("Saindo do EndGameState.")
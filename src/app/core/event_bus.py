@@ -0,0 +1,103 @@
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Type, TypeVar
+from app.core.events import Event
+
+logger = logging.getLogger(__name__)
+
+E = TypeVar("E", bound=Event)
+Handler = Callable[[E], None]
+
+# Eventos postados por handlers são despachados na mesma chamada, até este limite
+MAX_DISPATCH_ROUNDS = 8
+
+
+@dataclass
+class HandlerStats:
+    calls: int = 0
+    total_ns: int = 0
+
+    @property
+    def avg_us(self) -> float:
+        return self.total_ns / self.calls / 1000 if self.calls else 0.0
+
+
+@dataclass
+class EventBusStats:
+    events: Counter = field(default_factory=Counter)
+    handlers: Dict[str, HandlerStats] = field(default_factory=dict)
+
+
+class EventBus:
+    """
+    Barramento de eventos tipados.
+
+    Os handlers são indexados pelo tipo exato do evento. ``post`` só enfileira;
+    a fila é despachada em ``dispatch_pending``, chamado pelo dono do
+    barramento num ponto fixo do quadro, de forma que trabalho pesado (troca
+    de nível, início de partida) nunca roda de dentro de ``Potato.update`` ou
+    do clique de um botão. ``publish`` despacha na hora.
+    """
+
+    def __init__(self, clock: Callable[[], int] = time.perf_counter_ns):
+        self._handlers: Dict[Type[Event], List[Handler]] = {}
+        self._queue: List[Event] = []
+        self._clock = clock
+        self.stats = EventBusStats()
+
+    def subscribe(self, event_type: Type[E], handler: Handler[E]) -> None:
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def unsubscribe(self, event_type: Type[E], handler: Handler[E]) -> None:
+        handlers = self._handlers.get(event_type)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+
+    def post(self, event: Event) -> None:
+        self._queue.append(event)
+
+    def publish(self, event: Event) -> None:
+        event_type = type(event)
+        self.stats.events[event_type.__name__] += 1
+        handlers = self._handlers.get(event_type)
+        if not handlers:
+            return
+
+        logger.debug(f"Dispatching {event}")
+        # Cópia: um handler pode se desinscrever durante o despacho
+        for handler in list(handlers):
+            started = self._clock()
+            handler(event)
+            self._record(handler, self._clock() - started)
+
+    def dispatch_pending(self) -> int:
+        """Despacha a fila e retorna quantos eventos foram entregues."""
+        dispatched = 0
+        for _ in range(MAX_DISPATCH_ROUNDS):
+            if not self._queue:
+                break
+            queue, self._queue = self._queue, []
+            for event in queue:
+                self.publish(event)
+            dispatched += len(queue)
+        else:
+            if self._queue:
+                logger.warning(
+                    f"{len(self._queue)} events left for the next dispatch "
+                    f"after {MAX_DISPATCH_ROUNDS} rounds"
+                )
+        return dispatched
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def _record(self, handler: Handler, elapsed_ns: int) -> None:
+        name = getattr(handler, "__qualname__", repr(handler))
+        stats = self.stats.handlers.get(name)
+        if stats is None:
+            stats = self.stats.handlers[name] = HandlerStats()
+        stats.calls += 1
+        stats.total_ns += elapsed_ns
@@ -0,0 +1,67 @@
+from dataclasses import dataclass
+from enum import Enum
+
+
+class Event:
+    """Base dos eventos do jogo; cada evento é uma dataclass imutável."""
+
+
+# Fluxo entre telas
+
+
+@dataclass(frozen=True)
+class StartGame(Event):
+    pass
+
+
+@dataclass(frozen=True)
+class ContinueGame(Event):
+    pass
+
+
+@dataclass(frozen=True)
+class OpenOptions(Event):
+    pass
+
+
+@dataclass(frozen=True)
+class BackFromOptions(Event):
+    pass
+
+
+@dataclass(frozen=True)
+class ReturnToMainMenu(Event):
+    pass
+
+
+@dataclass(frozen=True)
+class QuitGame(Event):
+    pass
+
+
+@dataclass(frozen=True)
+class GameWon(Event):
+    pass
+
+
+@dataclass(frozen=True)
+class VolumeChanged(Event):
+    volume: int
+
+
+# Partida
+
+
+class Boundary(str, Enum):
+    TOP = "hit_top_wall"
+    BOTTOM = "hit_bottom_wall"
+
+
+@dataclass(frozen=True)
+class BoundaryHit(Event):
+    boundary: Boundary
+
+
+@dataclass(frozen=True)
+class CharacterRescued(Event):
+    name: str
@@ -0,0 +1,166 @@
+"""
+Profiler de quadros por subsistema.
+
+Cada etapa do quadro (entrada, colisão, desenho do nível, HUDs, atualização
+do display...) é medida com ``frame_profiler.section(nome)``. Os tempos de
+um quadro são somados e, no ``end_frame``, gravados num buffer circular de
+tamanho fixo por etapa, pré-alocado: medir não cria objetos por amostra.
+Desligado, ``section`` devolve um contexto vazio compartilhado.
+"""
+
+import csv
+import json
+import logging
+import math
+import time
+from array import array
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Etapas do game loop, na ordem em que aparecem no overlay. "update" inclui
+# "input", "collision" e "events"; "draw" inclui "level_draw" e "hud";
+# "loading" é a finalização dos carregamentos em segundo plano
+STAGES: Sequence[str] = (
+    "frame",
+    "update",
+    "input",
+    "collision",
+    "events",
+    "loading",
+    "draw",
+    "level_draw",
+    "hud",
+    "display",
+)
+
+DEFAULT_CAPACITY = 600  # 10 s a 60 fps
+
+_NULL_SECTION = nullcontext()
+
+
+@dataclass
+class StageStats:
+    avg_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class _Section:
+    """Contexto reaproveitado de uma etapa; um por etapa, criado uma vez."""
+
+    __slots__ = ("_profiler", "_index", "_start")
+
+    def __init__(self, profiler: "FrameProfiler", index: int):
+        self._profiler = profiler
+        self._index = index
+        self._start = 0
+
+    def __enter__(self) -> None:
+        self._start = self._profiler._clock()
+
+    def __exit__(self, *exc_info) -> None:
+        profiler = self._profiler
+        profiler._current[self._index] += profiler._clock() - self._start
+
+
+class FrameProfiler:
+    def __init__(
+        self,
+        stages: Sequence[str] = STAGES,
+        capacity: int = DEFAULT_CAPACITY,
+        clock: Callable[[], int] = time.perf_counter_ns,
+    ):
+        self.stages = tuple(stages)
+        self.capacity = capacity
+        self.enabled = False
+        self._clock = clock
+
+        self._index = {stage: i for i, stage in enumerate(self.stages)}
+        self._sections = {stage: _Section(self, i) for stage, i in self._index.items()}
+        self._current = [0] * len(self.stages)
+        # Uma linha por etapa, em nanossegundos
+        self._samples = [array("q", [0]) * capacity for _ in self.stages]
+        self._cursor = 0
+        self.frames = 0
+
+    def section(self, stage: str):
+        if not self.enabled:
+            return _NULL_SECTION
+        return self._sections[stage]
+
+    def end_frame(self) -> None:
+        """Fecha o quadro atual: grava os totais no buffer e zera os acumuladores."""
+        if not self.enabled:
+            return
+
+        cursor = self._cursor
+        current = self._current
+        for i, samples in enumerate(self._samples):
+            samples[cursor] = current[i]
+            current[i] = 0
+        self._cursor = (cursor + 1) % self.capacity
+        self.frames += 1
+
+    def reset(self) -> None:
+        for samples in self._samples:
+            for i in range(self.capacity):
+                samples[i] = 0
+        self._current = [0] * len(self.stages)
+        self._cursor = 0
+        self.frames = 0
+
+    def samples(self, stage: str) -> List[int]:
+        """Amostras da etapa em ns, da mais antiga para a mais recente."""
+        samples = self._samples[self._index[stage]]
+        if self.frames < self.capacity:
+            return list(samples[: self.frames])
+        return list(samples[self._cursor :]) + list(samples[: self._cursor])
+
+    def summary(self) -> Dict[str, StageStats]:
+        return {stage: _stats(self.samples(stage)) for stage in self.stages}
+
+    def export(self, path: str) -> None:
+        """Salva as amostras: ``.csv`` uma linha por quadro, senão JSON com resumo."""
+        if path.lower().endswith(".csv"):
+            columns = [self.samples(stage) for stage in self.stages]
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow([f"{stage}_ns" for stage in self.stages])
+                writer.writerows(zip(*columns))
+        else:
+            data = {
+                "frames": self.frames,
+                "capacity": self.capacity,
+                "summary": {
+                    stage: asdict(stats) for stage, stats in self.summary().items()
+                },
+                "samples_ns": {stage: self.samples(stage) for stage in self.stages},
+            }
+            with open(path, "w") as f:
+                json.dump(data, f, indent=2)
+        logger.info(f"Frame profile exported to {path}")
+
+
+def _stats(samples: List[int]) -> StageStats:
+    if not samples:
+        return StageStats(0.0, 0.0, 0.0, 0.0)
+
+    ordered = sorted(samples)
+
+    def percentile(p: float) -> float:
+        return ordered[max(0, math.ceil(p * len(ordered)) - 1)] / 1e6
+
+    return StageStats(
+        avg_ms=sum(ordered) / len(ordered) / 1e6,
+        p95_ms=percentile(0.95),
+        p99_ms=percentile(0.99),
+        max_ms=ordered[-1] / 1e6,
+    )
+
+
+# Instância única: o Game liga, e os subsistemas só abrem seções nela
+frame_profiler = FrameProfiler()
@@ -1,98 +1,229 @@
 import logging
-from typing import Optional
+import random
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Dict, Optional
 from app.pplay.window import Window
-from app.pplay.sound import Sound
+from app.pplay.music import Music
+from app.config.config import Config
+from app.core.game_clock import FixedStepClock
+from app.core.frame_profiler import frame_profiler
+from app.seedwork.asset_cache import asset_cache
+from app.seedwork.asset_loader import AssetLoader
+from app.seedwork.audio_manager import MASTER_BUS, audio_manager
+from app.seedwork.startup import startup_report
+from app.seedwork.tilemap_loader import tileset_paths
+from app.seedwork.tileset_cache import tileset_cache
+from app.components.animation_component import DEFAULT_SCALE, character_frames
+from app.core.level import Level
 from app.core.level_slider import LevelSlider
-from app.core.game_state import GameState
+from app.core.event_bus import EventBus
+from app.core.events import (
+    BackFromOptions,
+    ContinueGame,
+    GameWon,
+    OpenOptions,
+    QuitGame,
+    ReturnToMainMenu,
+    StartGame,
+    VolumeChanged,
+)
+from app.core.replay import RecordingInput, Replay, ReplayRecorder
+from app.core.scene_stack import SceneStack
 from app.ui.main_menu import MainMenu
 from app.ui.pause_menu import PauseMenu
-from app.ui.options_menu import OptionsMenu
-from app.core.observer import Observer
+from app.ui.profiler_overlay import ProfilerOverlay
+from app.ui.rescued_friends_hud import ICON_FILES, ICON_SIZE
 from app.seedwork.path_helper import asset_path
-from app.core.end_game_state import EndGameState
 
+if TYPE_CHECKING:
+    # Telas que só aparecem depois do menu: importadas na primeira vez
+    from app.core.end_game_state import EndGameState
+    from app.ui.options_menu import OptionsMenu
 
-class Game(Observer):
-    def __init__(self, window: Window):
+FIRST_LEVEL = 1
+
+
+class Game:
+    def __init__(self, window: Window, config: Optional[Config] = None):
         self.logger = logging.getLogger(__name__)
         self.window = window
+        self.config = config or Config()
         self.running = True
-        self.current_state = GameState.MENU
         self.logger.info("Game initialized")
 
-        # Volume global do jogo
+        budget_mb = self.config.IMAGE_CACHE_MB
+        asset_cache.set_budget(budget_mb * 2**20 if budget_mb > 0 else None)
+
+        # Volume global do jogo: o do barramento master, sob todas as trilhas
         self.current_volume = 5
+        audio_manager.set_volume(MASTER_BUS, self.current_volume)
 
-        self.game_music = Sound(asset_path("musics", "game.mp3"))
-        self.game_music.set_volume(self.current_volume)
-        self.game_music.set_repeat(True)
+        with startup_report.phase("game_music"):
+            self.game_music = Music(asset_path("musics", "game.mp3"))
+            self.game_music.set_repeat(True)
+
+        # Eventos: despachados no fim de cada passo de simulação
+        self.events = EventBus()
+        self.events.subscribe(StartGame, self._on_start_game)
+        self.events.subscribe(ContinueGame, self._on_continue_game)
+        self.events.subscribe(ReturnToMainMenu, self._on_return_to_main_menu)
+        self.events.subscribe(GameWon, self._on_game_won)
+        self.events.subscribe(OpenOptions, self._on_open_options)
+        self.events.subscribe(VolumeChanged, self._on_volume_changed)
+        self.events.subscribe(BackFromOptions, self._on_back_from_options)
+        self.events.subscribe(QuitGame, self._on_quit_game)
 
         # Menus
-        self.menu = MainMenu(window, initial_volume=self.current_volume)
-        self.pause_menu = PauseMenu(window)
-        self.options_menu = OptionsMenu(window, initial_volume=self.current_volume)
+        with startup_report.phase("menus"):
+            self.menu = MainMenu(window, self.events)
+            self.pause_menu = PauseMenu(window, self.events)
+        # Montado na primeira vez que as opções são abertas
+        self.options_menu: Optional["OptionsMenu"] = None
 
-        # Observers
-        self.menu.add_observer(self)
-        self.pause_menu.add_observer(self)
-        self.options_menu.add_observer(self)
+        # Só a cena do topo é atualizada e desenhada
+        self.scenes = SceneStack(window)
+        self.scenes.push(self.menu)
 
         # Levels
         self.level_slider: Optional[LevelSlider] = None
 
+        # Enquanto o menu está na tela, o primeiro nível, o jogador e a trilha
+        # do jogo são carregados em segundo plano: o Play não espera por disco
+        self.loader = AssetLoader()
+        self._warm_levels: Dict[int, Level] = {}
+        with startup_report.phase("warm_up"):
+            self._warm_up()
+
+        # Gravação de replay (RECORD_REPLAY)
+        self.replay_recorder: Optional[ReplayRecorder] = None
+
         # End Game
-        self.end_game_state: Optional[EndGameState] = None
+        self.end_game_state: Optional["EndGameState"] = None
 
         # Pause
         self.esc_pressed = False
 
-    def on_notification(self, message: str) -> None:
-        self.logger.info(f"Game received notification: {message}")
-
-        if message == "start_game":
-            self._start_game()
-        elif message == "continue_game":
-            self.current_state = GameState.PLAYING
-            if not self.game_music.is_playing():
-                self.game_music.play()
-            self.logger.info("Game resumed from menu")
-        elif message == "main_menu":
-            self.game_music.stop()
-            self.menu.start_music()
-            self.current_state = GameState.MENU
+        # Profiler de quadros (overlay no F3)
+        frame_profiler.enabled = True
+        self.profiler_overlay = ProfilerOverlay(window)
+
+    def _warm_up(self) -> None:
+        if self._warm_levels:
+            return
+
+        images = [
+            self.loader.preload_image(path, scale=DEFAULT_SCALE, flip_x=flip_x)
+            for path in character_frames("potato")
+            for flip_x in (False, True)
+        ]
+        images += [
+            self.loader.preload_image(
+                asset_path("images", "hud", filename),
+                size=ICON_SIZE,
+                grayscale=grayscale,
+            )
+            for filename in ICON_FILES.values()
+            for grayscale in (False, True)
+        ]
+        images += [
+            self.loader.preload_image(asset_path("images", "hud", filename))
+            for filename in ("ruler.png", "potato_icon.png")
+        ]
+
+        self.loader.read(self.game_music.music_file).add_done_callback(
+            self._on_game_music_read
+        )
+        self.loader.submit(
+            lambda: tileset_paths(f"map_{FIRST_LEVEL}"),
+            lambda paths: self.loader.after(
+                images
+                + [
+                    self.loader.preload_image(path)
+                    for path in paths
+                    # Os que já viraram atlas não passam mais pelo disco
+                    if path not in tileset_cache
+                ],
+                self._build_first_level,
+            ),
+        )
+
+    def _on_game_music_read(self, future: Future) -> None:
+        if future.exception() is None:
+            self.game_music.preload(future.result())
+
+    def _build_first_level(self) -> None:
+        # Montar o nível converte os tiles: fica na thread principal
+        if self.level_slider is None and not self._warm_levels:
+            self._warm_levels[FIRST_LEVEL] = Level(self.window, FIRST_LEVEL, set())
+            self.logger.info(f"Level {FIRST_LEVEL} ready in background")
+
+    def _on_start_game(self, event: StartGame) -> None:
+        self._start_game()
+
+    def _on_continue_game(self, event: ContinueGame) -> None:
+        if self.scenes.top is not self.pause_menu:
+            return
+        self.scenes.pop()
+        if not self.game_music.is_playing():
+            self.game_music.play()
+        self.logger.info("Game resumed from menu")
+
+    def _on_return_to_main_menu(self, event: ReturnToMainMenu) -> None:
+        self._save_replay()
+        self.game_music.stop()
+        self.menu.start_music()
+        self.scenes.replace(self.menu)
+        if self.level_slider:
+            self.level_slider.close()
+        self.level_slider = None
+        if self.end_game_state:
+            self.end_game_state.close()
+        self.end_game_state = None
+        self._warm_up()
+        self.logger.info("Returned to main menu")
+        self.logger.info(f"Asset cache: {asset_cache.stats}")
+        self.logger.info(f"Event bus: {self.events.stats}")
+
+    def _on_game_won(self, event: GameWon) -> None:
+        self._save_replay()
+        self.game_music.stop()
+        if self.level_slider:
+            from app.core.end_game_state import EndGameState
+
+            rescued_characters = self.level_slider.rescued_characters
+            self.end_game_state = EndGameState(
+                self.window, rescued_characters, self.events
+            )
+            self.end_game_state.start_music()
+            self.scenes.replace(self.end_game_state)
+            self.level_slider.close()
             self.level_slider = None
-            self.logger.info("Returned to main menu")
-        elif message == "game_won":
-            self.game_music.stop()
-            if self.level_slider:
-                rescued_characters = self.level_slider.rescued_characters
-                self.end_game_state = EndGameState(self.window, rescued_characters)
-                self.end_game_state.start_music()
-                self.end_game_state.add_observer(self)
-                self.current_state = GameState.GAME_WON
-                self.level_slider = None
-                self.logger.info("Game won!")
-        elif message == "RESTART_GAME":
-            self.end_game_state = None
-            self.current_state = GameState.MENU
-            self.menu.start_music()
-            self.logger.info("Restarting game, returning to main menu.")
-        elif message == "open_options":
-            self.previous_state = self.current_state  # Salva de onde veio
-            self.current_state = GameState.OPTIONS
-        elif isinstance(message, tuple) and message[0] == "set_volume":
-            self.current_volume = message[1]
-            self.menu.menu_music.set_volume(self.current_volume)
-            self.game_music.set_volume(self.current_volume)
-        elif message == "back_from_options":
-            # Volta para o menu ou pause dependendo do estado anterior
-            if self.level_slider and self.current_state == GameState.OPTIONS:
-                self.current_state = GameState.PAUSED
-            else:
-                self.current_state = GameState.MENU
-        elif message == "EXIT_GAME":
-            self.running = False
-            self.logger.info("Exiting game.")
+            self.logger.info("Game won!")
+
+    def _on_open_options(self, event: OpenOptions) -> None:
+        if self.options_menu is None:
+            from app.ui.options_menu import OptionsMenu
+
+            self.options_menu = OptionsMenu(
+                self.window, self.events, initial_volume=self.current_volume
+            )
+        elif self.scenes.top is self.options_menu:
+            return
+        self.options_menu.volume = self.current_volume
+        self.scenes.push(self.options_menu)
+
+    def _on_volume_changed(self, event: VolumeChanged) -> None:
+        self.current_volume = event.volume
+        audio_manager.set_volume(MASTER_BUS, self.current_volume)
+
+    def _on_back_from_options(self, event: BackFromOptions) -> None:
+        # Volta para o menu ou para a pausa, o que estiver embaixo
+        if self.scenes.top is self.options_menu:
+            self.scenes.pop()
+
+    def _on_quit_game(self, event: QuitGame) -> None:
+        self.running = False
+        self.logger.info("Exiting game.")
 
     def _start_game(self) -> None:
         self.logger.info("Starting game")
@@ -100,75 +231,149 @@ class Game(Observer):
         self.game_music.play()
 
         self.window.set_background_color((0, 0, 0))
-        self.level_slider = LevelSlider(self.window)
-        self.level_slider.add_observer(self)
+        self.level_slider = LevelSlider(
+            self.window,
+            start_level=FIRST_LEVEL,
+            input_handler=self._start_replay_recording(),
+            events=self.events,
+            levels=self._warm_levels,
+            loader=self.loader,
+        )
+        self._warm_levels = {}
+
+        self.scenes.replace(self.level_slider)
+
+    def _start_replay_recording(self) -> Optional[RecordingInput]:
+        if not self.config.RECORD_REPLAY:
+            return None
+
+        # Toda a aleatoriedade do jogo sai do random global: basta a semente
+        seed = random.randrange(2**63)
+        random.seed(seed)
+        self.replay_recorder = ReplayRecorder(
+            Replay(seed, width=self.window.width, height=self.window.height)
+        )
+        self.logger.info(f"Recording replay with seed {seed}")
+        return RecordingInput(self.replay_recorder)
 
-        self.current_state = GameState.PLAYING
+    def _save_replay(self) -> None:
+        if self.replay_recorder is None:
+            return
+
+        path = self.config.RECORD_REPLAY
+        try:
+            self.replay_recorder.save(path)
+            frames = len(self.replay_recorder.replay.frames)
+            self.logger.info(f"Replay with {frames} frames saved to {path}")
+        except OSError as e:
+            self.logger.error(f"Could not save replay to {path}: {e}")
+        self.replay_recorder = None
 
     def _handle_pause_input(self) -> None:
         keyboard = self.window.get_keyboard()
         esc_currently_pressed = keyboard.key_pressed("ESC")
 
         if esc_currently_pressed and not self.esc_pressed:
-            if self.current_state == GameState.PLAYING:
-                self.current_state = GameState.PAUSED
+            if self.scenes.top is self.level_slider:
+                self.scenes.push(self.pause_menu)
                 self.game_music.pause()
                 self.logger.info("Game paused")
-            elif self.current_state == GameState.PAUSED:
-                self.current_state = GameState.PLAYING
+            elif self.scenes.top is self.pause_menu:
+                self.scenes.pop()
                 self.game_music.unpause()
                 self.logger.info("Game resumed")
 
         self.esc_pressed = esc_currently_pressed
 
-    def draw_game(self):
-        # Desenhe tudo do jogo aqui (mapa, personagens, HUD, etc.)
-        if self.level_slider:
-            self.level_slider.draw()
-        # Adicione outros elementos do jogo conforme necessário
-
     def run(self) -> None:
         self.logger.info("Starting game loop")
         self.menu.start_music()
 
+        try:
+            if self.config.FIXED_TIMESTEP:
+                self._run_fixed_timestep()
+            else:
+                self._run_variable_timestep()
+        finally:
+            self._save_replay()
+            self._export_profile()
+            self.loader.close()
+
+        self.window.close()
+
+    def _export_profile(self) -> None:
+        path = self.config.PROFILE_EXPORT
+        if not path:
+            return
+        try:
+            frame_profiler.export(path)
+        except OSError as e:
+            self.logger.error(f"Could not export frame profile to {path}: {e}")
+
+    def _run_variable_timestep(self) -> None:
+        while self.running:
+            with frame_profiler.section("frame"):
+                delta_time = self.window.delta_time()
+                with frame_profiler.section("update"):
+                    self._update(delta_time)
+                self._draw_frame()
+            frame_profiler.end_frame()
+
+    def _run_fixed_timestep(self) -> None:
+        clock = FixedStepClock(
+            fps=self.config.FPS,
+            tick_rate=self.config.TICK_RATE,
+            max_steps_per_frame=self.config.MAX_STEPS_PER_FRAME,
+            vsync=self.window.vsync,
+        )
+        self.logger.info(
+            f"Fixed timestep: {self.config.TICK_RATE} ticks/s, "
+            f"frame cap {self.config.FPS} fps, vsync={self.window.vsync}"
+        )
+
         while self.running:
-            delta_time = self.window.delta_time()
-
-            if self.current_state == GameState.MENU:
-                self.menu.update(delta_time)
-                self.menu.draw()
-            elif self.current_state == GameState.GAME_WON:
-                if self.end_game_state:
-                    self.end_game_state.update(delta_time)
-                    self.end_game_state.draw()
-            elif self.current_state == GameState.PLAYING:
-                if self.level_slider:
-                    self._handle_pause_input()
-                    self.window.set_background_color((0, 0, 0))
-                    self.level_slider.update(delta_time)
-                    # A verificação é necessária porque o update pode ter mudado o estado
-                    if self.current_state == GameState.PLAYING:
-                        self.level_slider.draw()
-            elif self.current_state == GameState.PAUSED:
-                if self.level_slider:
-                    self._handle_pause_input()
-                    self.window.set_background_color((0, 0, 0))
-                    self.level_slider.draw()
-                    self.pause_menu.update(delta_time)
-                    self.pause_menu.draw()
-            elif self.current_state == GameState.OPTIONS:
-                if (
-                    hasattr(self, "previous_state")
-                    and self.previous_state == GameState.PAUSED
-                ):
-                    self.draw_game()  # Desenha o jogo pausado
-                elif (
-                    hasattr(self, "previous_state")
-                    and self.previous_state == GameState.MENU
-                ):
-                    self.menu.draw()  # Desenha o menu principal
-                self.options_menu.volume = self.current_volume
-                self.options_menu.update(delta_time)
-                self.options_menu.draw()
+            with frame_profiler.section("frame"):
+                with frame_profiler.section("update"):
+                    for _ in range(clock.advance()):
+                        self._update(clock.step)
+                        if not self.running:
+                            break
+                self._draw_frame()
+            frame_profiler.end_frame()
+            clock.wait_for_next_frame()
 
+    def _draw_frame(self) -> None:
+        with frame_profiler.section("loading"):
+            self.loader.poll()
+        with frame_profiler.section("draw"):
+            self._draw()
+        self.profiler_overlay.handle_input()
+        self.profiler_overlay.update()
+        self.profiler_overlay.draw()
+        with frame_profiler.section("display"):
             self.window.update()
+        if startup_report.waiting_first_frame:
+            self._on_first_frame()
+
+    def _on_first_frame(self) -> None:
+        startup_report.frame_presented()
+        if startup_report.exit_after_first_frame:
+            self.logger.info("First frame presented; exiting (startup trace)")
+            self.running = False
+
+    def _update(self, delta_time: float) -> None:
+        if self.level_slider and self.scenes.top in (
+            self.level_slider,
+            self.pause_menu,
+        ):
+            self._handle_pause_input()
+
+        if self.replay_recorder and self.scenes.top is self.level_slider:
+            self.replay_recorder.begin_frame(delta_time)
+        self.scenes.update(delta_time)
+
+        with frame_profiler.section("events"):
+            self.events.dispatch_pending()
+
+    def _draw(self) -> None:
+        self.scenes.draw()
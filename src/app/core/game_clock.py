@@ -0,0 +1,77 @@
+import time
+from typing import Callable
+
+NS_PER_SECOND = 1_000_000_000
+
+# Abaixo disso o sleep do SO não é confiável, então o resto é feito cedendo a CPU
+SPIN_THRESHOLD_NS = 2_000_000
+
+
+class FixedStepClock:
+    """
+    Relógio de passo fixo para o game loop.
+
+    A simulação avança sempre em passos de ``1 / tick_rate`` segundos,
+    independente da taxa de quadros, e o quadro é limitado a ``fps``
+    dormindo até o prazo do próximo quadro. O tempo é contado em
+    nanossegundos inteiros para o acumulador não perder ticks por
+    arredondamento.
+    """
+
+    def __init__(
+        self,
+        fps: int,
+        tick_rate: int,
+        max_steps_per_frame: int = 5,
+        vsync: bool = False,
+        clock: Callable[[], int] = time.perf_counter_ns,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if tick_rate <= 0:
+            raise ValueError("tick_rate must be positive")
+        if max_steps_per_frame <= 0:
+            raise ValueError("max_steps_per_frame must be positive")
+
+        self.step_ns = NS_PER_SECOND // tick_rate
+        self.step = self.step_ns / NS_PER_SECOND
+        self.frame_duration_ns = NS_PER_SECOND // fps if fps > 0 else 0
+        self.max_steps_per_frame = max_steps_per_frame
+        self.vsync = vsync
+        self._clock = clock
+        self._sleep = sleep
+
+        self._accumulator_ns = 0
+        self.dropped_ns = 0
+        self._last_time = self._clock()
+        self._frame_deadline = self._last_time + self.frame_duration_ns
+
+    def advance(self) -> int:
+        """Retorna quantos passos fixos a simulação deve rodar neste quadro."""
+        now = self._clock()
+        self._accumulator_ns += now - self._last_time
+        self._last_time = now
+
+        steps, self._accumulator_ns = divmod(self._accumulator_ns, self.step_ns)
+        if steps > self.max_steps_per_frame:
+            # Depois de um engasgo (load de nível, janela arrastada) o atraso
+            # é descartado em vez de rodar dezenas de passos de uma vez
+            self.dropped_ns += (steps - self.max_steps_per_frame) * self.step_ns
+            steps = self.max_steps_per_frame
+
+        return steps
+
+    def wait_for_next_frame(self) -> None:
+        if self.vsync or self.frame_duration_ns <= 0:
+            return
+
+        remaining = self._frame_deadline - self._clock()
+        if remaining > SPIN_THRESHOLD_NS:
+            self._sleep((remaining - SPIN_THRESHOLD_NS) / NS_PER_SECOND)
+        while self._clock() < self._frame_deadline:
+            self._sleep(0)
+
+        self._frame_deadline += self.frame_duration_ns
+        now = self._clock()
+        if self._frame_deadline < now:
+            # Perdeu o prazo (quadro lento): ressincroniza em vez de acelerar
+            self._frame_deadline = now + self.frame_duration_ns
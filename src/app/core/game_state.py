@@ -1,10 +0,0 @@
-from enum import Enum
-
-
-class GameState(Enum):
-    MENU = "menu"
-    PLAYING = "playing"
-    PAUSED = "paused"
-    GAME_OVER = "game_over"
-    GAME_WON = "game_won"
-    OPTIONS = "options"
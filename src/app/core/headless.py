@@ -0,0 +1,215 @@
+"""
+Simulação sem display para rodar partidas em CI e máquinas de análise.
+
+``run_headless`` monta um ``LevelSlider`` sobre uma ``NullWindow`` e avança
+``LevelSlider``/``Level``/``Potato`` o mais rápido possível, com entradas
+vindas de um roteiro em vez do teclado e sem nenhum desenho.
+
+    python -m app.core.headless --runs 100 --frames 3600 --seed 0
+"""
+
+import argparse
+import logging
+import os
+import random
+import time
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional, Tuple
+import pygame
+from app.components.input_handler import InputHandler
+from app.core.level_slider import LevelSlider
+from app.pplay.window import Window
+
+InputFrame = Tuple[bool, bool, bool]
+
+NO_INPUT: InputFrame = (False, False, False)
+
+
+def init_headless_display() -> None:
+    """
+    Garante um display para ``convert``/``convert_alpha`` dos assets.
+
+    Se ainda não existe tela, troca o vídeo pelo driver ``dummy`` do SDL e
+    abre uma superfície 1x1 que nunca é desenhada; se já existe (ex.: dentro
+    dos testes), reaproveita.
+    """
+    if pygame.display.get_surface() is not None:
+        return
+
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.display.quit()
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+
+class NullWindow(Window):
+    """Window sem tela: só dimensões e relógio, nada é desenhado."""
+
+    screen = None
+
+    def __init__(self, width: int = 1920, height: int = 1080):
+        init_headless_display()
+        self.width = width
+        self.height = height
+        self.color = [0, 0, 0]
+        self.title = "Headless"
+        self.vsync = False
+        self._clock_start = time.perf_counter()
+        self.curr_time = 0
+        self.last_time = 0
+        self.total_time = 0
+
+    def update(self) -> None:
+        pass
+
+    def set_dirty_rects(self, enabled: bool) -> None:
+        pass
+
+    def mark_dirty(self, rect) -> None:
+        pass
+
+    def invalidate(self) -> None:
+        pass
+
+    def set_background_color(self, RGB) -> None:
+        self.color = RGB
+
+    def set_title(self, title) -> None:
+        self.title = title
+
+    def draw_text(self, *args, **kwargs) -> None:
+        pass
+
+
+class ScriptedInput(InputHandler):
+    """
+    Substitui o teclado do ``InputHandler``: cada ``get_movement_input``
+    consome o próximo quadro ``(esquerda, direita, pulo)`` do roteiro. Quando
+    o roteiro acaba, nenhuma tecla fica pressionada.
+    """
+
+    def __init__(self, frames: Iterable[InputFrame]):
+        super().__init__()
+        self._frames = iter(frames)
+        self.frame_count = 0
+
+    def get_movement_input(self) -> InputFrame:
+        self.frame_count += 1
+        return next(self._frames, NO_INPUT)
+
+    def get_debug_movement_input(self) -> Tuple[bool, bool, bool, bool]:
+        return False, False, False, False
+
+    def get_toggle_debug_input(self) -> bool:
+        return False
+
+
+def hold(frames: int, left=False, right=False, jump=False) -> Iterator[InputFrame]:
+    """Mesmas teclas seguradas por ``frames`` quadros."""
+    for _ in range(frames):
+        yield left, right, jump
+
+
+def random_inputs(seed: int) -> Iterator[InputFrame]:
+    """Roteiro infinito e reproduzível: andar, parar e pulos de carga variada."""
+    rng = random.Random(seed)
+    while True:
+        action = rng.random()
+        if action < 0.4:
+            direction = rng.random() < 0.5
+            yield from hold(rng.randint(5, 40), left=direction, right=not direction)
+        elif action < 0.8:
+            # carrega o pulo no chão e solta, às vezes já escolhendo a direção
+            yield from hold(rng.randint(1, 60), jump=True)
+            direction = rng.random()
+            yield from hold(
+                rng.randint(10, 50), left=direction < 0.3, right=direction > 0.7
+            )
+        else:
+            yield from hold(rng.randint(1, 20))
+
+
+@dataclass
+class HeadlessResult:
+    frames: int
+    elapsed: float
+    simulated_seconds: float
+    final_level: int
+    won: bool
+
+    @property
+    def fps(self) -> float:
+        """Quadros simulados por segundo de relógio."""
+        return self.frames / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def run_headless(
+    inputs: Iterable[InputFrame],
+    max_frames: int,
+    delta_time: float = 1 / 60,
+    start_level: int = 1,
+    window: Optional[Window] = None,
+) -> HeadlessResult:
+    """Roda uma partida sem display até ``max_frames`` ou até o fim do jogo."""
+    window = window or NullWindow()
+    slider = LevelSlider(
+        window,
+        start_level=start_level,
+        prefetch=False,
+        input_handler=ScriptedInput(inputs),
+    )
+
+    frames = 0
+    started = time.perf_counter()
+    try:
+        while frames < max_frames and not slider.ended:
+            slider.update(delta_time)
+            frames += 1
+    finally:
+        slider.close()
+    elapsed = time.perf_counter() - started
+
+    return HeadlessResult(
+        frames=frames,
+        elapsed=elapsed,
+        simulated_seconds=frames * delta_time,
+        final_level=slider.current_level_num,
+        won=slider.ended,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Partidas simuladas sem display")
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--frames", type=int, default=3600)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tick-rate", type=int, default=60)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    total_frames = 0
+    total_elapsed = 0.0
+    for run in range(args.runs):
+        result = run_headless(
+            random_inputs(args.seed + run),
+            max_frames=args.frames,
+            delta_time=1 / args.tick_rate,
+        )
+        total_frames += result.frames
+        total_elapsed += result.elapsed
+        print(
+            f"run {run}: {result.frames} frames, level {result.final_level}, "
+            f"won={result.won}, {result.fps:.0f} simulated fps"
+        )
+
+    if total_elapsed > 0:
+        print(
+            f"total: {total_frames} frames in {total_elapsed:.2f}s "
+            f"({total_frames / total_elapsed:.0f} simulated fps)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,10 @@
 from app.entities.potato import Potato
 from app.pplay.window import Window
 from typing import List, Tuple, Optional, Any, Set
-from app.seedwork.tilemap_loader import load_tilemap_groups  # type: ignore
+from app.seedwork.tilemap_loader import load_tilemap  # type: ignore
 from app.entities.tile import Tile
 from app.core.tilemap_group import TilemapGroup
+from app.core.solid_grid import SolidGrid
 from app.entities.idle_character import IdleCharacter
 import logging
 import random
@@ -16,10 +17,27 @@ SPAWN_CONFIG: List[Tuple[int, str, float, float, bool]] = [
     (8, "milk", 1408.0, 354.0, False),
 ]
 
+# Camadas que nunca se movem e podem ser pré-compostas numa única superfície
+STATIC_LAYERS: Tuple[TilemapGroup, ...] = (
+    TilemapGroup.BACKGROUND,
+    TilemapGroup.INTERACTIVE_BLOCK,
+    TilemapGroup.SCENERY_BLOCK,
+    TilemapGroup.SCENERY_OBJECT,
+)
+
+
+def level_characters(level_number: int) -> List[str]:
+    """Amigos que podem aparecer no nível (resgatados ou não)."""
+    return [name for level, name, *_ in SPAWN_CONFIG if level == level_number]
+
 
 class Level:
     def __init__(
-        self, window: Window, level_number: int, rescued_characters: Set[str]
+        self,
+        window: Window,
+        level_number: int,
+        rescued_characters: Set[str],
+        bake: bool = True,
     ) -> None:
         self.logger = logging.getLogger(__name__)
         self.window = window
@@ -30,12 +48,30 @@ class Level:
         self.idle_characters: pygame.sprite.Group = pygame.sprite.Group()
 
         # Map
-        self.tiles: List[Tile] = []
+        # Colisão: máscara das células de INTERACTIVE_BLOCK (a TileLayer da
+        # camada só serve para compor a superfície estática)
+        self.solid_grid = SolidGrid(0, 0)
         self.tilemap_layers: List[Tuple[TilemapGroup, Any]] = []
         self.random_background_color: Optional[Tuple[int, int, int]] = None
+        self._static_surface: Optional[pygame.Surface] = None
+        self._dirty_layers: Set[TilemapGroup] = set()
         self._load_map()
         self._spawn_characters()
 
+        # Sem ``bake`` a composição fica para bake_static_layers() (ou o draw)
+        if bake:
+            self.bake_static_layers()
+
+    def bake_static_layers(self) -> None:
+        """Compõe a superfície das camadas estáticas, se ainda não existe."""
+        # Sem tela (modo headless) não há o que compor
+        if (
+            self._static_surface is None
+            and not self.random_background_color
+            and self.window.screen is not None
+        ):
+            self._static_surface = self._bake_static_layers()
+
     def _spawn_characters(self) -> None:
         for level, name, x, y, flipped in SPAWN_CONFIG:
             if self.level_number == level:
@@ -50,14 +86,9 @@ class Level:
 
     def _load_map(self) -> None:
         try:
-            self.tilemap_layers = load_tilemap_groups(f"map_{self.level_number}")
-            self.tiles = []
-
-            # Tiles que de fato eu preciso detectar colisão
-            for group_type, group in self.tilemap_layers:
-                if group_type == TilemapGroup.INTERACTIVE_BLOCK:
-                    for tile in group:
-                        self.tiles.append(tile)
+            tilemap = load_tilemap(f"map_{self.level_number}")
+            self.tilemap_layers = tilemap.layers
+            self.solid_grid = tilemap.solid
 
         except Exception as e:
             self.logger.error(f"Error loading map: {e}")
@@ -67,6 +98,22 @@ class Level:
                 random.randint(0, 255),
             )
 
+    def close(self) -> None:
+        """Devolve ao cache os frames dos personagens; o nível não é mais usado."""
+        for character in list(self.idle_characters):
+            character.kill()
+
+    def mark_layer_dirty(self, group_type: TilemapGroup) -> None:
+        """Força a recomposição da superfície estática no próximo draw."""
+        if group_type in STATIC_LAYERS:
+            self._dirty_layers.add(group_type)
+
+    def sync_rescued_characters(self) -> None:
+        """Remove os amigos já resgatados; o estado vive fora dos dados do mapa."""
+        for character in list(self.idle_characters):
+            if character.animation_component.character_name in self.rescued_characters:
+                character.kill()
+
     def set_main_character(self, main_character: Potato) -> None:
         self.logger.info(f"Setting main character: {main_character}")
         self.main_character = main_character
@@ -75,7 +122,7 @@ class Level:
         if self.main_character:
             self.main_character.update(
                 delta_time,
-                self.tiles,
+                self.solid_grid,
                 self.window.width,
                 self.window.height,
                 self.idle_characters,
@@ -96,23 +143,39 @@ class Level:
             self.idle_characters.draw(self.window.screen)
 
     def _draw_tilemap_layers(self) -> None:
+        if self.window.screen is None:
+            raise NotImplementedError("Window is None or not initialized")
+
+        if self._static_surface is None or self._dirty_layers:
+            self._static_surface = self._bake_static_layers()
+            self._dirty_layers.clear()
+
+        self.window.screen.blit(self._static_surface, (0, 0))
+
+    def _bake_static_layers(self) -> pygame.Surface:
+        # Superfície no formato do display para o blit por frame ser o mais barato
+        surface = pygame.Surface((self.window.width, self.window.height)).convert()
+        # Mesmo fundo preto que o Game pinta antes de level_slider.draw()
+        surface.fill((0, 0, 0))
+
         # 1. desenha background primeiro
         for group_type, group in self.tilemap_layers:
             if group_type == TilemapGroup.BACKGROUND:
                 for background_tile in group:
-                    background_tile.draw(self.window)
+                    background_tile.draw_on(surface, self.window.width)
 
         # 2. desenha blocos interativos
         for group_type, group in self.tilemap_layers:
             if group_type == TilemapGroup.INTERACTIVE_BLOCK:
-                group.draw(self.window.screen)
-                # self._debug_draw(self.window, group)
+                group.draw(surface)
 
         # 3. desenha cenário pode ter blocos sobrepostos desenhados depois
         for group_type, group in self.tilemap_layers:
             if group_type in [TilemapGroup.SCENERY_BLOCK, TilemapGroup.SCENERY_OBJECT]:
-                group.draw(self.window.screen)
-                # self._debug_draw(self.window, group)
+                group.draw(surface)
+
+        self.logger.info(f"Camadas estáticas do nível {self.level_number} compostas")
+        return surface
 
     def _debug_draw(self, window: Window, tilegroup: List[Tile]) -> None:
         if window.screen is None:
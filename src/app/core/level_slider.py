@@ -1,16 +1,39 @@
 import logging
-from typing import Set
-from app.core.level import Level
-from app.core.observer import Observer, Observable
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from app.components.animation_component import DEFAULT_SCALE, character_frames
+from app.core.level import Level, level_characters
+from app.core.frame_profiler import frame_profiler
+from app.core.event_bus import EventBus
+from app.core.events import Boundary, BoundaryHit, CharacterRescued, GameWon
+from app.core.scene_stack import Scene
 from app.pplay.window import Window
 from app.entities.potato import Potato
+from app.components.input_handler import InputHandler
 from app.ui.altitude_hud import AltitudeHUD
 from app.ui.rescued_friends_hud import RescuedFriendsHUD
+from app.seedwork.asset_cache import AssetKey, asset_cache
+from app.seedwork.asset_loader import AssetLoader
+from app.seedwork.tilemap_loader import tileset_keys, tilesets
+from app.seedwork.tileset_cache import tileset_cache
 
+# Níveis montados mantidos em memória (o atual e os vizinhos, com folga)
+DEFAULT_LEVEL_CACHE_SIZE = 4
 
-class LevelSlider(Observer, Observable):
-    def __init__(self, window: Window, start_level: int = 1):
-        Observable.__init__(self)
+
+class LevelSlider(Scene):
+    def __init__(
+        self,
+        window: Window,
+        start_level: int = 1,
+        level_cache_size: int = DEFAULT_LEVEL_CACHE_SIZE,
+        prefetch: bool = True,
+        input_handler: Optional[InputHandler] = None,
+        events: Optional[EventBus] = None,
+        levels: Optional[Dict[int, Level]] = None,
+        loader: Optional[AssetLoader] = None,
+    ):
         self.logger = logging.getLogger(__name__)
         self.window = window
         self.max_level = 8
@@ -19,47 +42,249 @@ class LevelSlider(Observer, Observable):
         self.rescued_characters: Set[str] = set()
         self.ended = False
 
+        # Cache LRU de níveis prontos e carregamentos em andamento
+        self.level_cache_size = max(1, level_cache_size)
+        self._level_cache: "OrderedDict[int, Level]" = OrderedDict()
+        # Níveis montados antes do jogo começar (aquecimento durante o menu)
+        for level_num, level in (levels or {}).items():
+            level.rescued_characters = self.rescued_characters
+            self._level_cache[level_num] = level
+        self._pending_levels: Dict[int, Future] = {}
+        # Os vizinhos vêm pelo AssetLoader: o pool só lê o mapa e decodifica as
+        # imagens; atlas, tiles e composição são montados em poll, na thread
+        # principal. Sem loader de fora (testes, headless) o slider usa um
+        # próprio e o consulta no update
+        self._owns_loader = prefetch and loader is None
+        self.loader = loader if prefetch else None
+        if self._owns_loader:
+            self.loader = AssetLoader()
+
+        # Sem barramento externo (modo headless, testes) o próprio slider despacha
+        self._owns_events = events is None
+        self.events = events or EventBus()
+
         # Criar personagem principal
-        self.main_character = Potato(900, 600)
-        self.main_character.add_observer(self)
+        self.main_character = Potato(900, 600, input_handler, self.events)
 
-        # Carregar apenas o nível atual
-        self.current_level = self._create_level(self.current_level_num)
+        # Carregar o nível atual; os vizinhos vêm em segundo plano
+        self._pinned_assets: List[AssetKey] = []
+        self._level_assets: Dict[int, List[AssetKey]] = {}
+        self._pin_level_assets(self.current_level_num)
+        self.current_level = self._get_level(self.current_level_num)
         self._add_player_to_current_level()
+        self._prefetch_neighbors()
 
         # HUD
         self.altitude_hud = AltitudeHUD(self.window)
         self.rescued_friends_hud = RescuedFriendsHUD(self.window)
-        self.main_character.add_observer(self.rescued_friends_hud)
 
-    def _create_level(self, level_num: int) -> Level:
+        self.events.subscribe(BoundaryHit, self._on_boundary_hit)
+        self.events.subscribe(CharacterRescued, self._on_character_rescued)
+        self.events.subscribe(
+            CharacterRescued, self.rescued_friends_hud.on_character_rescued
+        )
+
+    def _create_level(self, level_num: int, bake: bool = True) -> Level:
         self.logger.info(f"Carregando nível {level_num}")
-        return Level(self.window, level_num, self.rescued_characters)
+        return Level(self.window, level_num, self.rescued_characters, bake=bake)
+
+    def _get_level(self, level_num: int) -> Level:
+        level = self._level_cache.get(level_num)
+        if level is not None:
+            self.logger.info(f"Nível {level_num} reaproveitado do cache")
+        else:
+            pending = self._pending_levels.pop(level_num, None)
+            level = None
+            if pending is not None:
+                # Ainda carregando em segundo plano: termina aqui em vez de duplicar
+                try:
+                    level = self.loader.wait_for(pending)
+                except Exception as e:
+                    self.logger.error(f"Falha ao pré-carregar o nível {level_num}: {e}")
+            if level is None:
+                level = self._create_level(level_num)
+            self._level_cache[level_num] = level
+
+        self._level_cache.move_to_end(level_num)
+        self._evict_levels()
+        return level
+
+    def _enter_level(self, level_num: int) -> None:
+        self._pin_level_assets(level_num)
+        self.current_level = self._get_level(level_num)
+
+    def _pin_level_assets(self, level_num: int) -> None:
+        # Os tilesets do nível na tela ficam fora do orçamento do AssetCache;
+        # fixados antes de montar o nível, para um não descartar o outro
+        keys = self._level_assets.get(level_num)
+        if keys is None:
+            try:
+                keys = tileset_keys(f"map_{level_num}")
+            except Exception as e:
+                self.logger.warning(f"Tilesets do nível {level_num} não fixados: {e}")
+                keys = []
+            self._level_assets[level_num] = keys
+        asset_cache.pin(keys)
+        asset_cache.unpin(self._pinned_assets)
+        self._pinned_assets = keys
+
+    def _evict_levels(self) -> None:
+        while len(self._level_cache) > self.level_cache_size:
+            level_num, level = self._level_cache.popitem(last=False)
+            level.close()
+            self.logger.info(f"Nível {level_num} removido do cache")
+
+    def _prefetch_neighbors(self) -> None:
+        if self.loader is None:
+            return
+
+        for level_num in (self.current_level_num - 1, self.current_level_num + 1):
+            if not self.min_level <= level_num <= self.max_level:
+                continue
+            if level_num in self._level_cache or level_num in self._pending_levels:
+                continue
+            self.logger.info(f"Pré-carregando nível {level_num}")
+            self._pending_levels[level_num] = self._prefetch_level(level_num)
+
+    def _prefetch_level(self, level_num: int) -> Future:
+        """
+        Monta o nível em etapas, cada uma um pedido do loader: o ``poll`` de
+        cada quadro finaliza só o que cabe no orçamento dele. O future fica
+        pronto com o nível; cancelado, a cadeia para na etapa seguinte.
+        """
+        loader = self.loader
+        ready: Future = Future()
+
+        def step(function: Callable[..., Any], *args: Any) -> Callable[..., None]:
+            def run(*results: Any) -> None:
+                if ready.done():
+                    return
+                try:
+                    function(*args, *results)
+                except Exception as e:
+                    ready.set_exception(e)
+
+            return run
+
+        def decoded(files: List[Tuple[str, str]]) -> None:
+            # Tilesets que já viraram atlas não passam mais pelo disco
+            images = [
+                loader.preload_image(path)
+                for path, _ in files
+                if path not in tileset_cache
+            ]
+            images += [
+                loader.preload_image(path, scale=DEFAULT_SCALE, flip_x=flip_x)
+                for name in level_characters(level_num)
+                for path in character_frames(name)
+                for flip_x in (False, True)
+            ]
+            loader.after(images, step(build_atlases, files))
+
+        def build_atlases(files: List[Tuple[str, str]]) -> None:
+            # Um atlas por pedido: são as conversões mais caras
+            atlases = [
+                loader.after([], step(tileset_cache.tile, path, colorkey or None))
+                for path, colorkey in files
+            ]
+            loader.after(atlases, step(build_level))
+
+        def build_level() -> None:
+            level = self._create_level(level_num, bake=False)
+            loader.after([], lambda: bake(level))
+
+        def bake(level: Level) -> None:
+            if ready.done():
+                level.close()
+                return
+            try:
+                level.bake_static_layers()
+            except Exception as e:
+                level.close()
+                ready.set_exception(e)
+                return
+            ready.set_result(level)
+
+        map_name = f"map_{level_num}"
+        parsing = loader.submit(lambda: tilesets(map_name), step(decoded))
+        parsing.add_done_callback(lambda done: _forward_error(done, ready))
+        return ready
+
+    def _collect_prefetched_levels(self) -> None:
+        for level_num, future in list(self._pending_levels.items()):
+            if not future.done():
+                continue
+            del self._pending_levels[level_num]
+            if future.exception() is not None:
+                self.logger.error(
+                    f"Falha ao pré-carregar o nível {level_num}: {future.exception()}"
+                )
+                continue
+            self._level_cache[level_num] = future.result()
+        # O nível atual continua sendo o mais recente, então nunca é descartado
+        if self.current_level_num in self._level_cache:
+            self._level_cache.move_to_end(self.current_level_num)
+        self._evict_levels()
+
+    def close(self) -> None:
+        """
+        Sai do barramento, interrompe os pré-carregamentos e devolve ao
+        cache os assets dos níveis, do jogador e do HUD.
+        """
+        self.events.unsubscribe(BoundaryHit, self._on_boundary_hit)
+        self.events.unsubscribe(CharacterRescued, self._on_character_rescued)
+        self.events.unsubscribe(
+            CharacterRescued, self.rescued_friends_hud.on_character_rescued
+        )
+        # Pré-carregamentos em andamento param na próxima etapa
+        for future in self._pending_levels.values():
+            future.cancel()
+        self._pending_levels.clear()
+        if self._owns_loader:
+            self.loader.close()
+        self.loader = None
+        for level in self._level_cache.values():
+            level.close()
+        self._level_cache.clear()
+        self.main_character.release()
+        self.altitude_hud.close()
+        self.rescued_friends_hud.close()
+        asset_cache.unpin(self._pinned_assets)
+        self._pinned_assets = []
 
     def _add_player_to_current_level(self) -> None:
         self.logger.info(
             f"Adicionando personagem principal ao nível {self.current_level_num}"
         )
+        self.current_level.sync_rescued_characters()
         self.current_level.set_main_character(self.main_character)
 
-    def on_notification(self, message: str) -> None:
-        self.logger.info(f"Recebida notificação: {message}")
-        if message == "hit_top_wall":
+    def _on_boundary_hit(self, event: BoundaryHit) -> None:
+        if self.ended:
+            return
+
+        # O despacho é no fim do passo: se mais de um passo postou o mesmo
+        # toque na borda, só o primeiro troca de nível
+        transform = self.main_character.transform
+        if event.boundary == Boundary.TOP and transform.y < 0:
             self.slide_next()
-        elif message == "hit_bottom_wall":
+        elif (
+            event.boundary == Boundary.BOTTOM
+            and transform.y + transform.height > self.window.height
+        ):
             self.slide_previous()
-        elif message.startswith("rescued_"):
-            character_name = message.replace("rescued_", "")
-            self.rescued_characters.add(character_name)
-            self.logger.info(
-                f"Rescued character '{character_name}' state saved in LevelSlider."
-            )
+
+    def _on_character_rescued(self, event: CharacterRescued) -> None:
+        self.rescued_characters.add(event.name)
+        self.logger.info(
+            f"Rescued character '{event.name}' state saved in LevelSlider."
+        )
 
     def slide_next(self) -> None:
         next_level_num = self.current_level_num + 1
         if next_level_num > self.max_level:
             self.logger.info("Último nível concluído! Fim de jogo.")
-            self.notify_observers("game_won")
+            self.events.post(GameWon())
             self.ended = True
             return
 
@@ -70,8 +295,8 @@ class LevelSlider(Observer, Observable):
         self.logger.info(f"Avançando para o nível {next_level_num}")
         self.current_level_num = next_level_num
 
-        # Criar nova instância do nível
-        self.current_level = self._create_level(self.current_level_num)
+        # Troca para o nível já montado (cache/pré-carregamento)
+        self._enter_level(self.current_level_num)
 
         # Posicionar o jogador na base do novo nível (margem mínima para máxima fluidez)
         self.main_character.transform.y = (
@@ -94,6 +319,7 @@ class LevelSlider(Observer, Observable):
             f"Posição do jogador ajustada para y={self.main_character.transform.y}"
         )
         self._add_player_to_current_level()
+        self._prefetch_neighbors()
 
     def slide_previous(self) -> None:
         prev_level_num = self.current_level_num - 1
@@ -108,8 +334,8 @@ class LevelSlider(Observer, Observable):
         self.logger.info(f"Retornando para o nível {prev_level_num}")
         self.current_level_num = prev_level_num
 
-        # Criar nova instância do nível
-        self.current_level = self._create_level(self.current_level_num)
+        # Troca para o nível já montado (cache/pré-carregamento)
+        self._enter_level(self.current_level_num)
 
         # Posicionar o jogador no topo do novo nível (margem mínima para máxima fluidez)
         self.main_character.transform.y = 2
@@ -130,18 +356,33 @@ class LevelSlider(Observer, Observable):
 
         self.logger.info("Posição do jogador ajustada para y=2")
         self._add_player_to_current_level()
+        self._prefetch_neighbors()
 
     def update(self, delta_time: float) -> None:
         if self.ended:
             self.logger.info("O jogo já terminou, indo pra cena final.")
             return
 
+        if self._owns_loader:
+            self.loader.poll()
+        self._collect_prefetched_levels()
         self.current_level.update(delta_time)
         self.altitude_hud.update(
             self.main_character, self.current_level_num, self.max_level
         )
 
+        if self._owns_events:
+            self.events.dispatch_pending()
+
     def draw(self) -> None:
-        self.current_level.draw()
-        self.altitude_hud.draw()
-        self.rescued_friends_hud.draw()
+        with frame_profiler.section("level_draw"):
+            self.current_level.draw()
+        with frame_profiler.section("hud"):
+            self.altitude_hud.draw()
+            self.rescued_friends_hud.draw()
+
+
+def _forward_error(done: Future, ready: Future) -> None:
+    # Falha ao ler o mapa no pool: a cadeia nem começa
+    if not done.cancelled() and done.exception() is not None and not ready.done():
+        ready.set_exception(done.exception())
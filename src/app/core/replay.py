@@ -0,0 +1,321 @@
+"""
+Gravação de partidas e replay determinístico.
+
+Durante a gravação, cada quadro guarda o ``dt`` passado ao ``LevelSlider`` e
+as teclas que o ``InputHandler`` consultou. A semente do ``random`` global,
+de onde saem a cor de fundo de fallback do ``Level`` e os pulos da
+``EndGameState``, vai no cabeçalho. No replay, a mesma semente e os mesmos
+quadros passam pelos mesmos ``LevelSlider.update``/``Potato.update``, então
+``Transform`` e ``Movement`` saem bit a bit iguais.
+
+Formato (little-endian)::
+
+    "ORPL" u16 versão, u64 semente, u16 nível inicial, u16 largura, u16 altura,
+    u32 quadros, e então blocos de quadros repetidos:
+    varint repetições, u8 teclas (bit 7 = dt mudou), [f64 dt]
+
+Quadros seguidos com as mesmas teclas e o mesmo dt viram um único bloco.
+Com o passo fixo (FIXED_TIMESTEP) o dt nunca muda e o arquivo fica pequeno.
+
+    python -m app.core.replay partida.orpl
+"""
+
+import argparse
+import logging
+import random
+import struct
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+from app.components.input_handler import InputHandler
+from app.core.level_slider import LevelSlider
+from app.entities.potato import Potato
+from app.pplay.window import Window
+
+MAGIC = b"ORPL"
+FORMAT_VERSION = 1
+
+KEY_LEFT = 1
+KEY_RIGHT = 2
+KEY_SPACE = 4
+KEY_UP = 8
+KEY_DOWN = 16
+KEY_F1 = 32
+DT_CHANGED = 128
+
+_HEADER = struct.Struct("<4sHQHHHI")
+
+# (x, y, vx, vy, no chão) depois de cada quadro
+TraceEntry = Tuple[float, float, float, float, bool]
+
+
+@dataclass
+class Replay:
+    seed: int
+    start_level: int = 1
+    width: int = 1920
+    height: int = 1080
+    # (dt, teclas) por quadro
+    frames: List[Tuple[float, int]] = field(default_factory=list)
+
+
+class ReplayRecorder:
+    """Acumula os quadros de uma partida; ``begin_frame`` abre cada quadro."""
+
+    def __init__(self, replay: Replay):
+        self.replay = replay
+
+    def begin_frame(self, delta_time: float) -> None:
+        self.replay.frames.append((delta_time, 0))
+
+    def mark(self, keys: int) -> None:
+        if not self.replay.frames:
+            return
+        delta_time, current = self.replay.frames[-1]
+        self.replay.frames[-1] = (delta_time, current | keys)
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            f.write(encode(self.replay))
+
+
+class RecordingInput(InputHandler):
+    """Repassa as consultas ao ``source`` e anota no quadro as teclas pressionadas."""
+
+    def __init__(self, recorder: ReplayRecorder, source: Optional[InputHandler] = None):
+        super().__init__()
+        self.recorder = recorder
+        self.source = source or InputHandler()
+
+    def get_movement_input(self) -> Tuple[bool, bool, bool]:
+        left, right, jump = self.source.get_movement_input()
+        self.recorder.mark(
+            (KEY_LEFT if left else 0)
+            | (KEY_RIGHT if right else 0)
+            | (KEY_SPACE if jump else 0)
+        )
+        return left, right, jump
+
+    def get_debug_movement_input(self) -> Tuple[bool, bool, bool, bool]:
+        left, right, up, down = self.source.get_debug_movement_input()
+        self.recorder.mark(
+            (KEY_LEFT if left else 0)
+            | (KEY_RIGHT if right else 0)
+            | (KEY_UP if up else 0)
+            | (KEY_DOWN if down else 0)
+        )
+        return left, right, up, down
+
+    def get_toggle_debug_input(self) -> bool:
+        pressed = self.source.get_toggle_debug_input()
+        self.recorder.mark(KEY_F1 if pressed else 0)
+        return pressed
+
+
+class ReplayInput(InputHandler):
+    """Responde as consultas com as teclas do quadro atual do replay."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.keys = 0
+
+    def get_movement_input(self) -> Tuple[bool, bool, bool]:
+        keys = self.keys
+        return bool(keys & KEY_LEFT), bool(keys & KEY_RIGHT), bool(keys & KEY_SPACE)
+
+    def get_debug_movement_input(self) -> Tuple[bool, bool, bool, bool]:
+        keys = self.keys
+        return (
+            bool(keys & KEY_LEFT),
+            bool(keys & KEY_RIGHT),
+            bool(keys & KEY_UP),
+            bool(keys & KEY_DOWN),
+        )
+
+    def get_toggle_debug_input(self) -> bool:
+        return bool(self.keys & KEY_F1)
+
+
+@dataclass
+class ReplayResult:
+    frames: int
+    elapsed: float
+    simulated_seconds: float
+    trace: List[TraceEntry]
+
+    @property
+    def speedup(self) -> float:
+        """Quantas vezes mais rápido que o tempo real."""
+        return self.simulated_seconds / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def snapshot(potato: Potato) -> TraceEntry:
+    return (
+        potato.transform.x,
+        potato.transform.y,
+        potato.movement.vx,
+        potato.movement.vy,
+        potato.movement.is_on_ground,
+    )
+
+
+def run_replay(
+    replay: Replay, window: Optional[Window] = None, render: bool = False
+) -> ReplayResult:
+    """
+    Reexecuta a partida. Sem ``window`` roda sem display (``NullWindow``);
+    com ``render`` desenha cada quadro, mas sem esperar pelo relógio.
+    """
+    if window is None:
+        from app.core.headless import NullWindow
+
+        window = NullWindow(replay.width, replay.height)
+
+    random.seed(replay.seed)
+    replay_input = ReplayInput()
+    slider = LevelSlider(
+        window,
+        start_level=replay.start_level,
+        prefetch=False,
+        input_handler=replay_input,
+    )
+
+    trace: List[TraceEntry] = []
+    simulated = 0.0
+    started = time.perf_counter()
+    try:
+        for delta_time, keys in replay.frames:
+            if slider.ended:
+                break
+            replay_input.keys = keys
+            slider.update(delta_time)
+            simulated += delta_time
+            trace.append(snapshot(slider.main_character))
+            if render:
+                window.set_background_color((0, 0, 0))
+                slider.draw()
+                window.update()
+    finally:
+        slider.close()
+
+    return ReplayResult(
+        frames=len(trace),
+        elapsed=time.perf_counter() - started,
+        simulated_seconds=simulated,
+        trace=trace,
+    )
+
+
+# ----------------------------------------------------------------------------
+# Codificação
+# ----------------------------------------------------------------------------
+
+
+def encode(replay: Replay) -> bytes:
+    out = bytearray(
+        _HEADER.pack(
+            MAGIC,
+            FORMAT_VERSION,
+            replay.seed,
+            replay.start_level,
+            replay.width,
+            replay.height,
+            len(replay.frames),
+        )
+    )
+
+    last_dt: Optional[float] = None
+    index = 0
+    frames = replay.frames
+    while index < len(frames):
+        delta_time, keys = frames[index]
+        run = 1
+        while index + run < len(frames) and frames[index + run] == frames[index]:
+            run += 1
+
+        _write_varint(out, run)
+        if delta_time != last_dt:
+            out.append(keys | DT_CHANGED)
+            out += struct.pack("<d", delta_time)
+            last_dt = delta_time
+        else:
+            out.append(keys)
+        index += run
+
+    return bytes(out)
+
+
+def decode(data: bytes) -> Replay:
+    magic, version, seed, start_level, width, height, frame_count = _HEADER.unpack_from(
+        data, 0
+    )
+    if magic != MAGIC:
+        raise ValueError("not a replay file")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported replay version {version}")
+
+    frames: List[Tuple[float, int]] = []
+    offset = _HEADER.size
+    delta_time = 0.0
+    while len(frames) < frame_count:
+        run, offset = _read_varint(data, offset)
+        keys = data[offset]
+        offset += 1
+        if keys & DT_CHANGED:
+            (delta_time,) = struct.unpack_from("<d", data, offset)
+            offset += 8
+            keys &= ~DT_CHANGED
+        frames.extend([(delta_time, keys)] * run)
+
+    if len(frames) != frame_count:
+        raise ValueError("corrupt replay file")
+    return Replay(seed, start_level, width, height, frames)
+
+
+def load_replay(path: str) -> Replay:
+    with open(path, "rb") as f:
+        return decode(f.read())
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Reexecuta uma partida gravada")
+    parser.add_argument("path")
+    parser.add_argument("--render", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    replay = load_replay(args.path)
+    window = Window(replay.width, replay.height) if args.render else None
+    result = run_replay(replay, window, render=args.render)
+
+    print(
+        f"{result.frames} frames, {result.simulated_seconds:.1f}s simulated in "
+        f"{result.elapsed:.2f}s ({result.speedup:.0f}x real time)"
+    )
+    if result.trace:
+        x, y, vx, vy, on_ground = result.trace[-1]
+        print(f"final: x={x!r} y={y!r} vx={vx!r} vy={vy!r} on_ground={on_ground}")
+
+
+if __name__ == "__main__":
+    main()
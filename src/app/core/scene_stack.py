@@ -0,0 +1,106 @@
+import logging
+from typing import List, Optional
+import pygame
+from app.pplay.window import Window
+
+logger = logging.getLogger(__name__)
+
+# Escurecimento atrás das cenas modais: equivale ao overlay preto com alpha 180
+DIM_FACTOR = (75, 75, 75)
+
+
+class Scene:
+    """Tela do jogo (menu, partida, pausa...) empilhada na ``SceneStack``."""
+
+    # Cenas modais são desenhadas sobre um retrato congelado da cena de baixo
+    modal = False
+    # Cenas quase estáticas informam o que mudaram com ``window.mark_dirty``
+    # e só essas regiões são apresentadas
+    uses_dirty_rects = False
+
+    def update(self, delta_time: float) -> None:
+        pass
+
+    def draw(self) -> None:
+        pass
+
+
+class SceneStack:
+    """
+    Pilha de cenas: só a do topo é atualizada e desenhada.
+
+    Ao empilhar uma cena modal, a cena de baixo é desenhada uma única vez e
+    copiada, já escurecida, para um fundo congelado. Enquanto a modal estiver
+    aberta, cada quadro é um blit desse fundo mais o que a modal desenha. Uma
+    modal sobre outra reaproveita o fundo da de baixo.
+
+    A cada troca do topo a janela entra ou sai do modo de dirty rects conforme
+    a nova cena, e o quadro seguinte é apresentado inteiro.
+    """
+
+    def __init__(self, window: Window):
+        self.window = window
+        self._scenes: List[Scene] = []
+        self._backgrounds: List[Optional[pygame.Surface]] = []
+
+    @property
+    def top(self) -> Optional[Scene]:
+        return self._scenes[-1] if self._scenes else None
+
+    def __len__(self) -> int:
+        return len(self._scenes)
+
+    def __contains__(self, scene: Scene) -> bool:
+        return scene in self._scenes
+
+    def push(self, scene: Scene) -> None:
+        background = None
+        if scene.modal and self._scenes:
+            background = self._capture_background()
+        self._scenes.append(scene)
+        self._backgrounds.append(background)
+        self._top_changed()
+        logger.debug(f"Pushed {type(scene).__name__} ({len(self)} scenes)")
+
+    def pop(self) -> Scene:
+        self._backgrounds.pop()
+        scene = self._scenes.pop()
+        self._top_changed()
+        logger.debug(f"Popped {type(scene).__name__} ({len(self)} scenes)")
+        return scene
+
+    def replace(self, scene: Scene) -> None:
+        """Esvazia a pilha e deixa só ``scene``."""
+        self._scenes.clear()
+        self._backgrounds.clear()
+        self.push(scene)
+
+    def update(self, delta_time: float) -> None:
+        if self._scenes:
+            self._scenes[-1].update(delta_time)
+
+    def draw(self) -> None:
+        if not self._scenes:
+            return
+
+        background = self._backgrounds[-1]
+        if background is not None:
+            self.window.get_screen().blit(background, (0, 0))
+        self._scenes[-1].draw()
+
+    def _top_changed(self) -> None:
+        top = self.top
+        self.window.set_dirty_rects(top is not None and top.uses_dirty_rects)
+
+    def _capture_background(self) -> Optional[pygame.Surface]:
+        screen = self.window.get_screen()
+        if screen is None:
+            return None
+
+        if self._backgrounds[-1] is not None:
+            return self._backgrounds[-1]
+
+        self._scenes[-1].draw()
+        background = screen.copy()
+        background.fill(DIM_FACTOR, special_flags=pygame.BLEND_MULT)
+        return background
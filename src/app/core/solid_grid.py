@@ -0,0 +1,85 @@
+import numpy as np
+import pygame
+
+DEFAULT_CELL_SIZE = 64
+
+
+class SolidGrid:
+    """
+    Máscara das células sólidas da camada de colisão (INTERACTIVE_BLOCK).
+
+    Um byte por célula do mapa, no lugar de um ``Tile`` (e de uma entrada no
+    ``TileGrid``) por bloco. A colisão de um corpo olha só as células que o
+    rect dele cobre, então o custo não depende do tamanho do mapa.
+
+    Os índices são os das células em ordem de linha, a mesma em que o mapa
+    lista os tiles: ``first_collision`` resolve na ordem da varredura linear
+    original.
+    """
+
+    def __init__(
+        self,
+        columns: int,
+        rows: int,
+        cell_width: int = DEFAULT_CELL_SIZE,
+        cell_height: int = DEFAULT_CELL_SIZE,
+    ):
+        self.columns = columns
+        self.rows = rows
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        # Um byte por célula, em ordem de linha; ``mask`` é a mesma memória
+        # vista como array 2D (linha, coluna). A busca usa bytearray.find,
+        # que varre um trecho de linha em C
+        self._cells = bytearray(columns * rows)
+        self.mask = np.frombuffer(self._cells, dtype=bool).reshape(rows, columns)
+
+    def set_solid(self, column: int, row: int, solid: bool = True) -> None:
+        self.mask[row, column] = solid
+
+    def rect(self, index: int) -> pygame.Rect:
+        row, column = divmod(index, self.columns)
+        return pygame.Rect(
+            column * self.cell_width,
+            row * self.cell_height,
+            self.cell_width,
+            self.cell_height,
+        )
+
+    def first_collision(self, rect: pygame.Rect, after: int = -1) -> int:
+        """Primeira célula sólida depois de ``after`` que colide com ``rect``, ou -1."""
+        left, top, width, height = rect
+        # Rects vazios não colidem com nada (como em colliderect)
+        if width <= 0 or height <= 0:
+            return -1
+        first_column = left // self.cell_width
+        last_column = (left + width - 1) // self.cell_width
+        first_row = top // self.cell_height
+        last_row = (top + height - 1) // self.cell_height
+        # Fora do mapa não há células sólidas
+        if first_column < 0:
+            first_column = 0
+        if last_column >= self.columns:
+            last_column = self.columns - 1
+        if first_row < 0:
+            first_row = 0
+        if last_row >= self.rows:
+            last_row = self.rows - 1
+        # Rect inteiro fora do mapa (um fim negativo no find contaria do final)
+        if first_column > last_column or first_row > last_row:
+            return -1
+
+        cells = self._cells
+        columns = self.columns
+        for row in range(first_row, last_row + 1):
+            start = row * columns
+            index = cells.find(
+                1, max(start + first_column, after + 1), start + last_column + 1
+            )
+            if index >= 0:
+                return index
+        return -1
+
+    def __len__(self) -> int:
+        """Quantidade de células sólidas."""
+        return int(np.count_nonzero(self.mask))
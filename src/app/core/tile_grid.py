@@ -0,0 +1,58 @@
+from typing import Dict, Iterator, List, Tuple
+import pygame
+from app.entities.tile import Tile
+
+DEFAULT_CELL_SIZE = 64
+
+
+class TileGrid:
+    """
+    Índice espacial uniforme de uma lista de tiles de colisão.
+
+    Cada tile é registrado em todas as células que o seu rect cobre, e
+    ``candidates`` devolve os índices (na ordem original da lista) dos tiles
+    que podem tocar um rect, sem varrer o mapa inteiro. Os níveis usam o
+    ``SolidGrid``; este índice atende listas soltas de tiles, de qualquer
+    tamanho e posição.
+    """
+
+    def __init__(self, tiles: List[Tile], cell_size: int = DEFAULT_CELL_SIZE):
+        self.tiles = tiles
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+
+        for index, tile in enumerate(tiles):
+            for cell in self._cells_for(tile.rect):
+                self._cells.setdefault(cell, []).append(index)
+
+    def _cells_for(self, rect: pygame.Rect) -> Iterator[Tuple[int, int]]:
+        size = self.cell_size
+        first_x, last_x = rect.left // size, max(rect.right - 1, rect.left) // size
+        first_y, last_y = rect.top // size, max(rect.bottom - 1, rect.top) // size
+        for cell_y in range(first_y, last_y + 1):
+            for cell_x in range(first_x, last_x + 1):
+                yield cell_x, cell_y
+
+    def candidates(self, rect: pygame.Rect) -> List[int]:
+        found = set()
+        for cell in self._cells_for(rect):
+            indices = self._cells.get(cell)
+            if indices:
+                found.update(indices)
+        return sorted(found)
+
+    def rect(self, index: int) -> pygame.Rect:
+        return self.tiles[index].rect
+
+    def first_collision(self, rect: pygame.Rect, after: int = -1) -> int:
+        """Índice do primeiro tile depois de ``after`` que colide com ``rect``, ou -1."""
+        for index in self.candidates(rect):
+            if index > after and rect.colliderect(self.tiles[index].rect):
+                return index
+        return -1
+
+    def __iter__(self) -> Iterator[Tile]:
+        return iter(self.tiles)
+
+    def __len__(self) -> int:
+        return len(self.tiles)
@@ -0,0 +1,60 @@
+from typing import Iterator, Optional, Sequence, Tuple
+import numpy as np
+import pygame
+
+
+class TileLayer:
+    """
+    Camada de tiles sem sprites: o gid de cada célula e as superfícies dos
+    tiles, as mesmas do cache de tilesets.
+
+    Usada nas camadas interactive-block, que só aparecem na composição
+    estática do nível (a colisão é da ``SolidGrid``): no lugar de um ``Tile``
+    por bloco, um inteiro por célula. ``draw`` desenha como ``Group.draw``,
+    na ordem de linha em que o mapa lista os tiles.
+    """
+
+    def __init__(
+        self,
+        gids: np.ndarray,
+        images: Sequence[Optional[pygame.Surface]],
+        columns: int,
+        rows: int,
+        cell_width: int,
+        cell_height: int,
+    ):
+        self.columns = columns
+        self.rows = rows
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.images = images
+        self.gids = np.asarray(gids).reshape(rows, columns)
+        has_image = np.array([image is not None for image in images], dtype=bool)
+        # Células com tile: as sólidas da camada
+        self.mask = has_image[self.gids]
+
+        # A SolidGrid trata cada tile como uma célula inteira: um tile de outro
+        # tamanho colidiria numa área diferente da desenhada
+        for gid in np.unique(self.gids[self.mask]):
+            size = images[gid].get_size()
+            if size != (cell_width, cell_height):
+                raise ValueError(
+                    f"Tile {gid} is {size[0]}x{size[1]}, "
+                    f"map cells are {cell_width}x{cell_height}"
+                )
+
+    def tiles(self) -> Iterator[Tuple[pygame.Rect, pygame.Surface]]:
+        """Rect e imagem de cada tile, em ordem de linha."""
+        for row, column in zip(*np.nonzero(self.mask)):
+            yield pygame.Rect(
+                column * self.cell_width,
+                row * self.cell_height,
+                self.cell_width,
+                self.cell_height,
+            ), self.images[self.gids[row, column]]
+
+    def draw(self, surface: pygame.Surface) -> None:
+        surface.blits([(image, rect) for rect, image in self.tiles()], doreturn=False)
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.mask))
@@ -30,12 +30,14 @@ class BackgroundTile(Sprite):
         if window.screen is None:
             raise NotImplementedError("Window is None or not initialized")
 
+        self.draw_on(window.screen, window.width)
+
+    def draw_on(self, surface: Surface, width: int) -> None:
         image_width = self.image.get_width()
-        window_width: int = window.width
 
         # Draw tiled background across the screen width
-        for x in range(0, window_width, image_width):
-            window.screen.blit(self.image, (x, 0))
+        for x in range(0, width, image_width):
+            surface.blit(self.image, (x, 0))
 
         # Draw red debug rectangle around background tile
-        pygame.draw.rect(window.screen, (255, 0, 0), self.transform.rect, 2)
+        pygame.draw.rect(surface, (255, 0, 0), self.transform.rect, 2)
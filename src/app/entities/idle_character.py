@@ -12,6 +12,11 @@ class IdleCharacter(pygame.sprite.Sprite):
 
         self.animation_component.set_facing_direction(not flipped)
 
+    def kill(self) -> None:
+        # Resgatado ou nível descartado: os frames voltam para o cache
+        super().kill()
+        self.animation_component.release()
+
     def update(self, delta_time: float):
         self.animation_component.update(delta_time)
         self.image = self.animation_component.get_current_frame()
@@ -1,4 +1,5 @@
 import random
+import pygame
 from app.pplay.sprite import Sprite
 from app.components.movement import Movement
 from app.components.transform import Transform
@@ -13,6 +14,15 @@ class JumpingCharacter:
         )  # Apenas movimento vertical por gravidade
         self.movement.vy = -random.randint(400, 700)  # Impulso inicial
 
+    @property
+    def rect(self) -> pygame.Rect:
+        return pygame.Rect(
+            self.transform.x, self.transform.y, self.sprite.width, self.sprite.height
+        )
+
+    def release(self) -> None:
+        self.sprite.release()
+
     def update(self, delta_time: float):
         self.movement.apply_gravity(delta_time)
         self.transform.y += self.movement.vy * delta_time
@@ -1,5 +1,3 @@
-from app.core.observer import Observable
-from app.entities.tile import Tile
 from app.pplay.window import Window
 from app.core.animation_state import AnimationState
 from app.components.movement import Movement
@@ -7,18 +5,27 @@ from app.components.animation_component import AnimationComponent
 from app.components.input_handler import InputHandler
 from app.components.transform import Transform
 from app.components.render import Render
-from app.core.collision_system import CollisionHandler
-from typing import List
+from app.core.collision_system import CollisionHandler, CollisionTiles
+from app.core.frame_profiler import frame_profiler
+from app.core.event_bus import EventBus
+from app.core.events import BoundaryHit, CharacterRescued
+from typing import Optional
 import logging
 from pygame.sprite import spritecollide
 import pygame
 from app.entities.idle_character import IdleCharacter
 
 
-class Potato(Observable):
-    def __init__(self, x: float, y: float):
+class Potato:
+    def __init__(
+        self,
+        x: float,
+        y: float,
+        input_handler: Optional[InputHandler] = None,
+        events: Optional[EventBus] = None,
+    ):
         self.logger = logging.getLogger(__name__)
-        Observable.__init__(self)
+        self.events = events or EventBus()
 
         # Inicializa componentes
         self.animation_component = AnimationComponent("potato")
@@ -28,7 +35,7 @@ class Potato(Observable):
 
         self.transform = Transform(x, y, width, height)
         self.movement = Movement(speed=500.0, gravity=2000.0, jump_velocity=-800.0)
-        self.input_handler = InputHandler()
+        self.input_handler = input_handler or InputHandler()
         self.renderer = Render(self.animation_component)
         self.collision_handler = CollisionHandler()
 
@@ -145,14 +152,14 @@ class Potato(Observable):
         collided_friends = spritecollide(self, idle_characters, True)
         for friend in collided_friends:
             if isinstance(friend, IdleCharacter):
-                self.notify_observers(
-                    f"rescued_{friend.animation_component.character_name}"
+                self.events.post(
+                    CharacterRescued(friend.animation_component.character_name)
                 )
 
     def update(
         self,
         delta_time: float,
-        tiles: List[Tile],
+        tiles: CollisionTiles,
         window_width: int,
         window_height: int,
         idle_characters: pygame.sprite.Group,
@@ -172,14 +179,16 @@ class Potato(Observable):
         else:
             was_on_ground = self.movement.is_on_ground
 
-            self.handle_input_and_movement(delta_time)
+            with frame_profiler.section("input"):
+                self.handle_input_and_movement(delta_time)
 
             # faz o quique com a mesma velocidade horizontal antes de colidir com a parede
             vx_before_collision = self.movement.vx
 
-            self.collision_handler.handle_collisions(
-                self.transform, self.movement, tiles, delta_time
-            )
+            with frame_profiler.section("collision"):
+                self.collision_handler.handle_collisions(
+                    self.transform, self.movement, tiles, delta_time
+                )
 
             if (
                 not self.movement.is_on_ground
@@ -192,9 +201,10 @@ class Potato(Observable):
                     not self.facing_right
                 )  # espelha o personagem pra mostrar que ta indo pro outro lado
 
-            self.movement.is_on_ground = self.collision_handler.check_on_ground(
-                self.transform, tiles
-            )
+            with frame_profiler.section("collision"):
+                self.movement.is_on_ground = self.collision_handler.check_on_ground(
+                    self.transform, tiles
+                )
 
             # reseta os controles travados de quando estava no ar se o personagem pousou
             if not was_on_ground and self.movement.is_on_ground:
@@ -205,14 +215,18 @@ class Potato(Observable):
 
         self.check_friend_collision(idle_characters)
 
-        boundary_hit = self.collision_handler.check_bounds(
-            self.transform, self.movement, window_width, window_height
-        )
+        with frame_profiler.section("collision"):
+            boundary_hit = self.collision_handler.check_bounds(
+                self.transform, self.movement, window_width, window_height
+            )
 
         if boundary_hit:
-            self.notify_observers(boundary_hit)
+            self.events.post(BoundaryHit(boundary_hit))
 
         self.renderer.update(delta_time)
 
+    def release(self) -> None:
+        self.animation_component.release()
+
     def draw(self, window: Window) -> None:
         self.renderer.draw(window, self.transform)
@@ -1,30 +1,48 @@
-from app.config.log_config import setup_logging
-from app.config.config import Config
-from app.pplay.window import Window
-from app.core.game import Game
-from app.seedwork.path_helper import asset_path
-import logging
+# Medir o startup exige instalar o relatório antes de qualquer outro import
+from app.seedwork.startup import import_pygame, init_pygame, startup_report
+
+startup_report.install_if_enabled()
+
+with startup_report.phase("imports"):
+    import_pygame()
+
+    from app.config.log_config import setup_logging
+    from app.config.config import Config
+    from app.pplay.window import Window
+    from app.core.game import Game
+    from app.seedwork.audio_manager import audio_manager
+    from app.seedwork.path_helper import asset_path
+    import logging
 
 
 def main() -> None:
-    setup_logging()
+    with startup_report.phase("setup_logging"):
+        setup_logging()
     logger = logging.getLogger(__name__)
 
-    config = Config.load()
+    with startup_report.phase("config"):
+        config = Config.load()
     logger.info(f"Configuration loaded: {config}")
 
-    window = Window(
-        width=config.WINDOW_WIDTH,
-        height=config.WINDOW_HEIGHT,
-    )
-    window.set_title(config.WINDOW_TITLE)
-    try:
-        icon_path = asset_path("images", "hud", "potato_icon.png")
-        window.set_icon(icon_path)
-    except FileNotFoundError as e:
-        logger.warning(f"Could not set window icon: {e}")
-
-    game = Game(window)
+    with startup_report.phase("pygame_init"):
+        audio_manager.configure(config.AUDIO_FREQUENCY, config.AUDIO_BUFFER)
+        init_pygame()
+    with startup_report.phase("window"):
+        window = Window(
+            width=config.WINDOW_WIDTH,
+            height=config.WINDOW_HEIGHT,
+            vsync=config.VSYNC,
+        )
+        window.set_title(config.WINDOW_TITLE)
+        try:
+            icon_path = asset_path("images", "hud", "potato_icon.png")
+            window.set_icon(icon_path)
+        except FileNotFoundError as e:
+            logger.warning(f"Could not set window icon: {e}")
+
+    with startup_report.phase("game_init"):
+        game = Game(window, config)
+    # O relatório é gravado no primeiro quadro apresentado
     game.run()
 
 
@@ -5,9 +5,6 @@ from . import window
 from . import gameimage
 from pygame.locals import *
 
-# Initializes pygame's modules
-pygame.init()
-
 """An Animation class for frame-control."""
 
 
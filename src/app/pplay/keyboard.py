@@ -1,9 +1,6 @@
 import pygame
 from pygame.locals import *
 
-# Initializes pygame's modules
-pygame.init()
-
 
 class Keyboard:
     """
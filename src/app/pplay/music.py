@@ -0,0 +1,112 @@
+import io
+import logging
+import os
+import pygame
+import pygame.mixer
+from app.seedwork.audio_manager import audio_manager
+
+"""Music toca trilhas longas por streaming, com a mesma API de Sound"""
+
+
+class Music:
+    """
+    Trilha tocada com pygame.mixer.music: o arquivo é decodificado aos poucos
+    durante a reprodução, em vez de virar PCM inteiro na memória como em
+    Sound. Efeitos curtos devem continuar usando Sound.
+
+    O pygame tem um único stream de música, então só uma Music toca por vez;
+    tocar outra substitui a atual. Volume e repetição de uma Music que não
+    está tocando ficam guardados e são aplicados no próximo play.
+
+    O volume final é o da trilha vezes o do barramento "music" do
+    audio_manager; por isso o padrão aqui é 100, e o volume do jogo é
+    ajustado no barramento, não em cada trilha.
+    """
+
+    # Music dona do stream global neste momento
+    _current = None
+
+    def __init__(self, music_file):
+        self.loop = False
+        self.music_file = music_file
+        self.volume = 100
+        self._paused = False
+        # Bytes do arquivo já lidos (AssetLoader): tocar não toca no disco
+        self._data = None
+
+    def preload(self, data):
+        self._data = data
+
+    def _source(self):
+        if self._data is None:
+            return (self.music_file,)
+        extension = os.path.splitext(self.music_file)[1].lstrip(".")
+        return (io.BytesIO(self._data), extension)
+
+    def _owns_stream(self):
+        return Music._current is self
+
+    """Value deve ser um valor entre 0 e 100"""
+
+    def set_volume(self, value):
+        if value >= 100:
+            value = 100
+        if value <= 0:
+            value = 0
+
+        self.volume = value
+        if self._owns_stream():
+            audio_manager.set_stream_volume(value)
+
+    def increase_volume(self, value):
+        self.set_volume(self.volume + value)
+
+    def decrease_volume(self, value):
+        self.set_volume(self.volume - value)
+
+    def is_playing(self):
+        return self._owns_stream() and pygame.mixer.music.get_busy()
+
+    def pause(self):
+        if self._owns_stream():
+            pygame.mixer.music.pause()
+            self._paused = True
+
+    def unpause(self):
+        if self._owns_stream() and self._paused:
+            pygame.mixer.music.unpause()
+            self._paused = False
+
+    def play(self):
+        # Tocar uma trilha pausada retoma de onde parou, sem reabrir o arquivo
+        if self._owns_stream() and self._paused:
+            self.unpause()
+            return
+
+        if not self.music_file:
+            return
+        try:
+            pygame.mixer.music.load(*self._source())
+        except pygame.error as e:
+            logging.getLogger(__name__).warning(
+                f"Could not play {self.music_file}: {e}"
+            )
+            return
+        audio_manager.set_stream_volume(self.volume)
+        pygame.mixer.music.play(-1 if self.loop else 0)
+        Music._current = self
+        self._paused = False
+
+    def stop(self):
+        if self._owns_stream():
+            pygame.mixer.music.stop()
+            pygame.mixer.music.unload()
+            Music._current = None
+            self._paused = False
+
+    def set_repeat(self, repeat):
+        self.loop = repeat
+
+    def fadeout(self, time_ms):
+        if self._owns_stream():
+            pygame.mixer.music.fadeout(time_ms)
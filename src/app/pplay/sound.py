@@ -1,68 +1,85 @@
-import pygame
-import pygame.mixer
-
-# Initizalizes pygame's modules
-pygame.init()
-"""Sound é uma classe de controle dos sons do jogo - efeitos, música"""
-
-
-class Sound:
-    """ATENÇÃO! O arquivo passado deve ser .OGG!!! Se não pode gerar problemas."""
-
-    def __init__(self, sound_file):
-        self.loop = False
-        self.sound_file = sound_file
-        self.volume = 50
-        self.sound = self.load(sound_file)
-        self.set_volume(self.volume)
-
-        # To reduce audio delay
-        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
-
-    def load(self, sound_file):
-        if pygame.mixer:
-            return pygame.mixer.Sound(sound_file)
-
-    """Value deve ser um valor entre 0 e 100"""
-
-    def set_volume(self, value):
-        if value >= 100:
-            value = 100
-        if value <= 0:
-            value = 0
-
-        self.volume = value
-        self.sound.set_volume(value / 100)
-
-    def increase_volume(self, value):
-        self.set_volume(self.volume + value)
-
-    def decrease_volume(self, value):
-        self.set_volume(self.volume - value)
-
-    def is_playing(self):
-        if pygame.mixer.get_busy():
-            return True
-        else:
-            return False
-
-    def pause(self):
-        pygame.mixer.pause()
-
-    def unpause(self):
-        pygame.mixer.unpause()
-
-    def play(self):
-        if self.loop:
-            self.sound.play(-1)
-        else:
-            self.sound.play()
-
-    def stop(self):
-        self.sound.stop()
-
-    def set_repeat(self, repeat):
-        self.loop = repeat
-
-    def fadeout(self, time_ms):
-        self.sound.fadeout(time)
+import pygame
+import pygame.mixer
+from app.seedwork.asset_cache import asset_cache
+from app.seedwork.audio_manager import SFX_BUS, audio_manager
+
+"""Sound é uma classe de controle dos sons do jogo - efeitos, música"""
+
+
+class Sound:
+    """ATENÇÃO! O arquivo passado deve ser .OGG!!! Se não pode gerar problemas.
+
+    Toca num canal do barramento ``bus`` do audio_manager (sfx, ui): o volume
+    final é o do som vezes o do barramento. Os controles (is_playing, pause,
+    stop...) agem só no canal deste som, não no mixer inteiro.
+    """
+
+    def __init__(self, sound_file, bus=SFX_BUS):
+        self.loop = False
+        self.sound_file = sound_file
+        self.bus = bus
+        self.volume = 50
+        # Canal da última vez que tocou
+        self.channel = None
+        self.sound = self.load(sound_file)
+        self.set_volume(self.volume)
+
+    def load(self, sound_file):
+        if audio_manager.init():
+            return asset_cache.sound(sound_file)
+
+    """Value deve ser um valor entre 0 e 100"""
+
+    def set_volume(self, value):
+        if value >= 100:
+            value = 100
+        if value <= 0:
+            value = 0
+
+        # O pygame.mixer.Sound é compartilhado pelo cache: o volume vai no canal
+        self.volume = value
+        if self._owns_channel():
+            audio_manager.set_voice_volume(self.channel, value)
+
+    def increase_volume(self, value):
+        self.set_volume(self.volume + value)
+
+    def decrease_volume(self, value):
+        self.set_volume(self.volume - value)
+
+    def _owns_channel(self):
+        # O canal pode ter sido roubado por outro som do barramento
+        return (
+            self.channel is not None
+            and self.channel.get_sound() is self.sound
+            and self.channel.get_busy()
+        )
+
+    def is_playing(self):
+        return self._owns_channel()
+
+    def pause(self):
+        if self._owns_channel():
+            self.channel.pause()
+
+    def unpause(self):
+        if self._owns_channel():
+            self.channel.unpause()
+
+    def play(self):
+        if self.sound is None:
+            return
+        self.channel = audio_manager.play(
+            self.sound, self.bus, -1 if self.loop else 0, self.volume
+        )
+
+    def stop(self):
+        if self._owns_channel():
+            self.channel.stop()
+
+    def set_repeat(self, repeat):
+        self.loop = repeat
+
+    def fadeout(self, time_ms):
+        if self._owns_channel():
+            self.channel.fadeout(time_ms)
@@ -4,9 +4,6 @@ from . import window
 from . import animation
 from pygame.locals import *
 
-# Initializes pygame's modules
-pygame.init()
-
 """Sprite é uma animação que pode ser movida por input, é o "ator" do jogo"""
 
 
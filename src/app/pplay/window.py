@@ -1,12 +1,12 @@
 # Pygame and system modules
 import sys
+import time
 import pygame
 from pygame.locals import *
 from . import keyboard
 from . import mouse
-
-# Initializes pygame's modules
-pygame.init()
+from app.seedwork.startup import init_pygame
+from app.seedwork.text_cache import text_cache
 
 """A simple Window class, it's the primary Surface(from pygame).
 All the other game's renderable objects will be drawn on it. """
@@ -18,7 +18,10 @@ class Window:
 
     """Initialize a Window (width x height)"""
 
-    def __init__(self, width, height):
+    def __init__(self, width, height, vsync=False):
+        # Display, font and mixer, once and in this order (no-op afterwards)
+        init_pygame()
+
         # Input controllers
         Window.keyboard = keyboard.Keyboard()
         Window.mouse = mouse.Mouse()
@@ -34,16 +37,36 @@ class Window:
         self.title = "Title"
 
         # Time Control
-        self.curr_time = 0  # current frame time
+        # perf_counter gives sub-millisecond precision, get_ticks() does not
+        self._clock_start = time.perf_counter()
+        self.curr_time = 0  # current frame time (ms, float)
         self.last_time = 0  # last frame time
         self.total_time = 0  # += curr-last(delta_time), update()
 
+        # Dirty-rect mode (off by default): only the regions reported with
+        # mark_dirty() are presented; invalidate() forces a full update
+        self.dirty_rects_enabled = False
+        self._dirty_rects = []
+        self._full_update = True
+
         # Creates the screen (pygame.Surface)
         # There are some useful flags (look pygame's docs)
         # It's like a static attribute in Java
-        Window.screen = pygame.display.set_mode(
-            [self.width, self.height], pygame.FULLSCREEN | pygame.SCALED
-        )
+        self.vsync = False
+        flags = pygame.FULLSCREEN | pygame.SCALED
+        if vsync:
+            try:
+                Window.screen = pygame.display.set_mode(
+                    [self.width, self.height], flags, vsync=1
+                )
+                self.vsync = True
+            except pygame.error:
+                # Driver without vsync support: fall back to a regular display
+                Window.screen = pygame.display.set_mode(
+                    [self.width, self.height], flags
+                )
+        else:
+            Window.screen = pygame.display.set_mode([self.width, self.height], flags)
         # ? Why is it possible to do w.screen?
 
         # Sets pattern starting conditions
@@ -84,19 +107,52 @@ class Window:
     """Refreshes the Window - makes changes visible, AND updates the Time"""
 
     def update(self):
-        pygame.display.update()  # refresh
+        self._present()
 
         for event in pygame.event.get():  # necessary to not get errors
             if event.type == QUIT:
                 self.close()
         self.last_time = self.curr_time  # set last frame time
-        self.curr_time = pygame.time.get_ticks()  # since pygame.init()
+        self.curr_time = self.now()  # since the Window was created
         self.total_time += self.curr_time - self.last_time  # == curr_time
         # curr_time should be the REAL current time, but in Python
         # the method returns the time in seconds.
         # And we DO WANT MILLIseconds :P
         # While REAL time is not necessary, yet..
 
+    """Presents the frame - the whole screen or only the dirty rects"""
+
+    def _present(self):
+        if not self.dirty_rects_enabled or self._full_update:
+            pygame.display.update()  # refresh
+        elif self._dirty_rects:
+            pygame.display.update(self._dirty_rects)
+        elif self.vsync:
+            # Nothing changed, but with vsync the flip paces the game loop
+            pygame.display.update()
+        self._dirty_rects.clear()
+        self._full_update = False
+
+    """
+    Turns the dirty-rect mode on or off. Either way the next update
+    presents the whole screen
+    """
+
+    def set_dirty_rects(self, enabled):
+        self.dirty_rects_enabled = enabled
+        self.invalidate()
+
+    """Reports a region (Rect or x, y, w, h) changed since the last update"""
+
+    def mark_dirty(self, rect):
+        if self.dirty_rects_enabled and not self._full_update:
+            self._dirty_rects.append(pygame.Rect(rect))
+
+    """Makes the next update present the whole screen"""
+
+    def invalidate(self):
+        self._full_update = True
+
     """Paints the screen - White - and update"""
 
     def clear(self):
@@ -159,6 +215,11 @@ class Window:
     def delay(self, time_ms):
         pygame.time.delay(time_ms)
 
+    """Returns the high-resolution time since the Window was created - ms"""
+
+    def now(self):
+        return (time.perf_counter() - self._clock_start) * 1000.0
+
     """
     Returns the time passed between
     the last and the current frame - SECONDS
@@ -192,13 +253,9 @@ class Window:
         bold=False,
         italic=False,
     ):
-        # Creates a Font from the system fonts
-        # SysFont(name, size, bold=False, italic=False) -> Font
-        font = pygame.font.SysFont(font_name, size, bold, italic)
-
-        # Creates a pygame.Surface with the text rendered on it
-        # render(text, antialias, color, background=None)->Surface
-        font_surface = font.render(text, True, color)
+        # Fonts are resolved once by the registry and rendered text is
+        # kept in an LRU cache, so a steady HUD does no rasterization
+        font_surface = text_cache.render(text, font_name, size, color, bold, italic)
         # That's because pygame does NOT provide a way
         # to directly draw text on an existing Surface.
         # So you must use Font.render() -> Surface and BLIT
@@ -0,0 +1,414 @@
+"""
+Bake offline dos assets.
+
+Pré-calcula o que o jogo derivaria dos assets em tempo de execução e grava o
+resultado em ``get_baked_dir()``:
+
+- frames dos personagens na escala do ``AnimationComponent``;
+- ícones do HUD em 48x48, coloridos e em tons de cinza;
+- imagens grandes (fundos dos mapas e das telas) re-encodadas em BMP, que o
+  SDL lê sem descomprimir PNG;
+- músicas re-encodadas em OGG Vorbis (precisa do ``ffmpeg`` no PATH).
+
+Com ``--pack`` também gera o pacote único (``asset_pack``): todas as imagens
+já decodificadas, as variantes acima e os mapas compilados.
+
+Cada origem entra no manifest com o SHA-256 do conteúdo: o bake seguinte só
+refaz o que mudou. No jogo, ``asset_path`` e o ``AssetCache`` usam as saídas
+quando existem e o original não mudou desde o bake.
+
+    cd src && python -m app.seedwork.asset_bake            # incremental
+    cd src && python -m app.seedwork.asset_bake --force    # refaz tudo
+    cd src && python -m app.seedwork.asset_bake --pack     # + assets.opak
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import pygame
+from app.seedwork.asset_cache import AssetCache, image_variant
+from app.seedwork.asset_pack import AssetPackWriter, pack_key
+from app.seedwork.compiled_tilemap import PACK_VARIANT, compile_tmx, compiled_bytes
+from app.seedwork.path_helper import (
+    ASSET_PACK_NAME,
+    BAKE_MANIFEST,
+    get_assets_dir,
+    get_baked_dir,
+    clear_bake_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+# Muda quando o formato das saídas muda: invalida todos os hashes
+BAKE_VERSION = 1
+
+# Abaixo disso o PNG decodifica rápido o bastante e só ocuparia mais disco
+LARGE_IMAGE_BYTES = 256 * 1024
+
+IMAGE_FORMAT = ".bmp"
+AUDIO_FORMAT = ".ogg"
+
+# (scale, size, grayscale), os mesmos parâmetros de ``AssetCache.image``
+Variant = Tuple[Optional[float], Optional[Tuple[int, int]], bool]
+
+
+@dataclass(frozen=True)
+class BakeJob:
+    # Relativo à pasta de assets, sempre com "/"
+    source: str
+    # Grava o próprio arquivo re-encodado (variante "")
+    reencode: bool = False
+    variants: Tuple[Variant, ...] = ()
+
+    @property
+    def is_audio(self) -> bool:
+        return self.source.endswith(".mp3")
+
+    def outputs(self) -> Dict[str, str]:
+        """Variante -> caminho da saída, relativo à pasta do bake."""
+        stem = self.source.rsplit(".", 1)[0]
+        if self.is_audio:
+            return {"": stem + AUDIO_FORMAT}
+
+        outputs = {"": stem + IMAGE_FORMAT} if self.reencode else {}
+        for variant in self.variants:
+            name = image_variant(*variant)
+            outputs[name] = f"{stem}@{name}{IMAGE_FORMAT}"
+        return outputs
+
+
+@dataclass
+class BakeReport:
+    baked: List[str] = field(default_factory=list)
+    up_to_date: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+
+
+def collect_jobs(assets_dir: Optional[Path] = None) -> List[BakeJob]:
+    """Lista o que o jogo deriva dos assets hoje."""
+    from app.components.animation_component import ANIMATION_MAP, DEFAULT_SCALE
+    from app.ui.rescued_friends_hud import ICON_FILES, ICON_SIZE
+
+    assets_dir = assets_dir or get_assets_dir()
+    variants: Dict[str, List[Variant]] = {}
+
+    for character, states in ANIMATION_MAP.items():
+        for folder, frame_count in states.values():
+            for i in range(1, frame_count + 1):
+                source = f"images/characters/{character}/{folder}/{i}.png"
+                variants.setdefault(source, []).append((DEFAULT_SCALE, None, False))
+
+    for filename in ICON_FILES.values():
+        source = f"images/hud/{filename}"
+        variants.setdefault(source, []).extend(
+            [(None, ICON_SIZE, False), (None, ICON_SIZE, True)]
+        )
+
+    large_images = {
+        path.relative_to(assets_dir).as_posix()
+        for folder in ("images", "tilemaps")
+        for path in (assets_dir / folder).rglob("*.png")
+        if path.stat().st_size >= LARGE_IMAGE_BYTES
+    }
+
+    jobs = [
+        BakeJob(source, source in large_images, tuple(source_variants))
+        for source, source_variants in variants.items()
+        if (assets_dir / source).exists()
+    ]
+    jobs += [BakeJob(source, reencode=True) for source in large_images - set(variants)]
+    jobs += [
+        BakeJob(path.relative_to(assets_dir).as_posix(), reencode=True)
+        for path in (assets_dir / "musics").glob("*.mp3")
+    ]
+    return sorted(jobs, key=lambda job: job.source)
+
+
+def content_hash(job: BakeJob, assets_dir: Path) -> str:
+    digest = hashlib.sha256(f"{BAKE_VERSION}:{job!r}".encode())
+    with open(assets_dir / job.source, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def bake(
+    jobs: Optional[List[BakeJob]] = None,
+    assets_dir: Optional[Path] = None,
+    baked_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+    force: bool = False,
+) -> BakeReport:
+    """
+    Refaz as saídas cujo hash mudou, num pool de processos (``workers=0``
+    roda tudo neste processo), e regrava o manifest.
+    """
+    assets_dir = assets_dir or get_assets_dir()
+    baked_dir = baked_dir or get_baked_dir()
+    jobs = collect_jobs(assets_dir) if jobs is None else jobs
+    previous = _read_manifest(baked_dir)
+    has_ffmpeg = shutil.which("ffmpeg") is not None
+    report = BakeReport()
+
+    manifest: Dict[str, dict] = {}
+    pending: List[Tuple[BakeJob, str]] = []
+    for job in jobs:
+        digest = content_hash(job, assets_dir)
+        entry = previous.get(job.source)
+        if (
+            not force
+            and entry is not None
+            and entry["hash"] == digest
+            and all((baked_dir / out).exists() for out in entry["outputs"].values())
+        ):
+            manifest[job.source] = _entry(job, assets_dir, digest)
+            report.up_to_date.append(job.source)
+        elif job.is_audio and not has_ffmpeg:
+            report.skipped.append(job.source)
+        else:
+            pending.append((job, digest))
+
+    if report.skipped:
+        logger.warning(
+            f"ffmpeg not found: {len(report.skipped)} audio files left as MP3"
+        )
+
+    if workers == 0:
+        results = [_run_inline(job, assets_dir, baked_dir) for job, _ in pending]
+    else:
+        results = _run_pool(pending, assets_dir, baked_dir, workers)
+
+    for (job, digest), error in zip(pending, results):
+        if error:
+            logger.error(f"Could not bake {job.source}: {error}")
+            report.failed.append(job.source)
+        else:
+            manifest[job.source] = _entry(job, assets_dir, digest)
+            report.baked.append(job.source)
+
+    _remove_orphans(previous, manifest, baked_dir)
+    _write_manifest(baked_dir, manifest)
+    return report
+
+
+def build_pack(
+    path: Path,
+    jobs: Optional[List[BakeJob]] = None,
+    assets_dir: Optional[Path] = None,
+) -> int:
+    """Grava o pacote em ``path`` e retorna o número de entradas."""
+    assets_dir = assets_dir or get_assets_dir()
+    jobs = collect_jobs(assets_dir) if jobs is None else jobs
+    if pygame.display.get_surface() is None:
+        _init_worker()
+
+    writer = AssetPackWriter(path)
+    cache = AssetCache(use_baked=False)
+    count = 0
+    for folder in ("images", "tilemaps"):
+        for image in sorted((assets_dir / folder).rglob("*.png")):
+            relative = image.relative_to(assets_dir).as_posix()
+            writer.add_image(relative, pygame.image.load(image).convert_alpha())
+            count += 1
+
+    # Mesmas transformações do jogo, com o mesmo código
+    for job in jobs:
+        source = str(assets_dir / job.source)
+        for variant in job.variants:
+            key = pack_key(job.source, image_variant(*variant))
+            writer.add_image(key, cache.image(source, *variant))
+            count += 1
+
+    for tmx in sorted((assets_dir / "tilemaps").glob("*.tmx")):
+        relative = tmx.relative_to(assets_dir).as_posix()
+        compiled = compile_tmx(str(tmx))
+        writer.add_blob(pack_key(relative, PACK_VARIANT), compiled_bytes(compiled))
+        count += 1
+
+    # Só aqui o pacote substitui o anterior
+    writer.close()
+    return count
+
+
+def _run_inline(job: BakeJob, assets_dir: Path, baked_dir: Path) -> str:
+    try:
+        _bake_job(job, str(assets_dir), str(baked_dir))
+        return ""
+    except Exception as e:
+        return str(e)
+
+
+def _run_pool(
+    pending: List[Tuple[BakeJob, str]],
+    assets_dir: Path,
+    baked_dir: Path,
+    workers: Optional[int],
+) -> List[str]:
+    if not pending:
+        return []
+
+    # spawn: os filhos não herdam o estado do SDL de quem chamou
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+    ) as pool:
+        futures: List[Future] = [
+            pool.submit(_bake_job, job, str(assets_dir), str(baked_dir))
+            for job, _ in pending
+        ]
+        results = []
+        for future in futures:
+            error = future.exception()
+            results.append(str(error) if error else "")
+        return results
+
+
+def _init_worker() -> None:
+    # convert_alpha precisa de um display, mesmo que nunca desenhado
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+
+def _bake_job(job: BakeJob, assets_dir: str, baked_dir: str) -> None:
+    source = os.path.join(assets_dir, job.source)
+    outputs = job.outputs()
+
+    if job.is_audio:
+        _encode_audio(source, Path(baked_dir) / outputs[""])
+        return
+
+    if job.reencode:
+        # Sem convert: o BMP mantém a profundidade do PNG e o loader do jogo
+        # converte do mesmo jeito que converteria o original
+        _save_image(pygame.image.load(source), Path(baked_dir) / outputs[""])
+
+    # Mesmas transformações do jogo, com o mesmo código
+    cache = AssetCache(use_baked=False)
+    for variant in job.variants:
+        surface = cache.image(source, *variant)
+        _save_image(surface, Path(baked_dir) / outputs[image_variant(*variant)])
+
+
+def _save_image(surface: pygame.Surface, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # O pygame escolhe o formato pela extensão: o temporário mantém a do destino
+    temporary = path.with_name(f".{path.stem}.tmp{path.suffix}")
+    pygame.image.save(surface, str(temporary))
+    os.replace(temporary, path)
+
+
+def _encode_audio(source: str, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.stem}.tmp{path.suffix}")
+    subprocess.run(
+        [
+            "ffmpeg",
+            "-v",
+            "error",
+            "-y",
+            "-i",
+            source,
+            "-vn",
+            "-c:a",
+            "libvorbis",
+            "-q:a",
+            "5",
+            str(temporary),
+        ],
+        check=True,
+        capture_output=True,
+    )
+    os.replace(temporary, path)
+
+
+def _entry(job: BakeJob, assets_dir: Path, digest: str) -> dict:
+    stat = os.stat(assets_dir / job.source)
+    return {
+        "hash": digest,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "outputs": job.outputs(),
+    }
+
+
+def _read_manifest(baked_dir: Path) -> Dict[str, dict]:
+    try:
+        with open(baked_dir / BAKE_MANIFEST) as f:
+            return json.load(f).get("assets", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_manifest(baked_dir: Path, assets: Dict[str, dict]) -> None:
+    baked_dir.mkdir(parents=True, exist_ok=True)
+    temporary = baked_dir / f".{BAKE_MANIFEST}.tmp"
+    with open(temporary, "w") as f:
+        json.dump({"version": BAKE_VERSION, "assets": assets}, f, indent=1)
+    os.replace(temporary, baked_dir / BAKE_MANIFEST)
+    clear_bake_cache()
+
+
+def _remove_orphans(
+    previous: Dict[str, dict], current: Dict[str, dict], baked_dir: Path
+) -> None:
+    keep = {out for entry in current.values() for out in entry["outputs"].values()}
+    for entry in previous.values():
+        for output in entry["outputs"].values():
+            if output not in keep and (baked_dir / output).exists():
+                os.remove(baked_dir / output)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Pré-processa os assets do jogo")
+    parser.add_argument("--output", default=None, help="pasta do bake")
+    parser.add_argument("--jobs", type=int, default=None, help="processos")
+    parser.add_argument("--force", action="store_true", help="ignora os hashes")
+    parser.add_argument(
+        "--pack",
+        nargs="?",
+        const="",
+        default=None,
+        help=f"gera também o pacote único (padrão: <bake>/{ASSET_PACK_NAME})",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    baked_dir = Path(args.output) if args.output else get_baked_dir()
+
+    started = time.perf_counter()
+    report = bake(baked_dir=baked_dir, workers=args.jobs, force=args.force)
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"{len(report.baked)} baked, {len(report.up_to_date)} up to date, "
+        f"{len(report.skipped)} skipped, {len(report.failed)} failed "
+        f"in {elapsed:.1f} s -> {baked_dir}"
+    )
+
+    if args.pack is not None:
+        pack_path = Path(args.pack) if args.pack else baked_dir / ASSET_PACK_NAME
+        started = time.perf_counter()
+        count = build_pack(pack_path)
+        elapsed = time.perf_counter() - started
+        size = pack_path.stat().st_size / (1 << 20)
+        print(f"{count} entries ({size:.0f} MiB) in {elapsed:.1f} s -> {pack_path}")
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
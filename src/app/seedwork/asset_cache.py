@@ -0,0 +1,360 @@
+import os
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+import numpy as np
+import pygame
+from app.seedwork.asset_pack import get_asset_pack
+from app.seedwork.path_helper import baked_asset
+
+logger = logging.getLogger(__name__)
+
+AssetKey = Tuple[Hashable, ...]
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    releases: int = 0
+    evictions: int = 0
+    # Pixels das superfícies em cache (ou ``nbytes`` de outros assets)
+    resident_bytes: int = 0
+    # Superfícies criadas pelo cache (decodificadas, escaladas, espelhadas,
+    # em cinza): em regime permanente o valor não muda
+    surfaces_allocated: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class _CacheEntry:
+    asset: Any
+    refcount: int = 0
+    # Entrada da qual esta foi derivada (ex.: imagem base de uma versão escalada)
+    parent: Optional[AssetKey] = None
+    size: int = 0
+
+
+class AssetCache:
+    """
+    Cache central de imagens e sons, indexado por caminho e transformação.
+
+    Cada ``image``/``sound`` incrementa a contagem de referências da
+    entrada; ``release`` decrementa. Entradas sem referência continuam em
+    memória (é isso que torna um restart do jogo livre de I/O) até que
+    ``purge_unused`` seja chamado explicitamente ou, com ``budget_bytes``,
+    até passarem do orçamento: aí as menos usadas recentemente saem primeiro.
+    Entradas com referência ou fixadas com ``pin`` (os assets da cena atual)
+    nunca são descartadas, mesmo que o orçamento estoure.
+
+    As superfícies devolvidas são compartilhadas e não devem ser alteradas
+    por quem as recebe. O cache pode ser usado por threads de carregamento.
+
+    Imagens do pacote de assets vêm direto do mmap; escalas e tons de cinza
+    já gerados pelo bake são lidos prontos. ``use_baked=False`` força a
+    decodificação e o cálculo (é o que o próprio bake usa).
+    """
+
+    def __init__(
+        self, use_baked: bool = True, budget_bytes: Optional[int] = None
+    ) -> None:
+        # Da menos para a mais usada recentemente
+        self._entries: "OrderedDict[AssetKey, _CacheEntry]" = OrderedDict()
+        self._pins: Dict[AssetKey, int] = {}
+        self.stats = CacheStats()
+        self.use_baked = use_baked
+        self.budget_bytes = budget_bytes
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def image_key(
+        path: str,
+        scale: Optional[float] = None,
+        size: Optional[Tuple[int, int]] = None,
+        grayscale: bool = False,
+        flip_x: bool = False,
+    ) -> AssetKey:
+        return ("image", os.path.abspath(path), scale, size, grayscale, flip_x)
+
+    @staticmethod
+    def sound_key(path: str) -> AssetKey:
+        return ("sound", os.path.abspath(path))
+
+    def image(
+        self,
+        path: str,
+        scale: Optional[float] = None,
+        size: Optional[Tuple[int, int]] = None,
+        grayscale: bool = False,
+        flip_x: bool = False,
+    ) -> pygame.Surface:
+        key = self.image_key(path, scale, size, grayscale, flip_x)
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                surface, parent = self._build_image(
+                    path, scale, size, grayscale, flip_x
+                )
+                entry = self._store(key, surface, parent)
+            entry.refcount += 1
+            return entry.asset
+
+    def sound(self, path: str) -> pygame.mixer.Sound:
+        key = self.sound_key(path)
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                entry = self._store(key, pygame.mixer.Sound(path))
+            entry.refcount += 1
+            return entry.asset
+
+    def add(self, key: AssetKey, asset: Any) -> None:
+        """Guarda um asset já carregado (ex.: pelo ``AssetLoader``), sem referências."""
+        with self._lock:
+            if key not in self._entries:
+                self._store(key, asset)
+
+    def get(self, key: AssetKey, build: Callable[[], Any]) -> Any:
+        """
+        Asset em ``key``, montado com ``build()`` se não estiver em cache. Não
+        conta referência: sem ``pin``, a entrada pode sair pelo orçamento.
+        """
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                entry = self._store(key, build())
+            return entry.asset
+
+    def pin(self, keys: Iterable[AssetKey]) -> None:
+        """Protege as entradas do orçamento (mesmo as que ainda não existem)."""
+        with self._lock:
+            for key in keys:
+                self._pins[key] = self._pins.get(key, 0) + 1
+
+    def unpin(self, keys: Iterable[AssetKey]) -> None:
+        with self._lock:
+            for key in keys:
+                pins = self._pins.get(key, 0) - 1
+                if pins > 0:
+                    self._pins[key] = pins
+                else:
+                    self._pins.pop(key, None)
+            self._enforce_budget()
+
+    def set_budget(self, budget_bytes: Optional[int]) -> None:
+        """Troca o orçamento (None = sem limite), descartando o que passar dele."""
+        with self._lock:
+            self.budget_bytes = budget_bytes
+            self._enforce_budget()
+
+    def decode_source(
+        self,
+        path: str,
+        scale: Optional[float] = None,
+        size: Optional[Tuple[int, int]] = None,
+        grayscale: bool = False,
+    ) -> Optional[Tuple[str, AssetKey]]:
+        """
+        Arquivo que ``image`` decodificaria para essa imagem e a chave em que
+        ele entra no cache, ou None se não há o que ler do disco (já está em
+        cache ou vem do pacote de assets).
+        """
+        key = self.image_key(path, scale, size, grayscale)
+        if key in self._entries:
+            return None
+        if self.use_baked:
+            if get_asset_pack() is not None:
+                return None
+            baked = baked_asset(path, image_variant(scale, size, grayscale))
+            if baked is not None:
+                return baked, key
+        if grayscale:
+            return self.decode_source(path, scale, size)
+        if scale is not None or size is not None:
+            return self.decode_source(path)
+        return path, key
+
+    def release(self, key: AssetKey, purge: bool = False) -> None:
+        """
+        Devolve uma referência; com ``purge``, a entrada sai da memória se
+        ninguém mais a usa (para assets que só servem para montar outros).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.refcount == 0:
+                logger.warning(f"Release of unreferenced asset: {key}")
+                return
+            entry.refcount -= 1
+            self.stats.releases += 1
+            if purge and entry.refcount == 0 and key not in self._pins:
+                parent = self._evict(key)
+                if parent is not None:
+                    self.release(parent, purge=True)
+
+    def refcount(self, key: AssetKey) -> int:
+        entry = self._entries.get(key)
+        return entry.refcount if entry else 0
+
+    def purge_unused(self) -> int:
+        """Remove da memória as entradas sem referências e retorna quantas."""
+        purged = 0
+        with self._lock:
+            while True:
+                unused = [key for key in self._entries if self._evictable(key)]
+                if not unused:
+                    return purged
+                for key in unused:
+                    parent = self._evict(key)
+                    if parent is not None:
+                        self.release(parent)
+                purged += len(unused)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._pins.clear()
+            self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: AssetKey) -> bool:
+        return key in self._entries
+
+    def _lookup(self, key: AssetKey) -> Optional[_CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+            self._entries.move_to_end(key)
+        return entry
+
+    def _store(
+        self, key: AssetKey, asset: Any, parent: Optional[AssetKey] = None
+    ) -> _CacheEntry:
+        entry = _CacheEntry(asset, parent=parent, size=_size_in_bytes(asset))
+        self._entries[key] = entry
+        if isinstance(asset, pygame.Surface):
+            self.stats.surfaces_allocated += 1
+        self.stats.resident_bytes += entry.size
+        self._enforce_budget(keep=key)
+        return entry
+
+    def _evictable(self, key: AssetKey) -> bool:
+        return self._entries[key].refcount == 0 and key not in self._pins
+
+    def _evict(self, key: AssetKey) -> Optional[AssetKey]:
+        entry = self._entries.pop(key)
+        self.stats.resident_bytes -= entry.size
+        self.stats.evictions += 1
+        return entry.parent
+
+    def _enforce_budget(self, keep: Optional[AssetKey] = None) -> None:
+        if self.budget_bytes is None:
+            return
+        # Soltar uma derivada libera a base, que pode sair na volta seguinte
+        evicted = True
+        while evicted and self.stats.resident_bytes > self.budget_bytes:
+            evicted = False
+            for key in list(self._entries):
+                if self.stats.resident_bytes <= self.budget_bytes:
+                    return
+                if key == keep or key not in self._entries or not self._evictable(key):
+                    continue
+                parent = self._evict(key)
+                if parent is not None:
+                    self.release(parent)
+                evicted = True
+
+    def _build_image(
+        self,
+        path: str,
+        scale: Optional[float],
+        size: Optional[Tuple[int, int]],
+        grayscale: bool,
+        flip_x: bool,
+    ) -> Tuple[pygame.Surface, Optional[AssetKey]]:
+        # Transformações são compostas a partir da imagem base, também em cache
+        if flip_x:
+            unflipped = self.image(path, scale, size, grayscale)
+            return (
+                pygame.transform.flip(unflipped, True, False),
+                self.image_key(path, scale, size, grayscale),
+            )
+        if self.use_baked:
+            prebuilt = _prebuilt_image(path, image_variant(scale, size, grayscale))
+            if prebuilt is not None:
+                return prebuilt, None
+        if grayscale:
+            colored = self.image(path, scale, size)
+            return _grayscale(colored), self.image_key(path, scale, size)
+        if scale is not None or size is not None:
+            base = self.image(path)
+            if size is None:
+                size = (int(base.get_width() * scale), int(base.get_height() * scale))
+            return pygame.transform.scale(base, size), self.image_key(path)
+
+        logger.debug(f"Decoding image from disk: {path}")
+        return pygame.image.load(path).convert_alpha(), None
+
+
+def _prebuilt_image(path: str, variant: str) -> Optional[pygame.Surface]:
+    pack = get_asset_pack()
+    if pack is not None:
+        surface = pack.image(path, variant)
+        if surface is not None:
+            return surface
+
+    # Caminhos vindos de asset_path já apontam para o original re-encodado;
+    # os montados à mão (tilesets) são resolvidos aqui
+    baked = baked_asset(path, variant)
+    if baked is not None:
+        logger.debug(f"Loading baked image: {baked}")
+        return pygame.image.load(baked).convert_alpha()
+    return None
+
+
+def image_variant(
+    scale: Optional[float] = None,
+    size: Optional[Tuple[int, int]] = None,
+    grayscale: bool = False,
+) -> str:
+    """Nome da transformação no bake: "" (original), "x1.5", "48x48-gray"..."""
+    parts = []
+    if size is not None:
+        parts.append(f"{size[0]}x{size[1]}")
+    elif scale is not None:
+        parts.append(f"x{scale:g}")
+    if grayscale:
+        parts.append("gray")
+    return "-".join(parts)
+
+
+def _size_in_bytes(asset: Any) -> int:
+    if isinstance(asset, pygame.Surface):
+        return asset.get_height() * asset.get_pitch()
+    return getattr(asset, "nbytes", 0)
+
+
+def _grayscale(surface: pygame.Surface) -> pygame.Surface:
+    gray_surface = surface.copy()
+    rgb = pygame.surfarray.pixels3d(gray_surface)
+    gray = (0.299 * rgb[..., 0] + 0.587 * rgb[..., 1] + 0.114 * rgb[..., 2]).astype(
+        np.uint8
+    )
+    rgb[..., 0] = gray
+    rgb[..., 1] = gray
+    rgb[..., 2] = gray
+    del rgb  # libera o lock da superfície
+    return gray_surface
+
+
+# Instância única compartilhada por todos os loaders do jogo
+asset_cache = AssetCache()
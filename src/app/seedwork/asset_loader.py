@@ -0,0 +1,207 @@
+"""
+Carregamento assíncrono de assets.
+
+Ler e decodificar arquivos (PNG/BMP, bytes de áudio) roda num pool de
+threads: o pygame solta o GIL enquanto decodifica. O que depende do display
+ou do estado do jogo (``convert_alpha``, as transformações do ``AssetCache``,
+montar um nível) é finalizado na thread principal, em ``poll``, dentro de um
+orçamento de tempo por quadro.
+
+Cada pedido devolve um ``Future``, resolvido nessa finalização: callbacks
+registrados com ``add_done_callback`` também rodam na thread principal.
+"""
+
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from queue import Empty, SimpleQueue
+from typing import Any, Callable, Iterable, Optional, Tuple
+import pygame
+from app.seedwork.asset_cache import AssetCache, asset_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 2
+
+# Tempo de finalização por quadro: cabe num quadro de 60 fps junto do menu
+DEFAULT_POLL_BUDGET = 0.004
+
+
+@dataclass
+class _Job:
+    future: Future
+    finalize: Callable[[Any], Any]
+
+
+class AssetLoader:
+    def __init__(self, cache: AssetCache = asset_cache, workers: int = DEFAULT_WORKERS):
+        self.cache = cache
+        self._executor: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="asset-loader"
+        )
+        self._ready: "SimpleQueue[Tuple[_Job, Future]]" = SimpleQueue()
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Pedidos ainda não finalizados."""
+        return self._pending
+
+    def submit(
+        self, decode: Callable[[], Any], finalize: Callable[[Any], Any]
+    ) -> Future:
+        """``decode()`` roda no pool; ``finalize(resultado)``, em ``poll``."""
+        if self._executor is None:
+            raise RuntimeError("AssetLoader is closed")
+        job = _Job(Future(), finalize)
+        self._pending += 1
+        decoding = self._executor.submit(decode)
+        decoding.add_done_callback(lambda done: self._ready.put((job, done)))
+        return job.future
+
+    def image(
+        self,
+        path: str,
+        scale: Optional[float] = None,
+        size: Optional[Tuple[int, int]] = None,
+        grayscale: bool = False,
+        flip_x: bool = False,
+    ) -> Future:
+        """
+        Como ``AssetCache.image`` (a superfície conta uma referência), mas o
+        arquivo é decodificado fora da thread principal.
+        """
+        source = self.cache.decode_source(path, scale, size, grayscale)
+
+        def finalize(decoded: Optional[pygame.Surface]) -> pygame.Surface:
+            if decoded is not None:
+                self.cache.add(source[1], decoded.convert_alpha())
+            return self.cache.image(path, scale, size, grayscale, flip_x)
+
+        if source is None:
+            return self.submit(_nothing, finalize)
+        return self.submit(lambda: pygame.image.load(source[0]), finalize)
+
+    def preload_image(
+        self,
+        path: str,
+        scale: Optional[float] = None,
+        size: Optional[Tuple[int, int]] = None,
+        grayscale: bool = False,
+        flip_x: bool = False,
+    ) -> Future:
+        """Deixa a imagem pronta no cache, sem guardar referência."""
+        key = self.cache.image_key(path, scale, size, grayscale, flip_x)
+
+        def release(done: Future) -> None:
+            if done.exception() is None:
+                self.cache.release(key)
+
+        future = self.image(path, scale, size, grayscale, flip_x)
+        future.add_done_callback(release)
+        return future
+
+    def read(self, path: str) -> Future:
+        """Conteúdo do arquivo em bytes (ex.: uma música a tocar da memória)."""
+        return self.submit(lambda: _read_bytes(path), _identity)
+
+    def after(self, futures: Iterable[Future], callback: Callable[[], Any]) -> Future:
+        """Roda ``callback`` em ``poll`` depois que todos os futures terminarem."""
+        waiting = list(futures)
+        job = _Job(Future(), lambda _: callback())
+        self._pending += 1
+        ready: Future = Future()
+        ready.set_result(None)
+        remaining = [len(waiting)]
+
+        # Os futures do loader terminam em poll, sempre na thread principal
+        def on_done(_: Future) -> None:
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                self._ready.put((job, ready))
+
+        if not waiting:
+            self._ready.put((job, ready))
+        for future in waiting:
+            future.add_done_callback(on_done)
+        return job.future
+
+    def poll(self, budget: float = DEFAULT_POLL_BUDGET) -> int:
+        """
+        Finaliza pedidos prontos até estourar ``budget`` segundos (ao menos
+        um por chamada) e retorna quantos. Só na thread principal.
+        """
+        deadline = time.perf_counter() + budget
+        finished = 0
+        while True:
+            try:
+                self._finalize(*self._ready.get_nowait())
+            except Empty:
+                return finished
+            finished += 1
+            if time.perf_counter() >= deadline:
+                return finished
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Finaliza tudo o que estiver pendente (testes, telas de carregamento)."""
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while self._pending:
+            remaining = None if deadline is None else deadline - time.perf_counter()
+            if remaining is not None and remaining <= 0:
+                raise TimeoutError(f"{self._pending} asset loads still pending")
+            try:
+                self._finalize(*self._ready.get(timeout=remaining))
+            except Empty:
+                continue
+
+    def wait_for(self, future: Future, timeout: Optional[float] = None) -> Any:
+        """
+        Finaliza pedidos até ``future`` (de uma cadeia de pedidos do loader)
+        terminar e devolve o resultado dele.
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while not future.done():
+            if not self._pending:
+                raise RuntimeError("Future is not waiting on any asset load")
+            remaining = None if deadline is None else deadline - time.perf_counter()
+            if remaining is not None and remaining <= 0:
+                raise TimeoutError(f"{self._pending} asset loads still pending")
+            try:
+                self._finalize(*self._ready.get(timeout=remaining))
+            except Empty:
+                continue
+        return future.result()
+
+    def _finalize(self, job: _Job, decoding: Future) -> None:
+        self._pending -= 1
+        if decoding.cancelled():
+            job.future.cancel()
+            return
+        error = decoding.exception()
+        if error is None:
+            try:
+                job.future.set_result(job.finalize(decoding.result()))
+                return
+            except Exception as e:
+                error = e
+        logger.error(f"Asset load failed: {error}")
+        job.future.set_exception(error)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+def _nothing() -> None:
+    return None
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _read_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
@@ -0,0 +1,163 @@
+"""
+Pacote único de assets (.opak), lido por mmap.
+
+As imagens ficam decodificadas, no layout de ``convert_alpha`` (BGRA, 4
+bytes por pixel, sem padding), e viram superfícies com
+``pygame.image.frombuffer`` apontando direto para o mapeamento: carregar uma
+imagem não lê nem copia nada até o SDL tocar nos pixels. Além delas o pacote
+guarda blobs (ex.: os mapas compilados), para o jogo não ler XML.
+
+Layout (little-endian)::
+
+    cabeçalho  MAGIC, versão, offset e tamanho do índice (64 bytes)
+    dados      um bloco por entrada, alinhado em DATA_ALIGNMENT
+    índice     JSON: chave -> [tipo, offset, tamanho, largura, altura]
+
+As chaves são caminhos relativos à pasta de assets, com "@variante" para as
+transformações (mesmos nomes do bake). O pacote é gerado com
+``python -m app.seedwork.asset_bake --pack`` e escolhido em
+``path_helper.get_asset_pack_path``.
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Union
+import pygame
+from app.seedwork.path_helper import get_asset_pack_path, relative_asset_path
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"OPAK"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHQQ")
+HEADER_SIZE = 64
+DATA_ALIGNMENT = 64
+
+KIND_IMAGE = "image"
+KIND_BLOB = "blob"
+
+# Layout dos pixels no pacote: o mesmo de convert_alpha num display de 32 bits
+PIXEL_FORMAT = "BGRA"
+_BGRA_MASKS = (0xFF0000, 0xFF00, 0xFF, 0xFF000000)
+
+
+def pack_key(relative: str, variant: str = "") -> str:
+    return f"{relative}@{variant}" if variant else relative
+
+
+class AssetPack:
+    def __init__(self, path: Union[str, Path]):
+        self.path = str(path)
+        with open(self.path, "rb") as f:
+            # Cópia privada: se alguém escrever numa superfície, o arquivo não muda
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        magic, version = b"", 0
+        if len(self._map) >= HEADER_SIZE:
+            magic, version, _, index_offset, index_length = _HEADER.unpack_from(
+                self._map, 0
+            )
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._map.close()
+            raise ValueError(f"Not an asset pack (v{FORMAT_VERSION}): {self.path}")
+
+        self._view = memoryview(self._map)
+        self._index: Dict[str, List] = json.loads(
+            bytes(self._view[index_offset : index_offset + index_length])
+        )
+        self._zero_copy: Optional[bool] = None
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def image(self, path: str, variant: str = "") -> Optional[pygame.Surface]:
+        """Superfície de ``path`` (caminho de asset) ou None se não estiver aqui."""
+        relative = relative_asset_path(path)
+        entry = self._index.get(pack_key(relative, variant)) if relative else None
+        if entry is None or entry[0] != KIND_IMAGE:
+            return None
+
+        _, offset, length, width, height = entry
+        surface = pygame.image.frombuffer(
+            self._view[offset : offset + length], (width, height), PIXEL_FORMAT
+        )
+        if self._zero_copy is None:
+            self._zero_copy = _display_matches_bgra()
+        return surface if self._zero_copy else surface.convert_alpha()
+
+    def blob(self, key: str) -> Optional[memoryview]:
+        entry = self._index.get(key)
+        if entry is None or entry[0] != KIND_BLOB:
+            return None
+        _, offset, length, _, _ = entry
+        return self._view[offset : offset + length]
+
+
+def _display_matches_bgra() -> bool:
+    # Em displays com outro formato, cada imagem precisa de um convert_alpha
+    display = pygame.display.get_surface()
+    if display is None or display.get_bitsize() != 32:
+        return False
+    return display.get_masks()[:3] == _BGRA_MASKS[:3]
+
+
+class AssetPackWriter:
+    """Monta um pacote: ``add_*`` para cada entrada e ``close`` no fim."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._temporary = self.path.with_name(f".{self.path.name}.tmp")
+        self._file: BinaryIO = open(self._temporary, "wb")
+        self._file.write(bytes(HEADER_SIZE))
+        self._index: Dict[str, List] = {}
+
+    def add_image(self, key: str, surface: pygame.Surface) -> None:
+        data = pygame.image.tobytes(surface, PIXEL_FORMAT)
+        self._add(key, KIND_IMAGE, data, *surface.get_size())
+
+    def add_blob(self, key: str, data: bytes) -> None:
+        self._add(key, KIND_BLOB, data, 0, 0)
+
+    def close(self) -> None:
+        index = json.dumps(self._index, separators=(",", ":")).encode()
+        index_offset = self._file.tell()
+        self._file.write(index)
+        self._file.seek(0)
+        self._file.write(
+            _HEADER.pack(MAGIC, FORMAT_VERSION, 0, index_offset, len(index))
+        )
+        self._file.close()
+        os.replace(self._temporary, self.path)
+
+    def _add(self, key: str, kind: str, data: bytes, width: int, height: int) -> None:
+        offset = self._file.tell()
+        padding = -offset % DATA_ALIGNMENT
+        self._file.write(bytes(padding))
+        offset += padding
+        self._file.write(data)
+        self._index[key] = [kind, offset, len(data), width, height]
+
+
+@lru_cache(maxsize=1)
+def get_asset_pack() -> Optional[AssetPack]:
+    """O pacote escolhido em ``get_asset_pack_path``, aberto uma vez."""
+    path = get_asset_pack_path()
+    if path is None:
+        return None
+    try:
+        pack = AssetPack(path)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Asset pack unavailable, using loose files: {e}")
+        return None
+    logger.info(f"Using asset pack {path} ({len(pack)} entries)")
+    return pack
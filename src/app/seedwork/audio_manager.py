@@ -0,0 +1,202 @@
+"""
+Mixer e barramentos de áudio.
+
+O mixer é inicializado uma vez, aqui, com a frequência e o buffer de
+``configure`` (o ``init_pygame`` do startup delega para ``init``). Cada som
+toca num barramento: ``music`` é o stream do ``pygame.mixer.music`` e
+``sfx``/``ui`` são grupos de canais reservados, cada um com um limite de
+vozes. Com o grupo cheio, um som novo rouba o canal da voz mais antiga, em
+vez de calar sons de outro grupo ou não tocar.
+
+Todos os barramentos ficam sob ``master``: o volume de um som é o dele
+vezes o do barramento vezes o master, todos de 0 a 100 como no pplay.
+Mudar o volume de um barramento afeta só os canais (e o stream) dele.
+"""
+
+import itertools
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Union
+import pygame
+from app.seedwork.asset_cache import AssetCache, asset_cache
+
+logger = logging.getLogger(__name__)
+
+MASTER_BUS = "master"
+MUSIC_BUS = "music"
+SFX_BUS = "sfx"
+UI_BUS = "ui"
+
+# Os padrões do pygame.mixer.init: mudar só por configuração (AUDIO_*)
+DEFAULT_FREQUENCY = 44100
+DEFAULT_BUFFER = 512
+
+# Vozes por grupo de canais; a música usa o stream, não um canal
+DEFAULT_VOICES: Dict[str, int] = {SFX_BUS: 8, UI_BUS: 2}
+
+
+@dataclass
+class Bus:
+    name: str
+    volume: int = 100
+    channels: List[pygame.mixer.Channel] = field(default_factory=list)
+    # Ordem de início e volume próprio do som em cada canal
+    started: List[int] = field(default_factory=list)
+    voice_volumes: List[float] = field(default_factory=list)
+    steals: int = 0
+
+
+class AudioManager:
+    def __init__(
+        self,
+        frequency: int = DEFAULT_FREQUENCY,
+        buffer: int = DEFAULT_BUFFER,
+        voices: Optional[Dict[str, int]] = None,
+        cache: AssetCache = asset_cache,
+    ) -> None:
+        self.frequency = frequency
+        self.buffer = buffer
+        self.voices = dict(DEFAULT_VOICES if voices is None else voices)
+        self.cache = cache
+        self.buses: Dict[str, Bus] = {
+            name: Bus(name) for name in (MASTER_BUS, MUSIC_BUS, *self.voices)
+        }
+        self.available = False
+        self._initialized = False
+        # Volume próprio (0 a 100) da trilha dona do stream
+        self._stream_volume = 100
+        self._sounds: Dict[str, pygame.mixer.Sound] = {}
+        self._order = itertools.count()
+
+    def configure(self, frequency: int, buffer: int) -> None:
+        """Parâmetros do mixer; só valem se chamados antes de ``init``."""
+        if self._initialized:
+            logger.warning("Mixer already initialized, audio settings ignored")
+            return
+        self.frequency = frequency
+        self.buffer = buffer
+
+    def init(self) -> bool:
+        """Sobe o mixer (uma vez) e reserva os canais dos barramentos."""
+        if self._initialized:
+            return self.available
+        self._initialized = True
+
+        if pygame.mixer.get_init():
+            logger.warning(f"Mixer initialized elsewhere: {pygame.mixer.get_init()}")
+        else:
+            try:
+                pygame.mixer.init(frequency=self.frequency, buffer=self.buffer)
+            except pygame.error as e:
+                # Sem placa de som o jogo segue mudo
+                logger.warning(f"Audio unavailable: {e}")
+                return False
+
+        total = sum(self.voices.values())
+        pygame.mixer.set_num_channels(total)
+        # Sound.play do pygame não pega os canais dos barramentos
+        pygame.mixer.set_reserved(total)
+        index = 0
+        for name, voices in self.voices.items():
+            bus = self.buses[name]
+            bus.channels = [pygame.mixer.Channel(index + i) for i in range(voices)]
+            bus.started = [-1] * voices
+            bus.voice_volumes = [1.0] * voices
+            index += voices
+
+        self.available = True
+        logger.debug(f"Mixer ready: {pygame.mixer.get_init()}, {total} channels")
+        return True
+
+    def gain(self, bus: str) -> float:
+        """Volume efetivo (0 a 1) de ``bus``, já com o master."""
+        gain = self.buses[bus].volume / 100
+        if bus != MASTER_BUS:
+            gain *= self.buses[MASTER_BUS].volume / 100
+        return gain
+
+    def set_volume(self, bus: str, value: int) -> None:
+        """Volume de 0 a 100 de um barramento (``master`` afeta todos)."""
+        self.buses[bus].volume = max(0, min(100, value))
+        for name in self.voices:
+            if bus in (MASTER_BUS, name):
+                self._apply_bus_volume(self.buses[name])
+        if bus in (MASTER_BUS, MUSIC_BUS):
+            self.set_stream_volume(self._stream_volume)
+
+    def set_stream_volume(self, value: int) -> None:
+        """Volume próprio da trilha no stream de música (usado por ``Music``)."""
+        self._stream_volume = value
+        if pygame.mixer.get_init():
+            pygame.mixer.music.set_volume(value / 100 * self.gain(MUSIC_BUS))
+
+    def sound(self, path: str) -> Optional[pygame.mixer.Sound]:
+        if not self.init():
+            return None
+        key = os.path.abspath(path)
+        sound = self._sounds.get(key)
+        if sound is None:
+            # A referência no AssetCache fica com o manager
+            sound = self._sounds[key] = self.cache.sound(path)
+        return sound
+
+    def play(
+        self,
+        sound: Union[str, pygame.mixer.Sound],
+        bus: str = SFX_BUS,
+        loops: int = 0,
+        volume: float = 100,
+    ) -> Optional[pygame.mixer.Channel]:
+        """
+        Toca ``sound`` (caminho ou Sound) num canal de ``bus`` e devolve o
+        canal, ou None sem áudio. ``volume`` (0 a 100) é o do próprio som.
+        """
+        if isinstance(sound, str):
+            sound = self.sound(sound)
+        target = self.buses[bus]
+        if sound is None or not self.available or not target.channels:
+            return None
+
+        index = self._free_voice(target)
+        channel = target.channels[index]
+        target.started[index] = next(self._order)
+        target.voice_volumes[index] = max(0.0, min(100.0, volume)) / 100
+        channel.set_volume(target.voice_volumes[index] * self.gain(bus))
+        channel.play(sound, loops)
+        return channel
+
+    def set_voice_volume(self, channel: pygame.mixer.Channel, volume: float) -> None:
+        """Volume próprio (0 a 100) do som que toca em ``channel``."""
+        for name in self.voices:
+            bus = self.buses[name]
+            if channel in bus.channels:
+                index = bus.channels.index(channel)
+                bus.voice_volumes[index] = max(0.0, min(100.0, volume)) / 100
+                channel.set_volume(bus.voice_volumes[index] * self.gain(name))
+                return
+
+    def stop(self, bus: Optional[str] = None) -> None:
+        """Para os canais de ``bus`` (de todos os grupos, sem ``bus``)."""
+        for name in self.voices if bus is None else (bus,):
+            for channel in self.buses[name].channels:
+                channel.stop()
+
+    def _free_voice(self, bus: Bus) -> int:
+        for index, channel in enumerate(bus.channels):
+            if not channel.get_busy():
+                return index
+        # Grupo cheio: a voz mais antiga dá lugar à nova
+        oldest = min(range(len(bus.channels)), key=bus.started.__getitem__)
+        bus.channels[oldest].stop()
+        bus.steals += 1
+        return oldest
+
+    def _apply_bus_volume(self, bus: Bus) -> None:
+        gain = self.gain(bus.name)
+        for channel, voice_volume in zip(bus.channels, bus.voice_volumes):
+            channel.set_volume(voice_volume * gain)
+
+
+# Instância única: o mixer é um só por processo
+audio_manager = AudioManager()
@@ -0,0 +1,336 @@
+"""
+Formato binário compilado dos mapas Tiled.
+
+Na primeira carga o ``.tmx`` é lido pelo pytmx (XML + ``.tsx``) e o resultado
+é gravado num arquivo compacto com tipos de camada, arrays de gids, objetos e
+referências às imagens dos tilesets. Enquanto os mtimes do ``.tmx`` e dos
+``.tsx`` não mudarem, as cargas seguintes leem só esse arquivo, sem XML.
+"""
+
+import io
+import os
+import re
+import struct
+import sys
+import logging
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, List, Optional, Tuple
+from app.seedwork.asset_pack import get_asset_pack, pack_key
+from app.seedwork.path_helper import get_cache_dir, relative_asset_path
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"OTMC"
+FORMAT_VERSION = 1
+
+LAYER_TILES = 0
+LAYER_OBJECTS = 1
+LAYER_IMAGE = 2
+
+# Chave do mapa compilado no pacote de assets: "<tmx>@compiled"
+PACK_VARIANT = "compiled"
+
+FLIP_H = 1
+FLIP_V = 2
+FLIP_D = 4
+
+_TSX_SOURCE = re.compile(rb'<tileset[^>]*\ssource="([^"]+\.tsx)"', re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class TileImageRef:
+    """Onde achar a imagem de um gid: arquivo, recorte e espelhamentos."""
+
+    file_index: int
+    rect: Optional[Tuple[int, int, int, int]]
+    flags: int
+
+
+@dataclass
+class CompiledLayer:
+    kind: int
+    type: str = ""
+    gids: array = field(default_factory=lambda: array("I"))
+    objects: List[Tuple[float, float, int]] = field(default_factory=list)
+    image_gid: int = 0
+
+
+@dataclass
+class CompiledMap:
+    width: int
+    height: int
+    tilewidth: int
+    tileheight: int
+    # Caminhos relativos à pasta do .tmx, com o colorkey do tileset ("" = nenhum)
+    image_files: List[Tuple[str, str]]
+    images: List[Optional[TileImageRef]]
+    layers: List[CompiledLayer]
+    dependencies: List[Tuple[str, int]]
+
+
+def compiled_path_for(tmx_path: str) -> Path:
+    return get_cache_dir() / "tilemaps" / (Path(tmx_path).stem + ".otmc")
+
+
+def load_compiled_map(tmx_path: str) -> CompiledMap:
+    """Retorna o mapa compilado, recompilando se o .tmx/.tsx mudou."""
+    pack = get_asset_pack()
+    relative = relative_asset_path(tmx_path)
+    if pack is not None and relative is not None:
+        # O pacote é gerado junto com as imagens: não há o que conferir
+        blob = pack.blob(pack_key(relative, PACK_VARIANT))
+        if blob is not None:
+            return _read(io.BytesIO(blob))
+
+    cache_path = compiled_path_for(tmx_path)
+    base_dir = os.path.dirname(tmx_path)
+
+    if cache_path.exists():
+        try:
+            with open(cache_path, "rb") as f:
+                compiled = _read(f)
+            if _dependencies_match(base_dir, compiled.dependencies):
+                return compiled
+            logger.info(f"Compiled tilemap is stale: {cache_path}")
+        except (OSError, ValueError, struct.error) as e:
+            logger.warning(f"Ignoring unreadable compiled tilemap {cache_path}: {e}")
+
+    compiled = compile_tmx(tmx_path)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            _write(f, compiled)
+        os.replace(tmp_path, cache_path)
+        logger.info(f"Compiled tilemap written to: {cache_path}")
+    except OSError as e:
+        # Sem permissão de escrita (ex.: bundle somente leitura): segue sem cache
+        logger.warning(f"Could not write compiled tilemap {cache_path}: {e}")
+    return compiled
+
+
+def compiled_bytes(compiled: CompiledMap) -> bytes:
+    buffer = io.BytesIO()
+    _write(buffer, compiled)
+    return buffer.getvalue()
+
+
+def compile_tmx(tmx_path: str) -> CompiledMap:
+    from pytmx import TiledImageLayer, TiledMap, TiledObjectGroup, TiledTileLayer
+
+    base_dir = os.path.dirname(tmx_path)
+    image_files: List[Tuple[str, str]] = []
+
+    def recording_loader(filename: str, colorkey: Optional[str], **kwargs):
+        entry = (os.path.relpath(filename, base_dir), colorkey or "")
+        if entry not in image_files:
+            image_files.append(entry)
+        file_index = image_files.index(entry)
+
+        def load_image(rect=None, flags=None) -> TileImageRef:
+            return TileImageRef(file_index, tuple(rect) if rect else None, _pack(flags))
+
+        return load_image
+
+    map_data = TiledMap(tmx_path, image_loader=recording_loader)
+
+    layers: List[CompiledLayer] = []
+    for layer in map_data.visible_layers:
+        if isinstance(layer, TiledTileLayer):
+            gids = array("I")
+            for row in layer.data:
+                gids.extend(row)
+            layers.append(
+                CompiledLayer(
+                    LAYER_TILES, type=layer.properties.get("type") or "", gids=gids
+                )
+            )
+        elif isinstance(layer, TiledObjectGroup):
+            objects = [
+                (float(obj.x), float(obj.y), int(obj.gid))
+                for obj in layer
+                if getattr(obj, "gid", None)
+            ]
+            layers.append(CompiledLayer(LAYER_OBJECTS, objects=objects))
+        elif isinstance(layer, TiledImageLayer):
+            layers.append(
+                CompiledLayer(LAYER_IMAGE, image_gid=getattr(layer, "gid", 0) or 0)
+            )
+
+    return CompiledMap(
+        width=map_data.width,
+        height=map_data.height,
+        tilewidth=map_data.tilewidth,
+        tileheight=map_data.tileheight,
+        image_files=image_files,
+        images=list(map_data.images),
+        layers=layers,
+        dependencies=_collect_dependencies(tmx_path),
+    )
+
+
+def _pack(flags) -> int:
+    if not flags:
+        return 0
+    return (
+        (FLIP_H if flags.flipped_horizontally else 0)
+        | (FLIP_V if flags.flipped_vertically else 0)
+        | (FLIP_D if flags.flipped_diagonally else 0)
+    )
+
+
+def _collect_dependencies(tmx_path: str) -> List[Tuple[str, int]]:
+    base_dir = os.path.dirname(tmx_path)
+    with open(tmx_path, "rb") as f:
+        tsx_sources = [m.decode() for m in _TSX_SOURCE.findall(f.read())]
+
+    dependencies = []
+    for relative in [os.path.basename(tmx_path), *tsx_sources]:
+        path = os.path.join(base_dir, relative)
+        dependencies.append((relative, os.stat(path).st_mtime_ns))
+    return dependencies
+
+
+def _dependencies_match(base_dir: str, dependencies: List[Tuple[str, int]]) -> bool:
+    for relative, mtime_ns in dependencies:
+        try:
+            if os.stat(os.path.join(base_dir, relative)).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+# ----------------------------------------------------------------------------
+# Serialização (little-endian)
+# ----------------------------------------------------------------------------
+
+
+def _write_str(f: BinaryIO, value: str) -> None:
+    data = value.encode("utf-8")
+    f.write(struct.pack("<H", len(data)))
+    f.write(data)
+
+
+def _read_str(f: BinaryIO) -> str:
+    (length,) = struct.unpack("<H", f.read(2))
+    return f.read(length).decode("utf-8")
+
+
+def _write(f: BinaryIO, compiled: CompiledMap) -> None:
+    f.write(MAGIC)
+    f.write(struct.pack("<H", FORMAT_VERSION))
+
+    f.write(struct.pack("<H", len(compiled.dependencies)))
+    for relative, mtime_ns in compiled.dependencies:
+        _write_str(f, relative)
+        f.write(struct.pack("<q", mtime_ns))
+
+    f.write(
+        struct.pack(
+            "<4H",
+            compiled.width,
+            compiled.height,
+            compiled.tilewidth,
+            compiled.tileheight,
+        )
+    )
+
+    f.write(struct.pack("<H", len(compiled.image_files)))
+    for relative, colorkey in compiled.image_files:
+        _write_str(f, relative)
+        _write_str(f, colorkey)
+
+    f.write(struct.pack("<I", len(compiled.images)))
+    for ref in compiled.images:
+        if ref is None:
+            f.write(struct.pack("<i4iB", -1, 0, 0, 0, 0, 0))
+        elif ref.rect is None:
+            f.write(struct.pack("<i4iB", ref.file_index, 0, 0, -1, -1, ref.flags))
+        else:
+            f.write(struct.pack("<i4iB", ref.file_index, *ref.rect, ref.flags))
+
+    f.write(struct.pack("<H", len(compiled.layers)))
+    for layer in compiled.layers:
+        f.write(struct.pack("<B", layer.kind))
+        _write_str(f, layer.type)
+        if layer.kind == LAYER_TILES:
+            gids = array("I", layer.gids)
+            if gids.itemsize != 4:
+                raise ValueError("unsupported array item size")
+            if sys.byteorder == "big":
+                gids.byteswap()
+            f.write(struct.pack("<I", len(gids)))
+            f.write(gids.tobytes())
+        elif layer.kind == LAYER_OBJECTS:
+            f.write(struct.pack("<I", len(layer.objects)))
+            for x, y, gid in layer.objects:
+                f.write(struct.pack("<2dI", x, y, gid))
+        elif layer.kind == LAYER_IMAGE:
+            f.write(struct.pack("<I", layer.image_gid))
+
+
+def _read(f: BinaryIO) -> CompiledMap:
+    if f.read(4) != MAGIC:
+        raise ValueError("not a compiled tilemap")
+    (version,) = struct.unpack("<H", f.read(2))
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported compiled tilemap version {version}")
+
+    (dependency_count,) = struct.unpack("<H", f.read(2))
+    dependencies = []
+    for _ in range(dependency_count):
+        relative = _read_str(f)
+        (mtime_ns,) = struct.unpack("<q", f.read(8))
+        dependencies.append((relative, mtime_ns))
+
+    width, height, tilewidth, tileheight = struct.unpack("<4H", f.read(8))
+
+    (file_count,) = struct.unpack("<H", f.read(2))
+    image_files = [(_read_str(f), _read_str(f)) for _ in range(file_count)]
+
+    (image_count,) = struct.unpack("<I", f.read(4))
+    record = struct.Struct("<i4iB")
+    images: List[Optional[TileImageRef]] = []
+    for _ in range(image_count):
+        file_index, x, y, w, h, flags = record.unpack(f.read(record.size))
+        if file_index < 0:
+            images.append(None)
+        elif w < 0:
+            images.append(TileImageRef(file_index, None, flags))
+        else:
+            images.append(TileImageRef(file_index, (x, y, w, h), flags))
+
+    (layer_count,) = struct.unpack("<H", f.read(2))
+    layers = []
+    for _ in range(layer_count):
+        (kind,) = struct.unpack("<B", f.read(1))
+        layer = CompiledLayer(kind, type=_read_str(f))
+        if kind == LAYER_TILES:
+            (count,) = struct.unpack("<I", f.read(4))
+            layer.gids.frombytes(f.read(count * 4))
+            if sys.byteorder == "big":
+                layer.gids.byteswap()
+        elif kind == LAYER_OBJECTS:
+            (count,) = struct.unpack("<I", f.read(4))
+            for _ in range(count):
+                x, y, gid = struct.unpack("<2dI", f.read(20))
+                layer.objects.append((x, y, gid))
+        elif kind == LAYER_IMAGE:
+            (layer.image_gid,) = struct.unpack("<I", f.read(4))
+        else:
+            raise ValueError(f"unknown layer kind {kind}")
+        layers.append(layer)
+
+    return CompiledMap(
+        width=width,
+        height=height,
+        tilewidth=tilewidth,
+        tileheight=tileheight,
+        image_files=image_files,
+        images=images,
+        layers=layers,
+        dependencies=dependencies,
+    )
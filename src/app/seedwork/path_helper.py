@@ -1,5 +1,15 @@
+import os
 import sys
+import json
+import logging
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+BAKE_MANIFEST = "manifest.json"
+ASSET_PACK_NAME = "assets.opak"
 
 
 def get_assets_dir() -> Path:
@@ -18,9 +28,121 @@ def get_assets_dir() -> Path:
         return ROOT_DIR / "assets"
 
 
+def get_cache_dir() -> Path:
+    """
+    Retorna a pasta onde o jogo guarda dados derivados dos assets (ex.: mapas
+    compilados). Pode ser trocada pela variável de ambiente ODISSEIA_CACHE_DIR.
+    """
+    override = os.getenv("ODISSEIA_CACHE_DIR")
+    if override:
+        return Path(override)
+
+    if getattr(sys, "frozen", False):
+        # O bundle pode ser somente leitura: usa a pasta de cache do usuário
+        return Path.home() / ".cache" / "odisseia-de-um-prato"
+
+    ROOT_DIR = Path(__file__).parent.parent.parent.parent.resolve()
+    return ROOT_DIR / ".cache"
+
+
+def get_baked_dir() -> Path:
+    """
+    Retorna a pasta com os assets pré-processados pelo comando de bake
+    (``python -m app.seedwork.asset_bake``). Pode ser trocada pela variável de
+    ambiente ODISSEIA_BAKED_DIR.
+    """
+    override = os.getenv("ODISSEIA_BAKED_DIR")
+    if override:
+        return Path(override)
+
+    if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
+        return Path(sys._MEIPASS) / "baked"
+
+    ROOT_DIR = Path(__file__).parent.parent.parent.parent.resolve()
+    return ROOT_DIR / "baked"
+
+
+def get_asset_pack_path() -> Optional[Path]:
+    """
+    Retorna o pacote de assets (``app.seedwork.asset_pack``) a usar no lugar
+    dos arquivos soltos, ou None. A variável de ambiente ODISSEIA_ASSET_PACK
+    aponta um pacote (vazia desliga); sem ela, só o bundle do PyInstaller usa
+    o pacote que levar junto.
+    """
+    override = os.getenv("ODISSEIA_ASSET_PACK")
+    if override is not None:
+        return Path(override) if override else None
+
+    if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
+        bundled = Path(sys._MEIPASS) / ASSET_PACK_NAME
+        return bundled if bundled.exists() else None
+    return None
+
+
+def relative_asset_path(path: str) -> Optional[str]:
+    """Caminho de ``path`` relativo à pasta de assets, com "/", ou None."""
+    relative = os.path.relpath(os.path.abspath(path), _bake_dirs()[0])
+    if relative.startswith(".."):
+        return None
+    return relative.replace(os.sep, "/")
+
+
+@lru_cache(maxsize=1)
+def _bake_dirs() -> Tuple[str, str]:
+    return str(get_assets_dir().resolve()), str(get_baked_dir().resolve())
+
+
+@lru_cache(maxsize=1)
+def load_bake_manifest() -> Dict[str, Any]:
+    manifest_path = get_baked_dir() / BAKE_MANIFEST
+    try:
+        with open(manifest_path) as f:
+            return json.load(f).get("assets", {})
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable bake manifest {manifest_path}: {e}")
+        return {}
+
+
+def clear_bake_cache() -> None:
+    """Esquece o manifest e as pastas já lidos (após um bake, nos testes)."""
+    load_bake_manifest.cache_clear()
+    _bake_dirs.cache_clear()
+
+
+def baked_asset(source: str, variant: str = "") -> Optional[str]:
+    """
+    Retorna a saída pré-processada de ``source`` (``variant`` vazio = o
+    próprio arquivo re-encodado), ou None se ela não existe ou se o original
+    mudou desde o bake.
+    """
+    manifest = load_bake_manifest()
+    if not manifest:
+        return None
+
+    relative = relative_asset_path(source)
+    entry = manifest.get(relative) if relative else None
+    if entry is None or variant not in entry["outputs"]:
+        return None
+
+    stat = os.stat(source)
+    # Bundles extraídos ganham mtimes novos: lá só o tamanho é conferido
+    if stat.st_size != entry["size"] or (
+        not getattr(sys, "frozen", False) and stat.st_mtime_ns != entry["mtime_ns"]
+    ):
+        logger.debug(f"Stale baked asset ignored: {relative}")
+        return None
+
+    baked = os.path.join(_bake_dirs()[1], entry["outputs"][variant])
+    return baked if os.path.exists(baked) else None
+
+
 def asset_path(*paths: str) -> str:
     """
-    Monta o caminho absoluto para um asset.
+    Monta o caminho absoluto para um asset. Se o bake gerou uma versão
+    re-encodada dele (ex.: fundos em BMP, músicas em OGG), retorna essa; com
+    um pacote de assets escolhido, o original, que é a chave no pacote.
 
     Args:
         *paths: Segmentos do caminho para juntar.
@@ -36,4 +158,6 @@ def asset_path(*paths: str) -> str:
     if not full_path.exists():
         raise FileNotFoundError(f"Asset not found: {full_path}")
 
-    return str(full_path)
+    if get_asset_pack_path() is not None:
+        return str(full_path)
+    return baked_asset(str(full_path)) or str(full_path)
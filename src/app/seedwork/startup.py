@@ -0,0 +1,525 @@
+"""
+Inicialização do pygame numa ordem só e relatório de tempo do startup.
+
+Cada módulo do pplay chamava ``pygame.init()`` ao ser importado, subindo
+todos os subsistemas do SDL (joystick, câmera...) várias vezes. Agora
+``init_pygame`` sobe só o que o jogo usa, uma vez, na ordem de SUBSYSTEMS.
+
+Com ODISSEIA_STARTUP_REPORT=1 o ``main`` instala ``startup_report`` antes
+dos outros imports: o import de cada módulo, cada subsistema e cada fase do
+startup (``phase``) são medidos, e no primeiro quadro apresentado o
+relatório vai para o log ou para o arquivo indicado na variável (JSON se o
+nome terminar em .json). No Linux os tempos contam do início do processo,
+então incluem o interpretador e, no executável do PyInstaller, o bootloader;
+nos outros sistemas, do import deste módulo.
+
+Com ODISSEIA_STARTUP_EXIT=1 o jogo fecha logo depois desse quadro. É o que
+``python -m app.seedwork.startup`` usa para rodar o jogo headless várias
+vezes e comparar as medianas de cada fase:
+
+    cd src && python -m app.seedwork.startup --runs 10 --output startup.json
+    python -m app.seedwork.startup --command "'dist/A Odisseia de um Prato/A Odisseia de um Prato'"
+
+Este módulo só importa a biblioteca padrão no topo: o ``pygame`` entra
+depois, já medido.
+"""
+
+import argparse
+import contextlib
+import importlib.abc
+import json
+import logging
+import os
+import shlex
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+STARTUP_REPORT_ENV = "ODISSEIA_STARTUP_REPORT"
+STARTUP_EXIT_ENV = "ODISSEIA_STARTUP_EXIT"
+
+_ENABLED_VALUES = ("1", "true", "yes", "on")
+
+# Fase implícita: do início do processo até o relatório ser instalado
+INTERPRETER_PHASE = "interpreter"
+# Fase implícita: da última fase medida até o primeiro quadro na tela
+FIRST_FRAME_PHASE = "first_frame"
+
+# Na ordem de inicialização: a fonte e o mixer não dependem do display, mas
+# o display é o que mais pesa e o que falha primeiro sem vídeo
+SUBSYSTEMS: Sequence[str] = ("display", "font", "mixer")
+
+# Módulos mostrados no relatório (os mais lentos, pelo tempo próprio)
+REPORT_TOP_MODULES = 25
+
+# Execuções do jogo headless que ``python -m app.seedwork.startup`` agrega
+DEFAULT_RUNS = 5
+RUN_TIMEOUT = 120
+
+SRC_DIR = Path(__file__).resolve().parent.parent.parent
+
+_NO_PHASE = contextlib.nullcontext()
+
+
+@dataclass
+class ModuleTiming:
+    name: str
+    # Tempo total do import, incluindo os módulos que ele importou
+    cumulative: float = 0.0
+    # Só o corpo do próprio módulo
+    own: float = 0.0
+
+
+@dataclass
+class PhaseTiming:
+    name: str
+    # Segundos desde a origem do relatório (o início do processo)
+    start: float
+    duration: float
+    # Fases abertas dentro de outra (ex.: os menus dentro do Game)
+    depth: int = 0
+
+    @property
+    def end(self) -> float:
+        return self.start + self.duration
+
+
+def _process_start() -> Tuple[float, str]:
+    """
+    Instante (no relógio de ``perf_counter``) em que o processo começou. No
+    Linux vem do /proc, com a resolução do clock tick (10 ms); fora dele, do
+    import deste módulo.
+    """
+    now = time.perf_counter()
+    try:
+        with open("/proc/self/stat") as f:
+            # O nome do processo pode ter espaços: os campos vêm depois do ")"
+            fields = f.read().rpartition(")")[2].split()
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        started = int(fields[19]) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return now, "module import"
+    return now - max(0.0, uptime - started), "process start"
+
+
+_ORIGIN, _ORIGIN_LABEL = _process_start()
+
+
+@dataclass
+class StartupReport:
+    modules: Dict[str, ModuleTiming] = field(default_factory=dict)
+    init: Dict[str, float] = field(default_factory=dict)
+    phases: List[PhaseTiming] = field(default_factory=list)
+    # Soma dos imports de primeiro nível (os aninhados já estão dentro deles)
+    imports: float = 0.0
+    installed: bool = False
+    # Segundos da origem até o primeiro quadro apresentado
+    first_frame: Optional[float] = None
+    origin: float = _ORIGIN
+    origin_label: str = _ORIGIN_LABEL
+    # Pilha de imports em andamento, por thread: [início, tempo dos aninhados]
+    _local: threading.local = field(default_factory=threading.local)
+    _open_phases: int = 0
+
+    def install(self) -> None:
+        """Passa a medir os imports e as fases feitos daqui em diante."""
+        if not self.installed:
+            sys.meta_path.insert(0, _ImportTimer(self))
+            self.installed = True
+            if not self.phases:
+                self.phases.append(PhaseTiming(INTERPRETER_PHASE, 0.0, self._now()))
+
+    def install_if_enabled(self) -> None:
+        if os.getenv(STARTUP_REPORT_ENV):
+            self.install()
+
+    @property
+    def waiting_first_frame(self) -> bool:
+        return self.installed and self.first_frame is None
+
+    @property
+    def exit_after_first_frame(self) -> bool:
+        return os.getenv(STARTUP_EXIT_ENV, "").lower() in _ENABLED_VALUES
+
+    def phase(self, name: str) -> ContextManager[None]:
+        """Mede o bloco ``with`` como uma fase; sem relatório, não faz nada."""
+        if not self.installed:
+            return _NO_PHASE
+        return self._timed_phase(name)
+
+    @contextlib.contextmanager
+    def _timed_phase(self, name: str):
+        timing = PhaseTiming(name, self._now(), 0.0, self._open_phases)
+        # Na ordem em que começaram, mesmo que terminem depois das aninhadas
+        self.phases.append(timing)
+        self._open_phases += 1
+        try:
+            yield
+        finally:
+            self._open_phases -= 1
+            timing.duration = self._now() - timing.start
+
+    def frame_presented(self) -> None:
+        """Marca o primeiro quadro na tela e grava o relatório (uma vez só)."""
+        if not self.waiting_first_frame:
+            return
+        self.first_frame = self._now()
+        measured = [timing.end for timing in self.phases if timing.depth == 0]
+        last_end = max(measured, default=0.0)
+        self.phases.append(
+            PhaseTiming(FIRST_FRAME_PHASE, last_end, self.first_frame - last_end)
+        )
+        self.write()
+
+    def _now(self) -> float:
+        return time.perf_counter() - self.origin
+
+    def uninstall(self) -> None:
+        sys.meta_path[:] = [
+            finder for finder in sys.meta_path if not isinstance(finder, _ImportTimer)
+        ]
+        self.installed = False
+
+    def measure_init(self, name: str, function: Callable[[], None]) -> None:
+        started = time.perf_counter()
+        try:
+            function()
+        finally:
+            self.init[name] = time.perf_counter() - started
+
+    def lines(self, top: int = REPORT_TOP_MODULES) -> List[str]:
+        lines = []
+        if self.first_frame is not None:
+            lines.append(
+                f"Startup: first frame at {1000 * self.first_frame:.0f} ms"
+                f" (since {self.origin_label})"
+            )
+        if self.phases:
+            lines.append("  phases (start / duration):")
+            for timing in self.phases:
+                name = "  " * timing.depth + timing.name
+                lines.append(
+                    f"    {name:<32} {1000 * timing.start:8.1f} ms"
+                    f" {1000 * timing.duration:8.1f} ms"
+                )
+
+        lines.append(f"  imports {1000 * self.imports:.0f} ms")
+
+        packages: Dict[str, float] = {}
+        for timing in self.modules.values():
+            package = timing.name.partition(".")[0]
+            packages[package] = packages.get(package, 0.0) + timing.own
+        lines.append("  by package (own time):")
+        for package, own in sorted(packages.items(), key=lambda item: -item[1])[:10]:
+            lines.append(f"    {package:<32} {1000 * own:8.1f} ms")
+
+        lines.append("  slowest modules (own / cumulative):")
+        slowest = sorted(self.modules.values(), key=lambda timing: -timing.own)
+        for timing in slowest[:top]:
+            lines.append(
+                f"    {timing.name:<40} {1000 * timing.own:8.1f} ms"
+                f" {1000 * timing.cumulative:8.1f} ms"
+            )
+
+        if self.init:
+            lines.append(f"  init {1000 * sum(self.init.values()):.0f} ms:")
+            for name, seconds in self.init.items():
+                lines.append(f"    {name:<32} {1000 * seconds:8.1f} ms")
+        return lines
+
+    def to_dict(self, top: int = REPORT_TOP_MODULES) -> Dict[str, Any]:
+        """Versão JSON do relatório, em milissegundos."""
+        slowest = sorted(self.modules.values(), key=lambda timing: -timing.own)
+        return {
+            "origin": self.origin_label,
+            "first_frame_ms": _ms(self.first_frame),
+            "imports_ms": _ms(self.imports),
+            "phases": [
+                {
+                    "name": timing.name,
+                    "depth": timing.depth,
+                    "start_ms": _ms(timing.start),
+                    "duration_ms": _ms(timing.duration),
+                }
+                for timing in self.phases
+            ],
+            "init_ms": {name: _ms(seconds) for name, seconds in self.init.items()},
+            "modules": [
+                {
+                    "name": timing.name,
+                    "own_ms": _ms(timing.own),
+                    "cumulative_ms": _ms(timing.cumulative),
+                }
+                for timing in slowest[:top]
+            ],
+        }
+
+    def write(self) -> None:
+        """Grava o relatório no arquivo da variável de ambiente ou no log."""
+        if not self.installed:
+            return
+        target = os.getenv(STARTUP_REPORT_ENV, "")
+        if target and target.lower() not in _ENABLED_VALUES:
+            if target.endswith(".json"):
+                text = json.dumps(self.to_dict(), indent=2)
+            else:
+                text = "\n".join(self.lines())
+            try:
+                with open(target, "w") as f:
+                    f.write(text + "\n")
+                logger.info(f"Startup report written to {target}")
+                return
+            except OSError as e:
+                logger.error(f"Could not write startup report to {target}: {e}")
+        logger.info("\n".join(self.lines()))
+
+    def _begin(self) -> None:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append([time.perf_counter(), 0.0])
+
+    def _end(self, name: str) -> None:
+        stack = self._local.stack
+        started, nested = stack.pop()
+        elapsed = time.perf_counter() - started
+        self.modules[name] = ModuleTiming(name, elapsed, elapsed - nested)
+        if stack:
+            stack[-1][1] += elapsed
+        else:
+            self.imports += elapsed
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Repassa tudo ao loader original, medindo ``exec_module``."""
+
+    def __init__(self, loader: importlib.abc.Loader, report: StartupReport):
+        self._loader = loader
+        self._report = report
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        self._report._begin()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._report._end(module.__name__)
+
+    def __getattr__(self, name: str):
+        return getattr(self._loader, name)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    def __init__(self, report: StartupReport):
+        self._report = report
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self._report)
+            return spec
+        return None
+
+
+def import_pygame():
+    """
+    Importa o pygame sem o ``pkg_resources``: o ``pygame.pkgdata`` o tenta
+    primeiro (~200 ms de import, e só para achar a fonte padrão) e tem
+    fallback próprio quando ele não existe.
+    """
+    if "pygame" in sys.modules:
+        return sys.modules["pygame"]
+
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    blocked = "pkg_resources" not in sys.modules
+    if blocked:
+        sys.modules["pkg_resources"] = None  # type: ignore[assignment]
+    try:
+        import pygame
+    finally:
+        if blocked:
+            del sys.modules["pkg_resources"]
+    return pygame
+
+
+def init_pygame(report: Optional[StartupReport] = None) -> None:
+    """Sobe os subsistemas de SUBSYSTEMS que ainda não estão no ar."""
+    pygame = import_pygame()
+    report = report or startup_report
+
+    steps: Dict[str, Tuple[Callable[[], bool], Callable[[], None]]] = {
+        "display": (pygame.display.get_init, pygame.display.init),
+        "font": (pygame.font.get_init, pygame.font.init),
+        "mixer": (lambda: bool(pygame.mixer.get_init()), _init_mixer),
+    }
+    for name in SUBSYSTEMS:
+        initialized, init = steps[name]
+        if not initialized():
+            report.measure_init(f"pygame.{name}", init)
+
+
+def _init_mixer() -> None:
+    # O AudioManager é o único que inicializa o mixer (com a configuração dele)
+    from app.seedwork.audio_manager import audio_manager
+
+    audio_manager.init()
+
+
+# Instância única, instalada pelo main quando o relatório está ligado
+startup_report = StartupReport()
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(1000 * seconds, 3)
+
+
+def run_headless(
+    command: Sequence[str], runs: int = DEFAULT_RUNS, display: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Roda ``command`` (o jogo) ``runs`` vezes com o relatório em JSON e a
+    saída depois do primeiro quadro, e devolve os relatórios.
+    """
+    reports = []
+    with tempfile.TemporaryDirectory() as directory:
+        for run in range(runs):
+            target = Path(directory) / f"startup_{run}.json"
+            env = dict(os.environ, **{STARTUP_REPORT_ENV: str(target)})
+            env[STARTUP_EXIT_ENV] = "1"
+            env.setdefault("PYTHONPATH", str(SRC_DIR))
+            if not display:
+                env.setdefault("SDL_VIDEODRIVER", "dummy")
+                env.setdefault("SDL_AUDIODRIVER", "dummy")
+            finished = subprocess.run(
+                list(command),
+                env=env,
+                cwd=SRC_DIR,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                timeout=RUN_TIMEOUT,
+            )
+            if not target.exists():
+                raise RuntimeError(
+                    f"Run {run} wrote no startup report "
+                    f"(exit code {finished.returncode}):\n{finished.stderr}"
+                )
+            reports.append(json.loads(target.read_text()))
+    return reports
+
+
+def summarize(reports: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """Medianas do primeiro quadro e de cada fase, na ordem das fases."""
+    frames = [report["first_frame_ms"] for report in reports]
+    phases: Dict[str, Dict[str, Any]] = {}
+    for report in reports:
+        for timing in report["phases"]:
+            samples = phases.setdefault(
+                timing["name"], {"depth": timing["depth"], "start": [], "duration": []}
+            )
+            samples["start"].append(timing["start_ms"])
+            samples["duration"].append(timing["duration_ms"])
+    return {
+        "runs": len(reports),
+        "origin": reports[0]["origin"] if reports else None,
+        "first_frame_ms": {
+            "median": statistics.median(frames),
+            "min": min(frames),
+            "max": max(frames),
+        },
+        "imports_ms": statistics.median(report["imports_ms"] for report in reports),
+        "phases": {
+            name: {
+                "depth": samples["depth"],
+                "start_ms": statistics.median(samples["start"]),
+                "duration_ms": statistics.median(samples["duration"]),
+            }
+            for name, samples in phases.items()
+        },
+    }
+
+
+def summary_lines(
+    summary: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None
+) -> List[str]:
+    frame = summary["first_frame_ms"]
+    lines = [
+        f"First frame over {summary['runs']} runs (since {summary['origin']}):"
+        f" median {frame['median']:.0f} ms, min {frame['min']:.0f}"
+        f", max {frame['max']:.0f}"
+    ]
+    previous = (baseline or {}).get("phases", {})
+    if baseline:
+        delta = frame["median"] - baseline["first_frame_ms"]["median"]
+        lines[0] += f" ({delta:+.0f} ms vs baseline)"
+
+    lines.append("  phase medians (start / duration):")
+    for name, timing in summary["phases"].items():
+        label = "  " * timing["depth"] + name
+        line = (
+            f"    {label:<24} {timing['start_ms']:8.1f} ms"
+            f" {timing['duration_ms']:8.1f} ms"
+        )
+        if name in previous:
+            delta = timing["duration_ms"] - previous[name]["duration_ms"]
+            line += f" {delta:+8.1f} ms"
+        lines.append(line)
+    lines.append(f"  imports {summary['imports_ms']:.0f} ms")
+    return lines
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Mede o startup do jogo até o primeiro quadro, headless"
+    )
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument(
+        "--command",
+        default=None,
+        help="comando do jogo (ex.: o executável do PyInstaller);"
+        " padrão: python -m app.main",
+    )
+    parser.add_argument("--display", action="store_true", help="usa o vídeo real")
+    parser.add_argument("--output", default=None, help="grava o resumo em JSON")
+    parser.add_argument("--baseline", default=None, help="resumo anterior (JSON)")
+    args = parser.parse_args()
+
+    command = (
+        shlex.split(args.command)
+        if args.command
+        else [sys.executable, "-m", "app.main"]
+    )
+    reports = run_headless(command, args.runs, args.display)
+    summary = summarize(reports)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print("\n".join(summary_lines(summary, baseline)))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({**summary, "reports": reports}, f, indent=2)
+        print(f"Summary written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
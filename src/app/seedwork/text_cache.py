@@ -0,0 +1,105 @@
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Tuple
+import pygame
+
+logger = logging.getLogger(__name__)
+
+FontKey = Tuple[str, int, bool, bool]
+Color = Tuple[int, ...]
+
+DEFAULT_TEXT_CACHE_BYTES = 8 * 1024 * 1024
+
+
+class FontRegistry:
+    """Resolve cada (nome, tamanho, negrito, itálico) uma única vez."""
+
+    def __init__(self) -> None:
+        self._fonts: Dict[FontKey, pygame.font.Font] = {}
+        self.lookups = 0
+
+    def get(
+        self, name: str, size: int, bold: bool = False, italic: bool = False
+    ) -> pygame.font.Font:
+        key = (name, size, bold, italic)
+        font = self._fonts.get(key)
+        if font is None:
+            # SysFont varre as fontes do sistema: caro, só acontece uma vez por chave
+            self.lookups += 1
+            font = pygame.font.SysFont(name, size, bold, italic)
+            self._fonts[key] = font
+        return font
+
+
+@dataclass
+class TextCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    resident_bytes: int = 0
+
+
+class TextCache:
+    """
+    Cache LRU de textos já rasterizados, limitado por bytes.
+
+    A chave é (texto, fonte, cor, antialias); as superfícies devolvidas são
+    compartilhadas e não devem ser alteradas.
+    """
+
+    def __init__(
+        self, fonts: FontRegistry, max_bytes: int = DEFAULT_TEXT_CACHE_BYTES
+    ) -> None:
+        self.fonts = fonts
+        self.max_bytes = max_bytes
+        self.stats = TextCacheStats()
+        self._surfaces: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+
+    def render(
+        self,
+        text: str,
+        font_name: str,
+        size: int,
+        color: Color = (0, 0, 0),
+        bold: bool = False,
+        italic: bool = False,
+        antialias: bool = True,
+    ) -> pygame.Surface:
+        key = (text, (font_name, size, bold, italic), tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.stats.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.stats.misses += 1
+        font = self.fonts.get(font_name, size, bold, italic)
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        self.stats.resident_bytes += _surface_bytes(surface)
+        self._evict()
+        return surface
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+        self.stats.resident_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def _evict(self) -> None:
+        # Sempre mantém ao menos a entrada mais recente, mesmo acima do limite
+        while self.stats.resident_bytes > self.max_bytes and len(self._surfaces) > 1:
+            _, surface = self._surfaces.popitem(last=False)
+            self.stats.resident_bytes -= _surface_bytes(surface)
+            self.stats.evictions += 1
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+# Instâncias compartilhadas por todos os pontos que desenham texto
+font_registry = FontRegistry()
+text_cache = TextCache(font_registry)
@@ -1,27 +1,104 @@
 # type: ignore
-from typing import List, Tuple
+import os
+from dataclasses import dataclass
+from typing import List, Optional, Tuple, Union
+import numpy as np
 from pygame.sprite import Group
+from pygame.surface import Surface
 from app.seedwork.path_helper import asset_path
-from pytmx.util_pygame import load_pygame
-from pytmx import TiledTileLayer, TiledObjectGroup, TiledImageLayer, TiledMap
+from app.seedwork.asset_cache import AssetKey
+from app.seedwork.tileset_cache import tileset_cache, tileset_key
+from app.seedwork.compiled_tilemap import (
+    LAYER_IMAGE,
+    LAYER_OBJECTS,
+    LAYER_TILES,
+    FLIP_D,
+    FLIP_H,
+    FLIP_V,
+    CompiledMap,
+    load_compiled_map,
+)
+from pytmx import (
+    TiledTileLayer,
+    TiledObjectGroup,
+    TiledImageLayer,
+    TiledMap,
+    TileFlags,
+)
 from app.entities.tile import Tile
 from app.entities.background_tile import BackgroundTile
 from app.core.tilemap_group import TilemapGroup
+from app.core.solid_grid import SolidGrid
+from app.core.tile_layer import TileLayer
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Camadas interactive-block viram TileLayer; as demais, grupos de sprites
+Layer = Union[Group, TileLayer]
 
-def load_tilemap_groups(map_name: str) -> List[Tuple[TilemapGroup, Group]]:
+
+@dataclass
+class Tilemap:
+    layers: List[Tuple[TilemapGroup, Layer]]
+    # Células das camadas interactive-block: o que o jogador colide
+    solid: SolidGrid
+
+
+def load_tilemap(map_name: str) -> Tilemap:
     map_path = asset_path("tilemaps", f"{map_name}.tmx")
     logger.info(f"Loading tilemap from: {map_path}")
-    map_data = load_pygame(map_path)
 
-    ordered_groups: List[Tuple[TilemapGroup, Group]] = []
+    try:
+        compiled = load_compiled_map(map_path)
+    except Exception:
+        logger.warning(
+            f"Could not use compiled tilemap for {map_name}, parsing TMX",
+            exc_info=True,
+        )
+        return load_tilemap_from_tmx(map_name)
+
+    return _build_tilemap(compiled, os.path.dirname(map_path))
+
+
+def load_tilemap_groups(map_name: str) -> List[Tuple[TilemapGroup, Layer]]:
+    return load_tilemap(map_name).layers
+
+
+def tilesets(map_name: str) -> List[Tuple[str, str]]:
+    """Imagens dos tilesets do mapa e o colorkey de cada uma ("" = nenhum)."""
+    map_path = asset_path("tilemaps", f"{map_name}.tmx")
+    base_dir = os.path.dirname(map_path)
+    compiled = load_compiled_map(map_path)
+    return [
+        (os.path.join(base_dir, relative), colorkey)
+        for relative, colorkey in compiled.image_files
+    ]
+
+
+def tileset_paths(map_name: str) -> List[str]:
+    """Imagens que ``load_tilemap_groups`` lê para montar o mapa."""
+    return [path for path, _ in tilesets(map_name)]
+
+
+def tileset_keys(map_name: str) -> List[AssetKey]:
+    """Chaves no ``AssetCache`` dos tilesets do mapa (para fixá-los)."""
+    return [tileset_key(path, colorkey) for path, colorkey in tilesets(map_name)]
+
+
+def load_tilemap_from_tmx(map_name: str) -> Tilemap:
+    """Caminho original: o XML lido pelo pytmx a cada carga."""
+    map_path = asset_path("tilemaps", f"{map_name}.tmx")
+    map_data = TiledMap(map_path, image_loader=tileset_cache.loader)
+
+    ordered_groups: List[Tuple[TilemapGroup, Layer]] = []
+    solid = SolidGrid(
+        map_data.width, map_data.height, map_data.tilewidth, map_data.tileheight
+    )
 
     for layer in map_data.visible_layers:
         if isinstance(layer, TiledTileLayer):
-            group_key, group = _process_tile_layer(layer, map_data)
+            group_key, group = _process_tile_layer(layer, map_data, solid)
             ordered_groups.append((group_key, group))
         elif isinstance(layer, TiledObjectGroup):
             group = _process_object_group(layer, map_data)
@@ -30,19 +107,104 @@ def load_tilemap_groups(map_name: str) -> List[Tuple[TilemapGroup, Group]]:
             group = _process_image_layer(layer)
             ordered_groups.append((TilemapGroup.BACKGROUND, group))
 
-    return ordered_groups
+    return Tilemap(ordered_groups, solid)
+
+
+def load_tilemap_groups_from_tmx(map_name: str) -> List[Tuple[TilemapGroup, Layer]]:
+    return load_tilemap_from_tmx(map_name).layers
+
+
+def _build_tilemap(compiled: CompiledMap, base_dir: str) -> Tilemap:
+    images = _load_compiled_images(compiled, base_dir)
+    ordered_groups: List[Tuple[TilemapGroup, Layer]] = []
+    solid = SolidGrid(
+        compiled.width, compiled.height, compiled.tilewidth, compiled.tileheight
+    )
+
+    for layer in compiled.layers:
+        if layer.kind == LAYER_TILES and layer.type == "interactive-block":
+            # Só entra na composição estática: gids e tiles compartilhados
+            tiles = TileLayer(
+                np.frombuffer(layer.gids, dtype=np.dtype(layer.gids.typecode)),
+                images,
+                compiled.width,
+                compiled.height,
+                compiled.tilewidth,
+                compiled.tileheight,
+            )
+            solid.mask |= tiles.mask
+            ordered_groups.append((TilemapGroup.INTERACTIVE_BLOCK, tiles))
+
+        elif layer.kind == LAYER_TILES:
+            group = Group()
+            for index, gid in enumerate(layer.gids):
+                if gid and images[gid]:
+                    y, x = divmod(index, compiled.width)
+                    tile = Tile(
+                        x * compiled.tilewidth, y * compiled.tileheight, images[gid]
+                    )
+                    group.add(tile)
+            ordered_groups.append((TilemapGroup.SCENERY_BLOCK, group))
+
+        elif layer.kind == LAYER_OBJECTS:
+            group = Group()
+            for x, y, gid in layer.objects:
+                surf = images[gid]
+                if surf:
+                    group.add(Tile(x, y - surf.get_height(), surf))
+            ordered_groups.append((TilemapGroup.SCENERY_OBJECT, group))
+
+        elif layer.kind == LAYER_IMAGE:
+            group = Group()
+            if layer.image_gid and images[layer.image_gid]:
+                group.add(BackgroundTile(images[layer.image_gid]))
+            ordered_groups.append((TilemapGroup.BACKGROUND, group))
+
+    return Tilemap(ordered_groups, solid)
+
+
+def _load_compiled_images(
+    compiled: CompiledMap, base_dir: str
+) -> List[Optional[Surface]]:
+    # Os tiles saem do cache de tilesets, compartilhados com os outros mapas
+    loaders = [
+        tileset_cache.loader(os.path.join(base_dir, relative), colorkey or None)
+        for relative, colorkey in compiled.image_files
+    ]
+
+    images: List[Optional[Surface]] = []
+    for ref in compiled.images:
+        if ref is None:
+            images.append(None)
+        elif ref.rect is None:
+            images.append(loaders[ref.file_index]())
+        else:
+            flags = TileFlags(
+                bool(ref.flags & FLIP_H),
+                bool(ref.flags & FLIP_V),
+                bool(ref.flags & FLIP_D),
+            )
+            images.append(loaders[ref.file_index](ref.rect, flags))
+    return images
 
 
 def _process_tile_layer(
-    layer: TiledTileLayer, map_data: TiledMap
-) -> Tuple[TilemapGroup, Group]:
+    layer: TiledTileLayer, map_data: TiledMap, solid: SolidGrid
+) -> Tuple[TilemapGroup, Layer]:
     layer_type = layer.properties.get("type")
 
     # Determina o tipo de grupo baseado nas propriedades da camada
     if layer_type == "interactive-block":
-        group_key = TilemapGroup.INTERACTIVE_BLOCK
-    else:
-        group_key = TilemapGroup.SCENERY_BLOCK
+        tiles = TileLayer(
+            np.array(layer.data),
+            map_data.images,
+            map_data.width,
+            map_data.height,
+            map_data.tilewidth,
+            map_data.tileheight,
+        )
+        solid.mask |= tiles.mask
+        return TilemapGroup.INTERACTIVE_BLOCK, tiles
 
     group = Group()
     for x, y, surf in layer.tiles():
@@ -50,7 +212,7 @@ def _process_tile_layer(
             tile = Tile(x * map_data.tilewidth, y * map_data.tileheight, surf)
             group.add(tile)
 
-    return group_key, group
+    return TilemapGroup.SCENERY_BLOCK, group
 
 
 def _process_object_group(layer: TiledObjectGroup, map_data: TiledMap) -> Group:
@@ -0,0 +1,153 @@
+"""
+Tilesets compartilhados entre os mapas.
+
+Os oito mapas usam só quatro tilesets (e quatro imagens de fundo). Cada
+imagem vira um atlas convertido uma vez por processo, e cada tile é uma
+subsuperfície dele: os mapas que usam o mesmo tileset recebem as mesmas
+superfícies, sem decodificar, fatiar nem copiar nada depois da primeira
+carga. Só os tiles espelhados ou rotacionados ganham superfície própria,
+também guardada.
+
+Os tilesets moram no ``AssetCache`` (chave ``tileset_key``), então entram no
+orçamento de memória dele: um tileset fora da cena atual pode ser descartado
+e volta a ser decodificado quando um mapa precisar dele. O nível na tela
+fixa os seus com ``AssetCache.pin``.
+
+``loader`` tem a interface de ``image_loader`` do pytmx, então o caminho
+compilado e o TMX montam os tiles do mesmo jeito.
+"""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Sequence, Tuple
+import pygame
+from pytmx.util_pygame import handle_transformation
+from app.seedwork.asset_cache import AssetCache, AssetKey, asset_cache
+
+logger = logging.getLogger(__name__)
+
+Rect = Tuple[int, int, int, int]
+# Retângulo no atlas (None = a imagem inteira) e flags de espelhamento
+TileKey = Tuple[Optional[Rect], Tuple[bool, ...]]
+
+# Mesmo limiar do smart_convert do pytmx para considerar um pixel opaco
+_OPAQUE_THRESHOLD = 254
+
+
+@dataclass
+class TilesetStats:
+    hits: int = 0
+    misses: int = 0
+    # Atlas montados (de novo, se o orçamento do AssetCache descartou algum)
+    atlases: int = 0
+
+
+@dataclass
+class _Tileset:
+    atlas: pygame.Surface
+    tiles: Dict[TileKey, pygame.Surface] = field(default_factory=dict)
+    # O que o orçamento do AssetCache conta: os pixels do atlas
+    nbytes: int = 0
+
+
+def tileset_key(path: str, colorkey: Optional[str] = None) -> AssetKey:
+    return ("tileset", os.path.abspath(path), colorkey or "")
+
+
+class TilesetCache:
+    """
+    Tiles fatiados dos tilesets do ``AssetCache``. As superfícies são
+    compartilhadas entre os mapas e não devem ser alteradas por quem as
+    recebe. Pode ser usado pela thread de pré-carregamento de níveis.
+    """
+
+    def __init__(self, cache: AssetCache = asset_cache) -> None:
+        self.cache = cache
+        self.stats = TilesetStats()
+        self._lock = threading.RLock()
+
+    def loader(
+        self, path: str, colorkey: Optional[str] = None, **kwargs
+    ) -> Callable[..., pygame.Surface]:
+        """``image_loader`` do pytmx: devolve ``load_image(rect, flags)``."""
+        # O mesmo tileset para o mapa inteiro, ainda que o orçamento o descarte
+        tileset = self._tileset(path, colorkey)
+
+        def load_image(
+            rect: Optional[Sequence[int]] = None, flags=None
+        ) -> pygame.Surface:
+            return self._tile(tileset, rect, flags)
+
+        return load_image
+
+    def tile(
+        self,
+        path: str,
+        colorkey: Optional[str] = None,
+        rect: Optional[Sequence[int]] = None,
+        flags=None,
+    ) -> pygame.Surface:
+        return self._tile(self._tileset(path, colorkey), rect, flags)
+
+    def __contains__(self, path: str) -> bool:
+        """Se o tileset (sem colorkey) já está montado."""
+        return tileset_key(path) in self.cache
+
+    def _tile(
+        self, tileset: _Tileset, rect: Optional[Sequence[int]], flags
+    ) -> pygame.Surface:
+        # O pytmx passa TileFlags mesmo sem transformação nenhuma
+        transform = tuple(flags) if flags and any(flags) else ()
+        key: TileKey = (tuple(rect) if rect else None, transform)  # type: ignore
+        with self._lock:
+            surface = tileset.tiles.get(key)
+            if surface is not None:
+                self.stats.hits += 1
+                return surface
+
+            self.stats.misses += 1
+            surface = tileset.atlas.subsurface(rect) if rect else tileset.atlas
+            if transform:
+                surface = handle_transformation(surface, flags)
+            tileset.tiles[key] = surface
+            return surface
+
+    def _tileset(self, path: str, colorkey: Optional[str]) -> _Tileset:
+        return self.cache.get(
+            tileset_key(path, colorkey), lambda: self._build(path, colorkey or "")
+        )
+
+    def _build(self, path: str, colorkey: str) -> _Tileset:
+        # A imagem vem do AssetCache (pacote, bake ou pré-carregada pelo
+        # AssetLoader) e sai dele: fica só o atlas
+        image = self.cache.image(path)
+        atlas = _convert_atlas(image, colorkey)
+        self.cache.release(self.cache.image_key(path), purge=True)
+
+        with self._lock:
+            self.stats.atlases += 1
+        logger.debug(f"Tileset atlas ready: {path} {atlas.get_size()}")
+        return _Tileset(atlas, nbytes=_size_in_bytes(atlas))
+
+
+def _convert_atlas(image: pygame.Surface, colorkey: str) -> pygame.Surface:
+    # O smart_convert do pytmx, uma vez para o atlas e não por tile
+    if colorkey:
+        atlas = image.convert()
+        atlas.set_colorkey(pygame.Color(f"#{colorkey}"))
+        return atlas
+    opaque = pygame.mask.from_surface(image, _OPAQUE_THRESHOLD).count()
+    if opaque == image.get_width() * image.get_height():
+        # Os fundos não têm transparência: blit sem alfa ao compor o nível
+        return image.convert()
+    return image
+
+
+def _size_in_bytes(surface: pygame.Surface) -> int:
+    return surface.get_height() * surface.get_pitch()
+
+
+# Instância única, compartilhada por todos os mapas
+tileset_cache = TilesetCache()
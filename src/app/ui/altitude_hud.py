@@ -27,6 +27,12 @@ class AltitudeHUD:
         ruler_y = margin
         self.ruler_image.set_position(ruler_x, ruler_y)
 
+    def close(self) -> None:
+        if self.is_visible:
+            self.ruler_image.release()
+            self.icon_image.release()
+            self.is_visible = False
+
     def update(self, main_character: Potato, current_level_num: int, max_level: int):
         if not self.is_visible:
             return
@@ -1,20 +1,29 @@
 import logging
 from app.pplay.window import Window
 from app.pplay.sprite import Sprite
-from app.pplay.sound import Sound
+from app.pplay.music import Music
 from app.ui.menu_button import MenuButton
 from app.seedwork.path_helper import asset_path
-from app.core.observer import Observer, Observable
+from app.core.event_bus import EventBus
+from app.core.events import OpenOptions, QuitGame, StartGame
+from app.core.scene_stack import Scene
 
 
-class MainMenu(Observer, Observable):
-    def __init__(self, window: Window, initial_volume: int = 5):
-        Observable.__init__(self)
+class MainMenu(Scene):
+    # Só o hover dos botões muda entre quadros
+    uses_dirty_rects = True
+
+    def __init__(self, window: Window, events: EventBus):
         self.logger = logging.getLogger(__name__)
         self.window = window
 
-        self.menu_music = Sound(asset_path("musics", "menu.mp3"))
-        self.menu_music.set_volume(initial_volume)
+        try:
+            menu_music_path = asset_path("musics", "menu.mp3")
+        except FileNotFoundError as e:
+            # Sem a trilha do menu o jogo segue, só que em silêncio
+            self.logger.warning(f"Menu music unavailable: {e}")
+            menu_music_path = ""
+        self.menu_music = Music(menu_music_path)
         self.menu_music.set_repeat(True)
 
         # Background
@@ -34,28 +43,26 @@ class MainMenu(Observer, Observable):
             asset_path("images", "play_button.png"),
             center_x,
             start_y,
-            "start_game",  # Mensagem a notificar
+            StartGame(),
+            events,
         )
 
         self.options_button = MenuButton(
             asset_path("images", "options_button.png"),
             center_x,
             start_y + button_height + button_spacing,
-            "open_options",  # Mensagem a notificar
+            OpenOptions(),
+            events,
         )
 
         self.quit_button = MenuButton(
             asset_path("images", "quit_button.png"),
             center_x,
             start_y + 2 * (button_height + button_spacing),
-            "quit_game",  # Mensagem a notificar
+            QuitGame(),
+            events,
         )
 
-        # Registro dos observadores
-        self.play_button.add_observer(self)
-        self.options_button.add_observer(self)
-        self.quit_button.add_observer(self)
-
         self.buttons = [self.play_button, self.options_button, self.quit_button]
         self.mouse_clicked = False
 
@@ -70,26 +77,14 @@ class MainMenu(Observer, Observable):
         self.menu_music.stop()
         self.logger.info("Menu music stopped")
 
-    def on_notification(self, message: str) -> None:
-        self.logger.info(f"MainMenu received notification: {message}")
-
-        if message == "start_game":
-            self.logger.info("Play button clicked")
-            self.notify_observers("start_game")
-        elif message == "open_options":
-            self.logger.info("Options button clicked")
-            self.notify_observers("open_options")
-        elif message == "quit_game":
-            self.logger.info("Quit button clicked")
-            self.window.close()
-
     def update(self, delta_time: float) -> None:
         mouse = self.window.get_mouse()
         mouse_pos = mouse.get_position()
         mouse_x, mouse_y = mouse_pos
 
         for button in self.buttons:
-            button.update_hover_state(mouse_x, mouse_y)
+            if button.update_hover_state(mouse_x, mouse_y):
+                self.window.mark_dirty(button.dirty_rect)
 
         mouse_pressed = mouse.is_button_pressed(mouse.BUTTON_LEFT)
 
@@ -1,14 +1,18 @@
+import pygame
 from app.pplay.sprite import Sprite
-from app.core.observer import Observable
+from app.core.event_bus import EventBus
+from app.core.events import Event
 
 
-class MenuButton(Sprite, Observable):
-    def __init__(self, image_file: str, x: float, y: float, action: str):
+class MenuButton(Sprite):
+    def __init__(
+        self, image_file: str, x: float, y: float, action: Event, events: EventBus
+    ):
         Sprite.__init__(self, image_file)
-        Observable.__init__(self)
         self.x = x
         self.y = y
-        self.action = action  # Mensagem a ser enviada quando clicar
+        self.action = action  # Evento postado quando clicar
+        self.events = events
         self.is_hovered = False
         self.original_x = x
         self.original_y = y
@@ -19,7 +23,15 @@ class MenuButton(Sprite, Observable):
             and self.y <= mouse_y <= self.y + self.height
         )
 
-    def update_hover_state(self, mouse_x: int, mouse_y: int) -> None:
+    @property
+    def dirty_rect(self) -> pygame.Rect:
+        # Cobre a posição normal e a deslocada pelo hover
+        return pygame.Rect(
+            self.original_x - 2, self.original_y - 2, self.width + 2, self.height + 2
+        )
+
+    def update_hover_state(self, mouse_x: int, mouse_y: int) -> bool:
+        """Atualiza o hover e retorna se o botão mudou de posição."""
         was_hovered = self.is_hovered
         self.is_hovered = self.is_clicked(mouse_x, mouse_y)
 
@@ -29,6 +41,7 @@ class MenuButton(Sprite, Observable):
         elif not self.is_hovered and was_hovered:
             self.x = self.original_x
             self.y = self.original_y
+        return self.is_hovered != was_hovered
 
     def on_click(self) -> None:
-        self.notify_observers(self.action)
+        self.events.post(self.action)
@@ -0,0 +1,73 @@
+import pygame
+from typing import List
+from app.pplay.window import Window
+from app.core.frame_profiler import FrameProfiler, frame_profiler
+
+# Etapas que fazem parte de outra e aparecem recuadas
+NESTED_STAGES = {"input", "collision", "events", "level_draw", "hud"}
+
+# Recalcular percentis ordena 600 amostras por etapa: não precisa ser todo quadro
+REFRESH_FRAMES = 30
+
+
+class ProfilerOverlay:
+    """Tabela com média, p95 e p99 de cada etapa; alterna com a tecla F3."""
+
+    def __init__(
+        self, window: Window, profiler: FrameProfiler = frame_profiler, hotkey="F3"
+    ):
+        self.window = window
+        self.profiler = profiler
+        self.hotkey = hotkey
+        self.visible = False
+        self.key_pressed = False
+        self.font_name = "Courier New"
+        self.font_size = 18
+        self.lines: List[str] = []
+        self._refreshed_at = -REFRESH_FRAMES
+
+    def handle_input(self) -> None:
+        pressed = self.window.get_keyboard().key_pressed(self.hotkey)
+        if pressed and not self.key_pressed:
+            self.visible = not self.visible
+            # Ao esconder, a tela inteira precisa ser reapresentada sem a tabela
+            self.window.invalidate()
+            self._refreshed_at = -REFRESH_FRAMES
+        self.key_pressed = pressed
+
+    def update(self) -> None:
+        if not self.visible:
+            return
+        if self.profiler.frames - self._refreshed_at < REFRESH_FRAMES:
+            return
+
+        self._refreshed_at = self.profiler.frames
+        self.lines = [f"{'stage':<13}{'avg':>8}{'p95':>8}{'p99':>8}  ms"]
+        for stage, stats in self.profiler.summary().items():
+            label = f"  {stage}" if stage in NESTED_STAGES else stage
+            self.lines.append(
+                f"{label:<13}{stats.avg_ms:>8.2f}{stats.p95_ms:>8.2f}"
+                f"{stats.p99_ms:>8.2f}"
+            )
+
+    def draw(self) -> None:
+        if not self.visible or not self.window.screen or not self.lines:
+            return
+
+        margin = 10
+        line_height = self.font_size + 4
+        background = pygame.Rect(
+            margin, margin, 420, line_height * len(self.lines) + 2 * margin
+        )
+        pygame.draw.rect(self.window.screen, (0, 0, 0), background)
+        self.window.mark_dirty(background)
+
+        for i, line in enumerate(self.lines):
+            self.window.draw_text(
+                line,
+                2 * margin,
+                2 * margin + i * line_height,
+                size=self.font_size,
+                color=(0, 255, 0),
+                font_name=self.font_name,
+            )
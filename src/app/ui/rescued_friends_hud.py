@@ -1,11 +1,21 @@
 import pygame
-from typing import Set
+from typing import List, Set
 from app.pplay.window import Window
 from app.seedwork.path_helper import asset_path
-from app.core.observer import Observer
+from app.seedwork.asset_cache import AssetKey, asset_cache
+from app.core.events import CharacterRescued
 
+ICON_SIZE = (48, 48)
 
-class RescuedFriendsHUD(Observer):
+ICON_FILES = {
+    "butter": "butter_icon.png",
+    "cheese": "cheese_icon.png",
+    "dried_meat": "dried_meat_icon.png",
+    "milk": "milk_icon.png",
+}
+
+
+class RescuedFriendsHUD:
     def __init__(self, window: Window):
         self.window = window
         self.font_size = 24
@@ -13,40 +23,31 @@ class RescuedFriendsHUD(Observer):
         self.text_color = (255, 255, 255)
         self.character_order = ["butter", "cheese", "dried_meat", "milk"]
         self.rescued_friends: Set[str] = set()
+        self._asset_keys: List[AssetKey] = []
         self.icons = self._load_icons()
-        self.gray_icons = {
-            name: self._grayscale(icon) for name, icon in self.icons.items()
-        }
+        self.gray_icons = self._load_icons(grayscale=True)
+
+    def on_character_rescued(self, event: CharacterRescued) -> None:
+        if event.name in self.character_order:
+            self.rescued_friends.add(event.name)
 
-    def on_notification(self, message: str) -> None:
-        if message.startswith("rescued_"):
-            character_name = message[len("rescued_"):]
-            if character_name in self.character_order:
-                self.rescued_friends.add(character_name)
-    
-    def _load_icons(self) -> dict[str, pygame.Surface]:
-        icon_files = {
-            "butter": "butter_icon.png",
-            "cheese": "cheese_icon.png",
-            "dried_meat": "dried_meat_icon.png",
-            "milk": "milk_icon.png",
-        }
+    def _load_icons(self, grayscale: bool = False) -> dict[str, pygame.Surface]:
         icons = {}
-        for name, filename in icon_files.items():
+        for name, filename in ICON_FILES.items():
             icon_path = asset_path("images", "hud", filename)
-            icon = pygame.image.load(icon_path).convert_alpha()
-            scaled_icon = pygame.transform.scale(icon, (48, 48))
-            icons[name] = scaled_icon
+            icons[name] = asset_cache.image(
+                icon_path, size=ICON_SIZE, grayscale=grayscale
+            )
+            self._asset_keys.append(
+                asset_cache.image_key(icon_path, size=ICON_SIZE, grayscale=grayscale)
+            )
         return icons
 
-    def _grayscale(self, surface: pygame.Surface) -> pygame.Surface:
-        gray_surface = surface.copy()
-        for x in range(gray_surface.get_width()):
-            for y in range(gray_surface.get_height()):
-                r, g, b, a = gray_surface.get_at((x, y))
-                gray = int(0.299 * r + 0.587 * g + 0.114 * b)
-                gray_surface.set_at((x, y), (gray, gray, gray, a))
-        return gray_surface
+    def close(self) -> None:
+        """Devolve os ícones ao cache."""
+        for key in self._asset_keys:
+            asset_cache.release(key)
+        self._asset_keys = []
 
     def draw(self):
         if not self.window.screen:
@@ -0,0 +1,90 @@
+"""
+Suite de benchmarks headless (drivers dummy do SDL).
+
+    cd src && python -m benchmarks                    # roda e compara com o baseline
+    cd src && python -m benchmarks --update-baseline  # grava um novo baseline
+    cd src && python -m benchmarks --only load_tilemap --output results.json
+
+Sai com código 1 se algum cenário ficou mais lento que o baseline além da
+tolerância (relativa, sobre a mediana).
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse  # noqa: E402
+import sys  # noqa: E402
+from pathlib import Path  # noqa: E402
+from benchmarks.report import (  # noqa: E402
+    DEFAULT_TOLERANCE,
+    compare,
+    load_report,
+    run_scenarios,
+    write_report,
+)
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+
+def _parse_tolerance(value: str):
+    name, _, tolerance = value.rpartition("=")
+    if not name:
+        raise argparse.ArgumentTypeError("expected NAME=TOLERANCE")
+    return name, float(tolerance)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks headless do jogo")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH))
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--only", default="", help="roda só cenários com este trecho")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=None,
+        help=f"tolerância padrão (padrão do baseline ou {DEFAULT_TOLERANCE})",
+    )
+    parser.add_argument(
+        "--scenario-tolerance",
+        type=_parse_tolerance,
+        action="append",
+        default=[],
+        metavar="NAME=TOLERANCE",
+    )
+    args = parser.parse_args()
+
+    report = run_scenarios(args.repeat, args.only)
+    write_report(report, args.output)
+    print(f"Results written to {args.output}")
+
+    if args.update_baseline:
+        baseline = load_report(args.baseline) if os.path.exists(args.baseline) else {}
+        report["tolerances"] = baseline.get("tolerances", {})
+        report["default_tolerance"] = baseline.get(
+            "default_tolerance", DEFAULT_TOLERANCE
+        )
+        write_report(report, args.baseline)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; nothing to compare")
+        return 0
+
+    comparison = compare(
+        report,
+        load_report(args.baseline),
+        default_tolerance=args.tolerance,
+        overrides=dict(args.scenario_tolerance),
+    )
+    for line in comparison.lines():
+        print(line)
+    return 1 if comparison.regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
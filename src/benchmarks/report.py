@@ -0,0 +1,112 @@
+import json
+import math
+import platform
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+DEFAULT_TOLERANCE = 0.25
+
+Report = Dict[str, Any]
+
+
+def summarize(samples: List[float]) -> Dict[str, Any]:
+    ordered = sorted(samples)
+    p95 = ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+    return {
+        "median_ms": statistics.median(ordered) * 1000,
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "min_ms": ordered[0] * 1000,
+        "p95_ms": p95 * 1000,
+        "samples": len(ordered),
+    }
+
+
+def run_scenarios(repeat: int, only: str = "") -> Report:
+    import pygame
+    from app.pplay.window import Window
+    from benchmarks.scenarios import SCENARIOS
+
+    window = Window(1920, 1080)
+    results = {}
+    for name, scenario in SCENARIOS.items():
+        if only and only not in name:
+            continue
+        results[name] = summarize(scenario(window, repeat))
+        print(f"{name:<36}{results[name]['median_ms']:>12.3f} ms")
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def write_report(report: Report, path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load_report(path: str) -> Report:
+    with open(path) as f:
+        return json.load(f)
+
+
+@dataclass
+class Comparison:
+    # (cenário, mediana atual, mediana do baseline, tolerância)
+    rows: List[tuple] = field(default_factory=list)
+    regressions: List[str] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+
+    def lines(self) -> List[str]:
+        lines = [f"{'scenario':<36}{'baseline':>12}{'current':>12}{'change':>9}"]
+        for name, current, baseline, tolerance in self.rows:
+            change = current / baseline - 1 if baseline else 0.0
+            flag = "  REGRESSION" if name in self.regressions else ""
+            lines.append(
+                f"{name:<36}{baseline:>10.3f}ms{current:>10.3f}ms"
+                f"{change:>+8.0%}{flag} (tol {tolerance:.0%})"
+            )
+        for name in self.missing:
+            lines.append(f"{name:<36}{'':>12}{'new':>12}")
+        return lines
+
+
+def compare(
+    report: Report,
+    baseline: Report,
+    default_tolerance: Optional[float] = None,
+    overrides: Optional[Dict[str, float]] = None,
+) -> Comparison:
+    """
+    Compara as medianas com o baseline. A tolerância de cada cenário vem, em
+    ordem: ``overrides``, ``tolerances`` do baseline, ``default_tolerance``,
+    ``default_tolerance`` do baseline e ``DEFAULT_TOLERANCE``.
+    """
+    if default_tolerance is None:
+        default_tolerance = baseline.get("default_tolerance", DEFAULT_TOLERANCE)
+    tolerances = {**baseline.get("tolerances", {}), **(overrides or {})}
+
+    comparison = Comparison()
+    for name, result in report["results"].items():
+        reference = baseline.get("results", {}).get(name)
+        if reference is None:
+            comparison.missing.append(name)
+            continue
+
+        tolerance = tolerances.get(name, default_tolerance)
+        current = result["median_ms"]
+        expected = reference["median_ms"]
+        comparison.rows.append((name, current, expected, tolerance))
+        if current > expected * (1 + tolerance):
+            comparison.regressions.append(name)
+
+    return comparison
@@ -0,0 +1,239 @@
+"""
+Cenários de benchmark. Cada cenário recebe o número de repetições e devolve
+os tempos, em segundos, de cada execução medida.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+from app.pplay.window import Window
+
+Scenario = Callable[[Window, int], List[float]]
+
+SCENARIOS: Dict[str, Scenario] = {}
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+
+
+def scenario(name: str) -> Callable[[Scenario], Scenario]:
+    def register(function: Scenario) -> Scenario:
+        SCENARIOS[name] = function
+        return function
+
+    return register
+
+
+def measure(function: Callable[[], None], repeat: int, number: int = 1) -> List[float]:
+    """Roda ``function`` uma vez para aquecer e mede ``repeat`` lotes de ``number``."""
+    function()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            function()
+        samples.append((time.perf_counter() - started) / number)
+    return samples
+
+
+_COLD_STARTUP = """
+import time
+from app.seedwork.startup import import_pygame
+import_pygame()
+from app.config.config import Config
+from app.pplay.window import Window
+from app.core.game import Game
+
+window = Window(1920, 1080)
+game = Game(window, Config())
+game.menu.start_music()
+game.menu.draw()
+window.update()
+print(time.time_ns())
+"""
+
+
+@scenario("cold_startup")
+def cold_startup(window: Window, repeat: int) -> List[float]:
+    """Do processo novo até o primeiro ``MainMenu.draw`` aparecer na tela."""
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    samples = []
+    for _ in range(repeat):
+        started = time.time_ns()
+        output = subprocess.run(
+            [sys.executable, "-c", _COLD_STARTUP],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        drawn_at = int(output.strip().splitlines()[-1])
+        samples.append((drawn_at - started) / 1e9)
+    return samples
+
+
+@scenario("time_to_first_frame")
+def time_to_first_frame(window: Window, repeat: int) -> List[float]:
+    """O ``main`` de verdade, do início do processo ao primeiro quadro."""
+    from app.seedwork.startup import run_headless
+
+    reports = run_headless([sys.executable, "-m", "app.main"], repeat)
+    return [report["first_frame_ms"] / 1000 for report in reports]
+
+
+def _map_names() -> List[str]:
+    from app.seedwork.path_helper import get_assets_dir
+
+    paths = (get_assets_dir() / "tilemaps").glob("map_*.tmx")
+    return sorted((path.stem for path in paths), key=lambda name: int(name[4:]))
+
+
+def _register_tilemap_scenarios() -> None:
+    from app.seedwork.tilemap_loader import load_tilemap_groups
+
+    for map_name in _map_names():
+
+        def load(window: Window, repeat: int, map_name: str = map_name) -> List[float]:
+            return measure(lambda: load_tilemap_groups(map_name), repeat)
+
+        SCENARIOS[f"load_tilemap_groups[{map_name}]"] = load
+
+
+_register_tilemap_scenarios()
+
+
+@scenario("collision_step")
+def collision_step(window: Window, repeat: int) -> List[float]:
+    """Um ``handle_collisions`` da batata correndo no chão do nível 1."""
+    from app.core.level import Level
+    from app.entities.potato import Potato
+    from app.core.headless import ScriptedInput, hold
+
+    level = Level(window, 1, set())
+    potato = Potato(900, 600, ScriptedInput(hold(0)))
+    level.set_main_character(potato)
+    for _ in range(120):
+        level.update(1 / 60)
+
+    transform, movement = potato.transform, potato.movement
+    state = (transform.x, transform.y, movement.vy, movement.is_on_ground)
+
+    def step() -> None:
+        transform.set_position(state[0], state[1])
+        movement.vx, movement.vy, movement.is_on_ground = 500.0, state[2], state[3]
+        potato.collision_handler.handle_collisions(
+            transform, movement, level.solid_grid, 1 / 60
+        )
+
+    return measure(step, repeat, number=2000)
+
+
+@scenario("level_draw")
+def level_draw(window: Window, repeat: int) -> List[float]:
+    from app.core.level import Level
+    from app.entities.potato import Potato
+
+    level = Level(window, 1, set())
+    level.set_main_character(Potato(900, 600))
+    return measure(level.draw, repeat, number=50)
+
+
+def _paused_game(window: Window):
+    from app.config.config import Config
+    from app.core.game import Game
+
+    game = Game(window, Config())
+    game.loader.wait()
+    game._start_game()
+    game.scenes.push(game.pause_menu)
+    return game
+
+
+@scenario("paused_frame")
+def paused_frame(window: Window, repeat: int) -> List[float]:
+    game = _paused_game(window)
+    try:
+        return measure(game._draw_frame, repeat, number=30)
+    finally:
+        game.level_slider.close()
+        game.loader.close()
+
+
+@scenario("options_frame")
+def options_frame(window: Window, repeat: int) -> List[float]:
+    from app.core.events import OpenOptions
+
+    game = _paused_game(window)
+    game.events.publish(OpenOptions())
+    try:
+        return measure(game._draw_frame, repeat, number=30)
+    finally:
+        game.level_slider.close()
+        game.loader.close()
+
+
+@scenario("main_menu_frame")
+def main_menu_frame(window: Window, repeat: int) -> List[float]:
+    """Quadro do menu principal parado (só dirty rects, nada a apresentar)."""
+    from app.config.config import Config
+    from app.core.game import Game
+
+    game = Game(window, Config())
+    game.loader.wait()
+    try:
+        return measure(game._draw_frame, repeat, number=30)
+    finally:
+        game.loader.close()
+
+
+@scenario("play_click")
+def play_click(window: Window, repeat: int) -> List[float]:
+    """Do Play, com o menu já aquecido, até o primeiro quadro do nível."""
+    from app.config.config import Config
+    from app.core.game import Game
+
+    samples = []
+    for _ in range(repeat):
+        game = Game(window, Config())
+        game.loader.wait()
+        started = time.perf_counter()
+        game._start_game()
+        game._draw_frame()
+        samples.append(time.perf_counter() - started)
+        game.level_slider.close()
+        game.loader.close()
+        game.game_music.stop()
+    return samples
+
+
+def _transition(window: Window, repeat: int, cache_size: int, number: int):
+    from app.core.level_slider import LevelSlider
+
+    slider = LevelSlider(window, prefetch=False, level_cache_size=cache_size)
+    forward = [True]
+
+    def transition() -> None:
+        if forward[0]:
+            slider.slide_next()
+        else:
+            slider.slide_previous()
+        forward[0] = not forward[0]
+
+    try:
+        return measure(transition, repeat, number=number)
+    finally:
+        slider.close()
+
+
+@scenario("level_transition_cold")
+def level_transition_cold(window: Window, repeat: int) -> List[float]:
+    """Troca de nível montando o próximo do zero (sem cache nem pré-carga)."""
+    return _transition(window, repeat, cache_size=1, number=1)
+
+
+@scenario("level_transition_cached")
+def level_transition_cached(window: Window, repeat: int) -> List[float]:
+    """Troca entre dois níveis já montados no cache do ``LevelSlider``."""
+    return _transition(window, repeat, cache_size=4, number=20)
@@ -0,0 +1,13 @@
+import os
+
+# Os testes rodam sem display nem placa de som (CI)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pytest  # noqa: E402
+from app.pplay.window import Window  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def window() -> Window:
+    return Window(1920, 1080)
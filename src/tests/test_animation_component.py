@@ -0,0 +1,39 @@
+import pygame
+from app.components.animation_component import AnimationComponent
+from app.core.animation_state import AnimationState
+from app.pplay.window import Window
+from app.seedwork.asset_cache import asset_cache
+
+
+def test_flipped_frames_are_mirrored_copies(window: Window) -> None:
+    component = AnimationComponent("potato")
+    component.set_facing_direction(False)
+
+    frame = component.get_current_frame()
+    original = component.animator.get_current_frame()
+    expected = pygame.transform.flip(original, True, False)
+
+    assert frame is not original
+    assert pygame.image.tobytes(frame, "RGBA") == pygame.image.tobytes(expected, "RGBA")
+
+
+def test_steady_state_frames_allocate_no_surfaces(window: Window) -> None:
+    component = AnimationComponent("potato")
+    allocated_after_load = asset_cache.stats.surfaces_allocated
+    preloaded = {
+        id(surface)
+        for data in component.animator._animations.values()
+        for surface in data.frames + data.flipped_frames
+    }
+
+    for i in range(240):
+        component.set_facing_direction(i % 2 == 0)
+        component.change_state(
+            AnimationState.RUN if i % 60 < 30 else AnimationState.IDLE
+        )
+        component.update(1 / 60)
+        assert id(component.get_current_frame()) in preloaded
+
+    # Outra batata (ex.: restart) usa as mesmas superfícies, espelhadas ou não
+    AnimationComponent("potato").set_facing_direction(False)
+    assert asset_cache.stats.surfaces_allocated == allocated_after_load
@@ -0,0 +1,95 @@
+import json
+from pathlib import Path
+from typing import Iterator
+import pygame
+import pytest
+from app.pplay.window import Window
+from app.seedwork.asset_bake import BakeJob, bake, collect_jobs
+from app.seedwork.asset_cache import AssetCache
+from app.seedwork.path_helper import asset_path, baked_asset, clear_bake_cache
+
+ICON = "images/hud/butter_icon.png"
+BACKGROUND = "tilemaps/duto.png"
+JOBS = [
+    BakeJob(ICON, variants=((None, (48, 48), False), (None, (48, 48), True))),
+    BakeJob(BACKGROUND, reencode=True),
+]
+
+
+@pytest.fixture
+def baked_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    monkeypatch.setenv("ODISSEIA_BAKED_DIR", str(tmp_path))
+    clear_bake_cache()
+    yield tmp_path
+    monkeypatch.delenv("ODISSEIA_BAKED_DIR")
+    clear_bake_cache()
+
+
+def _pixels(surface: pygame.Surface) -> bytes:
+    return pygame.image.tobytes(surface, "RGBA")
+
+
+def test_jobs_cover_derived_and_large_assets() -> None:
+    jobs = {job.source: job for job in collect_jobs()}
+
+    assert jobs["images/characters/potato/run/1.png"].variants == ((1.5, None, False),)
+    assert len(jobs[ICON].variants) == 2
+    assert jobs[BACKGROUND].reencode
+    assert jobs["musics/game.mp3"].is_audio
+    assert "images/hud/milk_icon.png" in jobs
+
+
+def test_bake_is_incremental(baked_dir: Path) -> None:
+    first = bake(JOBS, baked_dir=baked_dir, workers=0)
+    second = bake(JOBS, baked_dir=baked_dir, workers=0)
+
+    assert first.baked == [ICON, BACKGROUND]
+    assert second.baked == []
+    assert second.up_to_date == [ICON, BACKGROUND]
+    assert (baked_dir / "images/hud/butter_icon@48x48-gray.bmp").exists()
+    assert (baked_dir / "tilemaps/duto.bmp").exists()
+
+
+def test_changed_recipe_is_rebaked_and_orphans_removed(baked_dir: Path) -> None:
+    bake(JOBS, baked_dir=baked_dir, workers=0)
+
+    report = bake([BakeJob(ICON, variants=((None, (32, 32), False),))], workers=0)
+
+    assert report.baked == [ICON]
+    assert (baked_dir / "images/hud/butter_icon@32x32.bmp").exists()
+    assert not (baked_dir / "images/hud/butter_icon@48x48.bmp").exists()
+    assert not (baked_dir / "tilemaps/duto.bmp").exists()
+
+
+def test_baked_outputs_match_runtime_transforms(
+    window: Window, baked_dir: Path
+) -> None:
+    source = asset_path(*ICON.split("/"))
+    bake(JOBS, baked_dir=baked_dir, workers=0)
+
+    baked = AssetCache().image(source, size=(48, 48), grayscale=True)
+    computed = AssetCache(use_baked=False).image(source, size=(48, 48), grayscale=True)
+
+    assert baked_asset(source, "48x48-gray") is not None
+    assert _pixels(baked) == _pixels(computed)
+
+
+def test_asset_path_resolves_reencoded_files(window: Window, baked_dir: Path) -> None:
+    original = str(Path(asset_path("tilemaps", "duto.png")))
+    bake(JOBS, baked_dir=baked_dir, workers=2)
+
+    resolved = asset_path("tilemaps", "duto.png")
+
+    assert resolved == str(baked_dir / "tilemaps" / "duto.bmp")
+    assert _pixels(pygame.image.load(resolved)) == _pixels(pygame.image.load(original))
+
+
+def test_stale_outputs_are_ignored(baked_dir: Path) -> None:
+    bake(JOBS, baked_dir=baked_dir, workers=0)
+    manifest_path = baked_dir / "manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    manifest["assets"][BACKGROUND]["size"] += 1
+    manifest_path.write_text(json.dumps(manifest))
+    clear_bake_cache()
+
+    assert asset_path("tilemaps", "duto.png").endswith("duto.png")
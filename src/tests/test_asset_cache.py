@@ -0,0 +1,114 @@
+import pygame
+from app.components.animation_component import AnimationComponent
+from app.pplay.sprite import Sprite
+from app.pplay.window import Window
+from app.seedwork.asset_cache import AssetCache, asset_cache
+from app.seedwork.path_helper import asset_path
+from app.ui.rescued_friends_hud import RescuedFriendsHUD
+
+
+def test_image_is_shared_and_counted(window: Window) -> None:
+    cache = AssetCache()
+    path = asset_path("images", "main_menu_button.png")
+
+    first = cache.image(path)
+    second = cache.image(path)
+
+    assert first is second
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == 1
+    assert cache.refcount(cache.image_key(path)) == 2
+    assert cache.stats.surfaces_allocated == 1
+
+    cache.image(path, flip_x=True)
+    cache.image(path, flip_x=True)
+    assert cache.stats.surfaces_allocated == 2
+
+
+def test_release_and_purge_drop_derived_entries(window: Window) -> None:
+    cache = AssetCache()
+    path = asset_path("images", "hud", "milk_icon.png")
+
+    cache.image(path, size=(48, 48))
+    assert len(cache) == 2  # imagem base + versão escalada
+
+    cache.release(cache.image_key(path, size=(48, 48)))
+    assert cache.purge_unused() == 2
+    assert len(cache) == 0
+
+
+def test_grayscale_matches_per_pixel_luma(window: Window) -> None:
+    cache = AssetCache()
+    path = asset_path("images", "hud", "butter_icon.png")
+
+    colored = cache.image(path, size=(48, 48))
+    gray = cache.image(path, size=(48, 48), grayscale=True)
+
+    for x in range(0, 48, 5):
+        for y in range(0, 48, 5):
+            r, g, b, a = colored.get_at((x, y))
+            expected = int(0.299 * r + 0.587 * g + 0.114 * b)
+            assert gray.get_at((x, y)) == pygame.Color(expected, expected, expected, a)
+
+
+def _scene_objects(window: Window) -> tuple:
+    return (
+        AnimationComponent("potato"),
+        RescuedFriendsHUD(window),
+        Sprite(asset_path("images", "hud", "ruler.png")),
+    )
+
+
+def test_rebuilding_scene_objects_hits_the_cache(window: Window) -> None:
+    component, hud, sprite = _scene_objects(window)
+    component.release()
+    hud.close()
+    sprite.release()
+    misses = asset_cache.stats.misses
+
+    component, hud, sprite = _scene_objects(window)
+
+    assert asset_cache.stats.misses == misses
+    component.release()
+    hud.close()
+    sprite.release()
+
+
+def _surface(side: int) -> pygame.Surface:
+    return pygame.Surface((side, side), pygame.SRCALPHA)
+
+
+def test_budget_evicts_least_recently_used_first(window: Window) -> None:
+    surface = _surface(32)
+    size = surface.get_height() * surface.get_pitch()
+    cache = AssetCache(budget_bytes=2 * size)
+
+    cache.add(("a",), surface)
+    cache.add(("b",), _surface(32))
+    cache.get(("a",), _surface)  # "a" passa a ser a mais recente
+    cache.add(("c",), _surface(32))
+
+    assert ("a",) in cache and ("c",) in cache
+    assert ("b",) not in cache
+    assert cache.stats.evictions == 1
+    assert cache.stats.resident_bytes == 2 * size
+
+
+def test_referenced_and_pinned_entries_survive_the_budget(window: Window) -> None:
+    cache = AssetCache()
+    path = asset_path("images", "hud", "ruler.png")
+    cache.image(path)
+    cache.add(("pinned",), _surface(64))
+    cache.pin([("pinned",)])
+    cache.add(("loose",), _surface(64))
+
+    cache.set_budget(0)
+
+    assert cache.image_key(path) in cache and ("pinned",) in cache
+    assert ("loose",) not in cache
+
+    cache.unpin([("pinned",)])
+    assert ("pinned",) not in cache
+    cache.release(cache.image_key(path))
+    cache.set_budget(0)
+    assert len(cache) == 0 and cache.stats.resident_bytes == 0
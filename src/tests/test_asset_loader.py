@@ -0,0 +1,93 @@
+import threading
+from typing import Iterator
+import pygame
+import pytest
+from app.pplay.window import Window
+from app.seedwork.asset_cache import AssetCache
+from app.seedwork.asset_loader import AssetLoader
+from app.seedwork.path_helper import asset_path
+from app.seedwork.tilemap_loader import load_tilemap_groups, tileset_paths
+
+ICON = asset_path("images", "hud", "cheese_icon.png")
+
+
+@pytest.fixture
+def loader(window: Window) -> Iterator[AssetLoader]:
+    loader = AssetLoader(AssetCache())
+    yield loader
+    loader.close()
+
+
+def _pixels(surface: pygame.Surface) -> bytes:
+    return pygame.image.tobytes(surface, "RGBA")
+
+
+def test_futures_resolve_on_the_main_thread(loader: AssetLoader) -> None:
+    finalized_on = []
+    future = loader.submit(
+        threading.current_thread, lambda worker: finalized_on.append(worker)
+    )
+    loader.wait(timeout=5)
+
+    assert future.done()
+    assert finalized_on[0] is not threading.main_thread()
+    assert loader.pending == 0
+
+
+def test_image_matches_synchronous_load(loader: AssetLoader) -> None:
+    future = loader.image(ICON, size=(48, 48), flip_x=True)
+    assert not future.done()  # Só resolve em poll
+
+    loader.wait(timeout=5)
+
+    expected = AssetCache().image(ICON, size=(48, 48), flip_x=True)
+    assert _pixels(future.result()) == _pixels(expected)
+    key = loader.cache.image_key(ICON, size=(48, 48), flip_x=True)
+    assert loader.cache.refcount(key) == 1
+
+
+def test_preload_keeps_no_reference(loader: AssetLoader) -> None:
+    key = loader.cache.image_key(ICON, grayscale=True)
+    loader.preload_image(ICON, grayscale=True)
+    loader.wait(timeout=5)
+
+    assert key in loader.cache
+    assert loader.cache.refcount(key) == 0
+
+
+def test_after_runs_once_everything_finished(loader: AssetLoader) -> None:
+    calls = []
+    loads = [loader.preload_image(ICON), loader.read(ICON)]
+    done = loader.after(loads, lambda: calls.append(len(loader.cache)))
+
+    loader.wait(timeout=5)
+
+    assert done.done()
+    assert calls == [1]
+    assert loads[1].result()[:4] == b"\x89PNG"
+
+
+def test_failures_are_reported_through_the_future(loader: AssetLoader) -> None:
+    future = loader.image(ICON.replace("cheese", "missing"))
+    loader.wait(timeout=5)
+
+    assert isinstance(future.exception(), (FileNotFoundError, pygame.error))
+
+
+def test_poll_respects_budget(loader: AssetLoader) -> None:
+    for _ in range(3):
+        loader.submit(lambda: None, lambda _: None)
+    while loader._ready.qsize() < 3:
+        pass
+
+    assert loader.poll(budget=0) == 1
+    assert loader.pending == 2
+
+
+def test_tilesets_are_dropped_after_building_the_map(window: Window) -> None:
+    from app.seedwork.asset_cache import asset_cache
+
+    load_tilemap_groups("map_1")
+
+    for path in tileset_paths("map_1"):
+        assert asset_cache.image_key(path) not in asset_cache
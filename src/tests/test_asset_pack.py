@@ -0,0 +1,82 @@
+from pathlib import Path
+from typing import Iterator
+import pygame
+import pytest
+from app.pplay.window import Window
+from app.seedwork.asset_bake import BakeJob, build_pack
+from app.seedwork.asset_cache import AssetCache
+from app.seedwork.asset_pack import AssetPack, AssetPackWriter, get_asset_pack
+from app.seedwork.compiled_tilemap import compile_tmx, load_compiled_map
+from app.seedwork.path_helper import asset_path, get_assets_dir
+
+ICON = "images/hud/butter_icon.png"
+
+
+@pytest.fixture
+def pack_path(
+    window: Window, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[Path]:
+    path = tmp_path / "assets.opak"
+    build_pack(path, jobs=[BakeJob(ICON, variants=((None, (48, 48), True),))])
+    monkeypatch.setenv("ODISSEIA_ASSET_PACK", str(path))
+    get_asset_pack.cache_clear()
+    yield path
+    monkeypatch.delenv("ODISSEIA_ASSET_PACK")
+    get_asset_pack.cache_clear()
+
+
+def _pixels(surface: pygame.Surface) -> bytes:
+    return pygame.image.tobytes(surface, "RGBA")
+
+
+def test_images_are_views_of_the_mapping(window: Window, tmp_path: Path) -> None:
+    surface = pygame.Surface((3, 2), pygame.SRCALPHA)
+    surface.fill((10, 20, 30, 40))
+    writer = AssetPackWriter(tmp_path / "test.opak")
+    writer.add_image("images/a.png", surface.convert_alpha())
+    writer.add_blob("data", b"abc")
+    writer.close()
+
+    pack = AssetPack(tmp_path / "test.opak")
+    image = pack.image(str(get_assets_dir() / "images" / "a.png"))
+
+    assert len(pack) == 2
+    assert _pixels(image) == _pixels(surface)
+    assert bytes(pack.blob("data")) == b"abc"
+    assert pack.blob("images/a.png") is None
+    assert pack.image(asset_path("images", "menu_background.png")) is None
+
+    # Sem cópia: a superfície enxerga o que muda no mapeamento
+    _, offset, _, _, _ = pack._index["images/a.png"]
+    pack._map[offset : offset + 4] = bytes([0, 0, 255, 255])
+    assert image.get_at((0, 0)) == (255, 0, 0, 255)
+
+
+def test_cache_reads_images_and_variants_from_pack(pack_path: Path) -> None:
+    source = asset_path(*ICON.split("/"))
+    cache = AssetCache()
+
+    assert get_asset_pack() is not None
+    assert _pixels(cache.image(source)) == _pixels(
+        AssetCache(use_baked=False).image(source)
+    )
+    assert _pixels(cache.image(source, size=(48, 48), grayscale=True)) == _pixels(
+        AssetCache(use_baked=False).image(source, size=(48, 48), grayscale=True)
+    )
+
+
+def test_compiled_maps_come_from_pack(pack_path: Path) -> None:
+    tmx = asset_path("tilemaps", "map_1.tmx")
+
+    assert load_compiled_map(tmx) == compile_tmx(tmx)
+
+
+def test_unreadable_pack_falls_back_to_loose_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "broken.opak").write_bytes(b"not a pack")
+    monkeypatch.setenv("ODISSEIA_ASSET_PACK", str(tmp_path / "broken.opak"))
+    get_asset_pack.cache_clear()
+
+    assert get_asset_pack() is None
+    get_asset_pack.cache_clear()
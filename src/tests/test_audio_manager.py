@@ -0,0 +1,122 @@
+import wave
+from pathlib import Path
+from typing import Iterator
+import pygame
+import pytest
+from app.pplay.music import Music
+from app.pplay.sound import Sound
+from app.pplay.window import Window
+from app.seedwork.asset_cache import AssetCache
+from app.seedwork.audio_manager import (
+    MASTER_BUS,
+    MUSIC_BUS,
+    SFX_BUS,
+    UI_BUS,
+    AudioManager,
+    audio_manager,
+)
+from app.seedwork.path_helper import asset_path
+
+
+def _silence(seconds: float = 2.0) -> pygame.mixer.Sound:
+    frequency, size, channels = pygame.mixer.get_init()
+    length = int(frequency * seconds) * channels * abs(size) // 8
+    return pygame.mixer.Sound(buffer=bytes(length))
+
+
+@pytest.fixture
+def manager(window: Window) -> Iterator[AudioManager]:
+    manager = AudioManager(voices={SFX_BUS: 2, UI_BUS: 1}, cache=AssetCache())
+    assert manager.init()
+    yield manager
+    manager.stop()
+    # Devolve os canais como o audio_manager do jogo os deixou
+    total = sum(audio_manager.voices.values())
+    pygame.mixer.set_num_channels(total)
+    pygame.mixer.set_reserved(total)
+
+
+@pytest.fixture
+def effect(tmp_path: Path, window: Window) -> Iterator[str]:
+    path = tmp_path / "effect.wav"
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(22050)
+        f.writeframes(bytes(2 * 22050 * 2))
+    yield str(path)
+    audio_manager.stop()
+
+
+def test_mixer_is_initialized_once(manager: AudioManager) -> None:
+    assert manager.init()
+
+    manager.configure(frequency=22050, buffer=256)
+
+    assert manager.frequency != 22050
+    assert pygame.mixer.get_num_channels() == 3
+    # Os canais dos grupos não ficam livres para Sound.play
+    assert _silence().play() is None
+
+
+def test_full_group_steals_oldest_voice(manager: AudioManager) -> None:
+    first, second, third = _silence(), _silence(), _silence()
+
+    manager.play(first)
+    manager.play(second)
+    channel = manager.play(third)
+
+    assert channel is manager.buses[SFX_BUS].channels[0]
+    assert channel.get_sound() is third
+    assert manager.buses[SFX_BUS].channels[1].get_sound() is second
+    assert manager.buses[SFX_BUS].steals == 1
+    # Outro grupo não perde a voz
+    ui = manager.play(_silence(), UI_BUS)
+    assert ui is manager.buses[UI_BUS].channels[0]
+
+
+def test_bus_volume_updates_only_its_channels(manager: AudioManager) -> None:
+    sfx = manager.play(_silence(), volume=50)
+    ui = manager.play(_silence(), UI_BUS)
+
+    manager.set_volume(SFX_BUS, 40)
+    assert sfx.get_volume() == pytest.approx(0.2, abs=0.01)
+    assert ui.get_volume() == pytest.approx(1.0, abs=0.01)
+
+    manager.set_volume(MASTER_BUS, 50)
+    assert sfx.get_volume() == pytest.approx(0.1, abs=0.01)
+    assert ui.get_volume() == pytest.approx(0.5, abs=0.01)
+
+
+def test_music_volume_follows_bus(window: Window) -> None:
+    track = Music(asset_path("musics", "game.mp3"))
+    track.set_volume(50)
+    track.play()
+    try:
+        audio_manager.set_volume(MUSIC_BUS, 50)
+        assert pygame.mixer.music.get_volume() == pytest.approx(0.25, abs=0.01)
+        audio_manager.set_volume(MASTER_BUS, 20)
+        assert pygame.mixer.music.get_volume() == pytest.approx(0.05, abs=0.01)
+    finally:
+        audio_manager.set_volume(MUSIC_BUS, 100)
+        audio_manager.set_volume(MASTER_BUS, 100)
+        track.stop()
+
+
+def test_sound_controls_only_its_channel(effect: str) -> None:
+    jump, click = Sound(effect), Sound(effect)
+    assert jump.sound is click.sound
+
+    jump.play()
+    click.play()
+    jump.pause()
+
+    assert click.is_playing()
+    assert click.channel is not jump.channel
+    assert jump.channel.get_volume() == pytest.approx(0.5, abs=0.01)
+
+    click.set_volume(10)
+    assert jump.channel.get_volume() == pytest.approx(0.5, abs=0.01)
+
+    click.stop()
+    assert not click.is_playing()
@@ -0,0 +1,51 @@
+import pytest
+from app.pplay.window import Window
+from benchmarks.report import compare, summarize
+from benchmarks.scenarios import SCENARIOS
+
+
+def _report(**medians: float) -> dict:
+    return {"results": {name: {"median_ms": ms} for name, ms in medians.items()}}
+
+
+def test_summarize_reports_milliseconds() -> None:
+    summary = summarize([0.004, 0.001, 0.002, 0.003])
+
+    assert summary["median_ms"] == pytest.approx(2.5)
+    assert summary["min_ms"] == pytest.approx(1.0)
+    assert summary["p95_ms"] == pytest.approx(4.0)
+    assert summary["samples"] == 4
+
+
+def test_compare_flags_only_slowdowns_beyond_tolerance() -> None:
+    baseline = {
+        **_report(draw=10.0, load=100.0, step=1.0),
+        "default_tolerance": 0.2,
+        "tolerances": {"step": 1.0},
+    }
+    report = _report(draw=11.9, load=130.0, step=1.9, new=5.0)
+
+    comparison = compare(report, baseline)
+
+    assert comparison.regressions == ["load"]
+    assert comparison.missing == ["new"]
+
+
+def test_compare_overrides_take_precedence() -> None:
+    baseline = {**_report(draw=10.0), "tolerances": {"draw": 1.0}}
+
+    comparison = compare(_report(draw=12.0), baseline, overrides={"draw": 0.1})
+
+    assert comparison.regressions == ["draw"]
+
+
+def test_scenarios_cover_every_map() -> None:
+    maps = [name for name in SCENARIOS if name.startswith("load_tilemap_groups")]
+    assert len(maps) == 8
+
+
+def test_collision_scenario_runs(window: Window) -> None:
+    samples = SCENARIOS["collision_step"](window, 1)
+
+    assert len(samples) == 1
+    assert samples[0] > 0
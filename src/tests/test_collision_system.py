@@ -0,0 +1,147 @@
+import random
+from typing import List
+
+import numpy as np
+import pygame
+import pytest
+from app.components.movement import Movement
+from app.components.transform import Transform
+from app.core.collision_system import CollisionHandler
+from app.core.level import Level
+from app.core.solid_grid import SolidGrid
+from app.core.tile_grid import TileGrid
+from app.core.tile_layer import TileLayer
+from app.core.tilemap_group import TilemapGroup
+from app.entities.tile import Tile
+from app.pplay.window import Window
+
+
+def _linear_handle_collisions(
+    transform: Transform, movement: Movement, tiles: List[Tile], dt: float
+) -> None:
+    """Implementação original (varredura linear), usada como referência."""
+    transform.x += movement.vx * dt
+    transform.update_rect()
+    for tile in tiles:
+        if transform.rect.colliderect(tile.rect):
+            if movement.vx > 0:
+                transform.rect.right = tile.rect.left
+                movement.vx = 0
+            elif movement.vx < 0:
+                transform.rect.left = tile.rect.right
+                movement.vx = 0
+            transform.x = transform.rect.x
+
+    transform.y += movement.vy * dt
+    transform.update_rect()
+    for tile in tiles:
+        if transform.rect.colliderect(tile.rect):
+            if movement.vy > 0:
+                transform.rect.bottom = tile.rect.top
+                movement.vy = 0
+            elif movement.vy < 0:
+                transform.rect.top = tile.rect.bottom
+                movement.vy = 0
+            transform.y = transform.rect.y
+
+
+def _linear_on_ground(transform: Transform, tiles: List[Tile]) -> bool:
+    ground_check_rect = pygame.Rect(
+        transform.rect.x, transform.rect.bottom, transform.rect.width, 1
+    )
+    return any(ground_check_rect.colliderect(tile.rect) for tile in tiles)
+
+
+def _interactive_tiles(level: Level) -> List[Tile]:
+    return [
+        Tile(rect.x, rect.y, image)
+        for group_type, layer in level.tilemap_layers
+        if group_type == TilemapGroup.INTERACTIVE_BLOCK
+        for rect, image in layer.tiles()
+    ]
+
+
+def test_solid_grid_marks_interactive_tiles(window: Window) -> None:
+    level = Level(window, 6, set())
+    tiles = _interactive_tiles(level)
+
+    solid_rects = [
+        level.solid_grid.rect(index)
+        for index in range(level.solid_grid.mask.size)
+        if level.solid_grid.mask.flat[index]
+    ]
+    # Mesma ordem dos tiles na camada: a da varredura linear
+    assert solid_rects == [tile.rect for tile in tiles]
+
+
+def test_interactive_layer_keeps_no_sprites(window: Window) -> None:
+    level = Level(window, 6, set())
+    layers = [
+        layer
+        for group_type, layer in level.tilemap_layers
+        if group_type == TilemapGroup.INTERACTIVE_BLOCK
+    ]
+
+    assert layers and all(isinstance(layer, TileLayer) for layer in layers)
+    assert sum(len(layer) for layer in layers) == len(level.solid_grid)
+
+
+def test_tile_larger_than_a_cell_is_rejected(window: Window) -> None:
+    images = [None, pygame.Surface((64, 64)), pygame.Surface((64, 128))]
+
+    layer = TileLayer(np.array([1, 0, 0, 1]), images, 2, 2, 64, 64)
+    assert layer.mask.tolist() == [[True, False], [False, True]]
+    # A colisão usaria 64x64 para um bloco desenhado com 64x128
+    with pytest.raises(ValueError):
+        TileLayer(np.array([1, 0, 2, 1]), images, 2, 2, 64, 64)
+
+
+def test_solid_grid_lookup_ignores_cells_outside_the_map() -> None:
+    grid = SolidGrid(3, 2, 64, 64)
+    grid.set_solid(0, 0)
+    grid.set_solid(2, 1)
+
+    assert grid.first_collision(pygame.Rect(-100, -100, 120, 120)) == 0
+    assert grid.first_collision(pygame.Rect(-100, -100, 120, 120), after=0) == -1
+    assert grid.first_collision(pygame.Rect(150, 100, 500, 500)) == 5
+    assert grid.first_collision(pygame.Rect(64, 0, 64, 64)) == -1
+    assert grid.first_collision(pygame.Rect(10, 10, 0, 20)) == -1
+    # À esquerda do mapa, na linha da célula 5
+    assert grid.first_collision(pygame.Rect(-200, 70, 100, 10)) == -1
+    assert grid.rect(5) == pygame.Rect(128, 64, 64, 64)
+
+
+def test_grid_collisions_match_linear_scan(window: Window) -> None:
+    rng = random.Random(1234)
+    handler = CollisionHandler()
+
+    for level_number in range(1, 9):
+        level = Level(window, level_number, set())
+        tiles = _interactive_tiles(level)
+        # O backend do jogo e o índice de listas soltas
+        grids = (level.solid_grid, TileGrid(tiles))
+        for _ in range(400):
+            x = rng.uniform(-50, window.width)
+            y = rng.uniform(-50, window.height)
+            vx = rng.choice([-1000.0, -500.0, 0.0, 500.0, 1000.0])
+            vy = rng.uniform(-1600, 1600)
+            dt = rng.choice([1 / 30, 1 / 60, 1 / 240, 0.25])
+
+            expected_t, expected_m = Transform(x, y, 72, 96), Movement()
+            expected_m.vx, expected_m.vy = vx, vy
+            _linear_handle_collisions(expected_t, expected_m, tiles, dt)
+
+            for grid in grids:
+                actual_t, actual_m = Transform(x, y, 72, 96), Movement()
+                actual_m.vx, actual_m.vy = vx, vy
+                handler.handle_collisions(actual_t, actual_m, grid, dt)
+
+                assert (actual_t.x, actual_t.y, actual_m.vx, actual_m.vy) == (
+                    expected_t.x,
+                    expected_t.y,
+                    expected_m.vx,
+                    expected_m.vy,
+                )
+                assert handler.check_on_ground(actual_t, grid) == _linear_on_ground(
+                    expected_t, tiles
+                )
@@ -0,0 +1,100 @@
+import os
+import shutil
+from pathlib import Path
+import pygame
+import pytest
+from app.core.tile_layer import TileLayer
+from app.pplay.window import Window
+from app.seedwork import compiled_tilemap
+from app.seedwork.compiled_tilemap import compiled_path_for, load_compiled_map
+from app.seedwork.path_helper import asset_path
+from app.seedwork.tilemap_loader import (
+    load_tilemap,
+    load_tilemap_from_tmx,
+    load_tilemap_groups,
+    load_tilemap_groups_from_tmx,
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    cache = tmp_path / "cache"
+    monkeypatch.setenv("ODISSEIA_CACHE_DIR", str(cache))
+    return cache
+
+
+def _tiles(layer) -> list:
+    if isinstance(layer, TileLayer):
+        return list(layer.tiles())
+    return [(sprite.rect, sprite.image) for sprite in layer.sprites()]
+
+
+def test_compiled_groups_match_tmx_groups(window: Window) -> None:
+    expected = load_tilemap_groups_from_tmx("map_1")
+    load_tilemap_groups("map_1")  # compila
+    compiled = load_tilemap_groups("map_1")  # lê do cache
+
+    assert [key for key, _ in compiled] == [key for key, _ in expected]
+    for (_, compiled_group), (_, expected_group) in zip(compiled, expected):
+        compiled_tiles = _tiles(compiled_group)
+        expected_tiles = _tiles(expected_group)
+        assert len(compiled_tiles) == len(expected_tiles)
+        for (got_rect, got), (want_rect, want) in zip(compiled_tiles, expected_tiles):
+            assert got_rect == want_rect
+            assert pygame.image.tobytes(got, "RGBA") == pygame.image.tobytes(
+                want, "RGBA"
+            )
+
+
+def test_compiled_solid_mask_matches_tmx(window: Window) -> None:
+    for level_number in range(1, 9):
+        expected = load_tilemap_from_tmx(f"map_{level_number}").solid
+        compiled = load_tilemap(f"map_{level_number}").solid
+
+        assert compiled.mask.shape == (17, 30)
+        assert (compiled.mask == expected.mask).all()
+
+
+def test_compiled_map_is_recompiled_when_tsx_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    maps_dir = tmp_path / "tilemaps"
+    maps_dir.mkdir()
+    for name in ("map_1.tmx", "tileset-esgoto.tsx"):
+        shutil.copy(asset_path("tilemaps", name), maps_dir / name)
+    tmx_path = str(maps_dir / "map_1.tmx")
+
+    compiles = []
+    original_compile = compiled_tilemap.compile_tmx
+
+    def counting_compile(path: str):
+        compiles.append(path)
+        return original_compile(path)
+
+    monkeypatch.setattr(compiled_tilemap, "compile_tmx", counting_compile)
+
+    first = load_compiled_map(tmx_path)
+    assert compiled_path_for(tmx_path).exists()
+    load_compiled_map(tmx_path)
+    assert len(compiles) == 1
+
+    tsx_path = maps_dir / "tileset-esgoto.tsx"
+    stat = os.stat(tsx_path)
+    os.utime(tsx_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second = load_compiled_map(tmx_path)
+
+    assert len(compiles) == 2
+    assert second.layers[0].gids == first.layers[0].gids
+
+
+def test_corrupt_compiled_map_is_rebuilt() -> None:
+    tmx_path = asset_path("tilemaps", "map_1.tmx")
+    expected = load_compiled_map(tmx_path)
+    compiled_path_for(tmx_path).write_bytes(b"garbage")
+
+    rebuilt = load_compiled_map(tmx_path)
+
+    assert rebuilt.width == expected.width
+    assert [layer.gids for layer in rebuilt.layers] == [
+        layer.gids for layer in expected.layers
+    ]
@@ -0,0 +1,84 @@
+from typing import Iterator, List
+import pygame
+import pytest
+from app.core.event_bus import EventBus
+from app.core.events import StartGame
+from app.core.scene_stack import Scene, SceneStack
+from app.pplay.window import Window
+from app.seedwork.path_helper import asset_path
+from app.ui.menu_button import MenuButton
+
+
+@pytest.fixture
+def presented(window: Window, monkeypatch: pytest.MonkeyPatch) -> Iterator[List]:
+    calls: List = []
+    # A janela reaproveita a lista de rects: guarda uma cópia
+    monkeypatch.setattr(
+        pygame.display, "update", lambda *args: calls.append([list(a) for a in args])
+    )
+    yield calls
+    window.set_dirty_rects(False)
+
+
+class DirtyScene(Scene):
+    uses_dirty_rects = True
+
+
+def test_full_updates_by_default(window: Window, presented: List) -> None:
+    window.set_dirty_rects(False)
+    window.mark_dirty((0, 0, 10, 10))
+
+    window.update()
+    window.update()
+
+    assert presented == [[], []]
+
+
+def test_only_dirty_rects_are_presented(window: Window, presented: List) -> None:
+    window.set_dirty_rects(True)
+    window.update()  # Ao entrar no modo, o primeiro quadro vai inteiro
+
+    window.update()
+    window.mark_dirty((0, 0, 10, 10))
+    window.mark_dirty(pygame.Rect(20, 20, 5, 5))
+    window.update()
+    window.invalidate()
+    window.mark_dirty((0, 0, 10, 10))
+    window.update()
+
+    assert presented == [
+        [],
+        [[pygame.Rect(0, 0, 10, 10), pygame.Rect(20, 20, 5, 5)]],
+        [],
+    ]
+
+
+def test_scene_stack_switches_dirty_rect_mode(window: Window) -> None:
+    scenes = SceneStack(window)
+
+    scenes.push(DirtyScene())
+    assert window.dirty_rects_enabled
+
+    scenes.push(Scene())
+    assert not window.dirty_rects_enabled
+
+    scenes.pop()
+    assert window.dirty_rects_enabled
+    window.set_dirty_rects(False)
+
+
+def test_hover_change_reports_both_positions(window: Window) -> None:
+    button = MenuButton(
+        asset_path("images", "play_button.png"), 100, 100, StartGame(), EventBus()
+    )
+    inside = (110, 110)
+
+    assert button.update_hover_state(*inside)
+    assert not button.update_hover_state(*inside)
+    assert button.dirty_rect.contains(
+        pygame.Rect(button.x, button.y, button.width, button.height)
+    )
+    assert button.update_hover_state(0, 0)
+    assert button.dirty_rect.contains(
+        pygame.Rect(button.x, button.y, button.width, button.height)
+    )
@@ -0,0 +1,93 @@
+from typing import List
+from app.core.event_bus import MAX_DISPATCH_ROUNDS, EventBus
+from app.core.events import (
+    Boundary,
+    BoundaryHit,
+    CharacterRescued,
+    Event,
+    GameWon,
+    StartGame,
+)
+from app.core.headless import NullWindow
+from app.core.level_slider import LevelSlider
+
+
+def test_handlers_only_receive_their_event_type() -> None:
+    bus = EventBus()
+    rescued: List[str] = []
+    bus.subscribe(CharacterRescued, lambda event: rescued.append(event.name))
+
+    bus.publish(StartGame())
+    bus.publish(CharacterRescued("butter"))
+
+    assert rescued == ["butter"]
+    assert bus.stats.events == {"StartGame": 1, "CharacterRescued": 1}
+
+
+def test_posted_events_wait_for_dispatch() -> None:
+    bus = EventBus()
+    received: List[Event] = []
+    bus.subscribe(GameWon, received.append)
+
+    bus.post(GameWon())
+    assert received == []
+    assert bus.pending == 1
+
+    assert bus.dispatch_pending() == 1
+    assert received == [GameWon()]
+    assert bus.pending == 0
+
+
+def test_events_posted_by_handlers_are_dispatched_in_the_same_call() -> None:
+    bus = EventBus()
+    received: List[Event] = []
+    bus.subscribe(StartGame, lambda event: bus.post(GameWon()))
+    bus.subscribe(GameWon, received.append)
+
+    bus.post(StartGame())
+
+    assert bus.dispatch_pending() == 2
+    assert received == [GameWon()]
+
+
+def test_dispatch_stops_after_max_rounds() -> None:
+    bus = EventBus()
+    bus.subscribe(StartGame, lambda event: bus.post(StartGame()))
+
+    bus.post(StartGame())
+
+    assert bus.dispatch_pending() == MAX_DISPATCH_ROUNDS
+    assert bus.pending == 1
+
+
+def test_handler_timing_is_recorded() -> None:
+    ticks = iter(range(0, 10_000, 1_000))
+    bus = EventBus(clock=lambda: next(ticks))
+
+    def on_game_won(event: GameWon) -> None:
+        pass
+
+    bus.subscribe(GameWon, on_game_won)
+    bus.publish(GameWon())
+    bus.publish(GameWon())
+
+    stats = bus.stats.handlers[on_game_won.__qualname__]
+    assert stats.calls == 2
+    assert stats.total_ns == 2_000
+    assert stats.avg_us == 1.0
+
+
+def test_slider_handles_boundary_after_the_step() -> None:
+    slider = LevelSlider(NullWindow(), prefetch=False)
+    try:
+        slider.main_character.transform.y = -10
+        slider.events.post(BoundaryHit(Boundary.TOP))
+        slider.events.post(BoundaryHit(Boundary.TOP))
+        assert slider.current_level_num == 1
+
+        slider.events.dispatch_pending()
+
+        # O segundo toque chega depois da troca e é descartado
+        assert slider.current_level_num == 2
+    finally:
+        slider.close()
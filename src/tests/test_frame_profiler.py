@@ -0,0 +1,93 @@
+import csv
+import json
+from pathlib import Path
+import pytest
+from app.core.frame_profiler import FrameProfiler
+from app.pplay.window import Window
+from app.ui.profiler_overlay import ProfilerOverlay
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0
+
+    def __call__(self) -> int:
+        return self.now
+
+
+def _profile(profiler: FrameProfiler, clock: FakeClock, durations_ms) -> None:
+    for duration in durations_ms:
+        with profiler.section("update"):
+            clock.now += int(duration * 1_000_000)
+        profiler.end_frame()
+
+
+def test_disabled_profiler_records_nothing() -> None:
+    clock = FakeClock()
+    profiler = FrameProfiler(capacity=4, clock=clock)
+
+    _profile(profiler, clock, [1, 2, 3])
+
+    assert profiler.frames == 0
+    assert profiler.samples("update") == []
+
+
+def test_ring_buffer_keeps_last_frames_without_reallocating() -> None:
+    clock = FakeClock()
+    profiler = FrameProfiler(capacity=4, clock=clock)
+    profiler.enabled = True
+    buffers = [id(samples) for samples in profiler._samples]
+
+    _profile(profiler, clock, [1, 2, 3, 4, 5, 6])
+
+    assert profiler.samples("update") == [3_000_000, 4_000_000, 5_000_000, 6_000_000]
+    assert profiler.samples("display") == [0, 0, 0, 0]
+    assert [id(samples) for samples in profiler._samples] == buffers
+
+
+def test_summary_percentiles() -> None:
+    clock = FakeClock()
+    profiler = FrameProfiler(capacity=100, clock=clock)
+    profiler.enabled = True
+
+    _profile(profiler, clock, range(1, 101))
+    stats = profiler.summary()["update"]
+
+    assert stats.avg_ms == pytest.approx(50.5)
+    assert stats.p95_ms == pytest.approx(95)
+    assert stats.p99_ms == pytest.approx(99)
+    assert stats.max_ms == pytest.approx(100)
+
+
+def test_export_json_and_csv(tmp_path: Path) -> None:
+    clock = FakeClock()
+    profiler = FrameProfiler(capacity=8, clock=clock)
+    profiler.enabled = True
+    _profile(profiler, clock, [1, 2])
+
+    profiler.export(str(tmp_path / "profile.json"))
+    profiler.export(str(tmp_path / "profile.csv"))
+
+    data = json.loads((tmp_path / "profile.json").read_text())
+    assert data["frames"] == 2
+    assert data["samples_ns"]["update"] == [1_000_000, 2_000_000]
+    assert data["summary"]["update"]["max_ms"] == pytest.approx(2)
+
+    with open(tmp_path / "profile.csv") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["update_ns"] for row in rows] == ["1000000", "2000000"]
+
+
+def test_overlay_lists_every_stage(window: Window) -> None:
+    clock = FakeClock()
+    profiler = FrameProfiler(capacity=8, clock=clock)
+    profiler.enabled = True
+    _profile(profiler, clock, [4])
+
+    overlay = ProfilerOverlay(window, profiler)
+    overlay.visible = True
+    overlay.update()
+    overlay.draw()
+
+    assert len(overlay.lines) == len(profiler.stages) + 1
+    assert overlay.lines[2].split() == ["update", "4.00", "4.00", "4.00"]
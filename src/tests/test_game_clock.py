@@ -0,0 +1,115 @@
+from typing import List, Optional, Tuple
+
+import pygame
+from app.core.game_clock import NS_PER_SECOND, FixedStepClock
+from app.core.level import Level
+from app.entities.potato import Potato
+from app.pplay.window import Window
+
+
+class FakeTime:
+    def __init__(self) -> None:
+        self.now = 0
+
+    def clock(self) -> int:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        # sleep(0) também consome um pouco de tempo, como no SO
+        self.now += max(int(seconds * NS_PER_SECOND), 100_000)
+
+
+class ScriptedJumpInput:
+    """Espera a batata pousar e segura o pulo por ``hold_ticks`` ticks."""
+
+    def __init__(self, potato: Potato, hold_ticks: int) -> None:
+        self.potato = potato
+        self.hold_ticks = hold_ticks
+        self.tick = 0
+        self.landed_tick: Optional[int] = None
+
+    def get_movement_input(self) -> Tuple[bool, bool, bool]:
+        self.tick += 1
+        if self.landed_tick is None:
+            if self.potato.movement.is_on_ground:
+                self.landed_tick = self.tick
+            return False, False, False
+        held = self.landed_tick < self.tick <= self.landed_tick + self.hold_ticks
+        return False, False, held
+
+    def get_toggle_debug_input(self) -> bool:
+        return False
+
+
+def _simulate_jump(window: Window, render_fps: int) -> List[Tuple[float, float]]:
+    fake_time = FakeTime()
+    clock = FixedStepClock(
+        fps=render_fps,
+        tick_rate=60,
+        max_steps_per_frame=8,
+        clock=fake_time.clock,
+        sleep=fake_time.sleep,
+    )
+    tiles = Level(window, 1, set()).solid_grid
+    potato = Potato(900, 600)
+    potato.input_handler = ScriptedJumpInput(potato, hold_ticks=30)
+
+    trace = []
+    while fake_time.now < 4 * NS_PER_SECOND:
+        for _ in range(clock.advance()):
+            potato.update(
+                clock.step, tiles, window.width, window.height, pygame.sprite.Group()
+            )
+            trace.append((potato.transform.y, potato.movement.is_on_ground))
+        clock.wait_for_next_frame()
+    return trace
+
+
+def _jump_apex_and_landing(trace: List[Tuple[float, bool]]) -> Tuple[int, float, int]:
+    takeoff = next(
+        i for i in range(1, len(trace)) if trace[i - 1][1] and not trace[i][1]
+    )
+    landing = next(i for i in range(takeoff, len(trace)) if trace[i][1])
+    apex = min(range(takeoff, landing), key=lambda i: trace[i][0])
+    return apex, trace[apex][0], landing
+
+
+def test_charged_jump_is_independent_of_frame_rate(window: Window) -> None:
+    trace_30 = _simulate_jump(window, render_fps=30)
+    trace_240 = _simulate_jump(window, render_fps=240)
+
+    apex_30, apex_y_30, landing_30 = _jump_apex_and_landing(trace_30)
+    apex_240, apex_y_240, landing_240 = _jump_apex_and_landing(trace_240)
+    ground_y = trace_30[landing_30][0]
+
+    assert apex_y_30 < ground_y - 64
+    assert (apex_30, apex_y_30, landing_30) == (apex_240, apex_y_240, landing_240)
+    assert trace_30[: landing_30 + 1] == trace_240[: landing_240 + 1]
+
+
+def test_steps_are_capped_after_a_hitch() -> None:
+    fake_time = FakeTime()
+    clock = FixedStepClock(
+        fps=60, tick_rate=60, max_steps_per_frame=5, clock=fake_time.clock
+    )
+
+    fake_time.now += 2 * NS_PER_SECOND
+    assert clock.advance() == 5
+    assert clock.dropped_ns > 1.8 * NS_PER_SECOND
+
+    fake_time.now += clock.step_ns
+    assert clock.advance() == 1
+
+
+def test_wait_sleeps_until_frame_deadline() -> None:
+    fake_time = FakeTime()
+    clock = FixedStepClock(
+        fps=50, tick_rate=60, clock=fake_time.clock, sleep=fake_time.sleep
+    )
+
+    fake_time.now += 5_000_000
+    clock.wait_for_next_frame()
+    assert 20_000_000 <= fake_time.now < 20_200_000
+
+    clock.wait_for_next_frame()
+    assert 40_000_000 <= fake_time.now < 40_200_000
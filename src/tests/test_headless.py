@@ -0,0 +1,52 @@
+from itertools import chain, islice
+from app.core.headless import (
+    NullWindow,
+    ScriptedInput,
+    hold,
+    random_inputs,
+    run_headless,
+)
+from app.core.level_slider import LevelSlider
+
+
+def test_scripted_input_runs_out_into_no_keys() -> None:
+    script = ScriptedInput(hold(2, right=True))
+
+    assert script.get_movement_input() == (False, True, False)
+    assert script.get_movement_input() == (False, True, False)
+    assert script.get_movement_input() == (False, False, False)
+    assert script.get_toggle_debug_input() is False
+
+
+def test_slider_runs_without_a_screen() -> None:
+    window = NullWindow()
+    slider = LevelSlider(
+        window,
+        prefetch=False,
+        input_handler=ScriptedInput(chain(hold(60), hold(30, right=True))),
+    )
+    potato = slider.main_character
+
+    for _ in range(60):
+        slider.update(1 / 60)
+    assert potato.movement.is_on_ground
+    start_x = potato.transform.x
+
+    for _ in range(30):
+        slider.update(1 / 60)
+
+    assert window.screen is None
+    assert slider.current_level._static_surface is None
+    assert potato.transform.x > start_x
+
+
+def test_run_headless_reports_frames_and_speed() -> None:
+    result = run_headless(islice(random_inputs(seed=1), 600), max_frames=600)
+
+    assert result.frames == 600
+    assert result.simulated_seconds == 10.0
+    assert result.fps > 0
+
+
+def test_random_inputs_are_reproducible() -> None:
+    assert list(islice(random_inputs(7), 500)) == list(islice(random_inputs(7), 500))
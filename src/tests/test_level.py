@@ -0,0 +1,44 @@
+import pygame
+from app.core.level import Level
+from app.core.tilemap_group import TilemapGroup
+from app.pplay.window import Window
+
+
+def _draw_layers_unbaked(window: Window, level: Level) -> None:
+    for group_type, group in level.tilemap_layers:
+        if group_type == TilemapGroup.BACKGROUND:
+            for background_tile in group:
+                background_tile.draw(window)
+    for group_type, group in level.tilemap_layers:
+        if group_type == TilemapGroup.INTERACTIVE_BLOCK:
+            group.draw(window.screen)
+    for group_type, group in level.tilemap_layers:
+        if group_type in [TilemapGroup.SCENERY_BLOCK, TilemapGroup.SCENERY_OBJECT]:
+            group.draw(window.screen)
+
+
+def test_baked_static_layers_match_layer_by_layer_draw(window: Window) -> None:
+    level = Level(window, 1, set())
+
+    window.set_background_color((0, 0, 0))
+    level.draw()
+    baked = pygame.image.tobytes(window.screen, "RGB")
+
+    window.set_background_color((0, 0, 0))
+    _draw_layers_unbaked(window, level)
+    expected = pygame.image.tobytes(window.screen, "RGB")
+
+    assert baked == expected
+
+
+def test_dirty_layer_rebuilds_static_surface(window: Window) -> None:
+    level = Level(window, 2, set())
+    level.draw()
+    first_surface = level._static_surface
+
+    level.draw()
+    assert level._static_surface is first_surface
+
+    level.mark_layer_dirty(TilemapGroup.SCENERY_BLOCK)
+    level.draw()
+    assert level._static_surface is not first_surface
@@ -0,0 +1,148 @@
+import threading
+import time
+
+from app.core.events import CharacterRescued
+from app.core.level import Level
+from app.core.level_slider import LevelSlider
+from app.pplay.window import Window
+from app.seedwork.asset_cache import asset_cache
+from app.seedwork.tilemap_loader import tileset_keys
+
+
+def _wait_for_prefetch(slider: LevelSlider) -> None:
+    deadline = time.monotonic() + 10
+    while slider._pending_levels and time.monotonic() < deadline:
+        slider.loader.poll()
+        slider._collect_prefetched_levels()
+        time.sleep(0.001)
+
+
+def test_neighbors_are_prefetched_and_swapped_in(window: Window) -> None:
+    slider = LevelSlider(window)
+    try:
+        _wait_for_prefetch(slider)
+        assert 2 in slider._level_cache
+
+        prefetched = slider._level_cache[2]
+        slider.slide_next()
+        assert slider.current_level is prefetched
+
+        _wait_for_prefetch(slider)
+        level_one = slider._level_cache[1]
+        slider.slide_previous()
+        assert slider.current_level is level_one
+    finally:
+        slider.close()
+
+
+def test_prefetched_level_is_built_on_main_thread(window: Window, monkeypatch) -> None:
+    threads = []
+    init, bake = Level.__init__, Level.bake_static_layers
+
+    def record_init(self, *args, **kwargs):
+        threads.append(threading.current_thread())
+        init(self, *args, **kwargs)
+
+    def record_bake(self):
+        threads.append(threading.current_thread())
+        bake(self)
+
+    monkeypatch.setattr(Level, "__init__", record_init)
+    monkeypatch.setattr(Level, "bake_static_layers", record_bake)
+
+    slider = LevelSlider(window)
+    try:
+        _wait_for_prefetch(slider)
+        assert slider._level_cache[2]._static_surface is not None
+        # Montagem e composição do nível inicial e do vizinho
+        assert len(threads) == 4
+        assert set(threads) == {threading.main_thread()}
+    finally:
+        slider.close()
+
+
+def test_cached_level_hides_friends_rescued_elsewhere(window: Window) -> None:
+    slider = LevelSlider(window, start_level=2, prefetch=False)
+    try:
+        level_two = slider.current_level
+        assert len(level_two.idle_characters) == 1
+
+        slider.events.publish(CharacterRescued("butter"))
+        slider.slide_next()
+        slider.slide_previous()
+
+        assert slider.current_level is level_two
+        assert len(level_two.idle_characters) == 0
+    finally:
+        slider.close()
+
+
+def test_cache_is_bounded(window: Window) -> None:
+    slider = LevelSlider(window, level_cache_size=2, prefetch=False)
+    try:
+        for _ in range(4):
+            slider.slide_next()
+        assert list(slider._level_cache) == [4, 5]
+    finally:
+        slider.close()
+
+
+def test_current_level_tilesets_are_pinned(window: Window) -> None:
+    asset_cache.clear()  # sem fixações deixadas por sliders de outros testes
+    slider = LevelSlider(window, prefetch=False)
+    try:
+        asset_cache.set_budget(0)
+        level_one = tileset_keys("map_1")
+        assert all(key in asset_cache for key in level_one)
+
+        slider.slide_next()
+        slider.slide_next()  # mapa 3: outro fundo
+        current = tileset_keys("map_3")
+        assert all(key in asset_cache for key in current)
+        left_behind = [key for key in level_one if key not in current]
+        assert left_behind
+        assert not any(key in asset_cache for key in left_behind)
+    finally:
+        slider.close()
+        asset_cache.set_budget(None)
+
+
+def test_walking_every_level_stays_within_budget(window: Window) -> None:
+    asset_cache.clear()
+    # Cabe um nível (~10 MB com atlas, personagens e HUD), não o jogo inteiro
+    budget = 12 * 1024 * 1024
+    asset_cache.set_budget(budget)
+    evictions = asset_cache.stats.evictions
+    slider = LevelSlider(window, level_cache_size=1, prefetch=False)
+    try:
+        assert asset_cache.stats.resident_bytes <= budget
+        while slider.current_level_num < slider.max_level:
+            slider.slide_next()
+            assert asset_cache.stats.resident_bytes <= budget
+        assert asset_cache.stats.evictions > evictions
+    finally:
+        slider.close()
+        asset_cache.set_budget(None)
+
+
+def test_close_returns_every_asset_reference(window: Window) -> None:
+    from app.core.end_game_state import EndGameState
+
+    # Derivadas em cache seguram a imagem base: só contam as referências de fora
+    asset_cache.purge_unused()
+    before = {key: asset_cache.refcount(key) for key in list(asset_cache._entries)}
+
+    slider = LevelSlider(window, start_level=2, level_cache_size=1, prefetch=False)
+    slider.slide_next()  # descarta o nível 2, com a manteiga
+    slider.slide_previous()
+    slider.close()
+    end = EndGameState(window, {"butter", "milk"}, slider.events)
+    end.close()
+    asset_cache.purge_unused()
+
+    leaked = {
+        key: asset_cache.refcount(key)
+        for key in list(asset_cache._entries)
+        if asset_cache.refcount(key) != before.get(key, 0)
+    }
+    assert leaked == {}
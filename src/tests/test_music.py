@@ -0,0 +1,82 @@
+from typing import Iterator
+import pygame
+import pytest
+from app.pplay.music import Music
+from app.pplay.window import Window
+from app.seedwork.audio_manager import MASTER_BUS, MUSIC_BUS, audio_manager
+from app.seedwork.path_helper import asset_path
+
+
+@pytest.fixture
+def tracks(window: Window) -> Iterator[tuple]:
+    # Barramentos no máximo: o stream fica com o volume da própria trilha
+    audio_manager.set_volume(MASTER_BUS, 100)
+    audio_manager.set_volume(MUSIC_BUS, 100)
+    game = Music(asset_path("musics", "game.mp3"))
+    end = Music(asset_path("musics", "fim.mp3"))
+    yield game, end
+    game.stop()
+    end.stop()
+
+
+def test_music_is_not_loaded_until_played(tracks: tuple) -> None:
+    game, _ = tracks
+    game.set_volume(30)
+    game.set_repeat(True)
+
+    assert not game.is_playing()
+    assert Music._current is None
+
+
+def test_playing_another_track_takes_over_the_stream(tracks: tuple) -> None:
+    game, end = tracks
+    game.set_volume(20)
+    end.set_volume(80)
+
+    game.play()
+    assert game.is_playing()
+    assert pygame.mixer.music.get_volume() == pytest.approx(0.2, abs=0.01)
+
+    end.play()
+    assert end.is_playing()
+    assert not game.is_playing()
+    assert pygame.mixer.music.get_volume() == pytest.approx(0.8, abs=0.01)
+
+    # Volume de uma trilha parada não mexe no stream de outra
+    game.set_volume(50)
+    assert pygame.mixer.music.get_volume() == pytest.approx(0.8, abs=0.01)
+
+    # Parar uma trilha que não toca não interrompe a atual
+    game.stop()
+    assert end.is_playing()
+
+
+def test_play_after_pause_resumes(tracks: tuple) -> None:
+    game, _ = tracks
+    game.play()
+    game.pause()
+    assert not game.is_playing()
+
+    game.play()
+    assert game.is_playing()
+    assert not game._paused
+
+
+def test_missing_track_plays_silently(window: Window) -> None:
+    missing = Music("does-not-exist.mp3")
+
+    missing.play()
+
+    assert not missing.is_playing()
+    assert Music._current is None
+
+
+def test_preloaded_track_plays_from_memory(tracks: tuple) -> None:
+    game, _ = tracks
+    with open(game.music_file, "rb") as f:
+        game.preload(f.read())
+    game.music_file = "moved-away.mp3"
+
+    game.play()
+
+    assert game.is_playing()
@@ -0,0 +1,61 @@
+import random
+from itertools import islice
+from typing import List, Tuple
+from app.core.headless import NullWindow, ScriptedInput, random_inputs
+from app.core.level_slider import LevelSlider
+from app.core.replay import (
+    KEY_RIGHT,
+    KEY_SPACE,
+    RecordingInput,
+    Replay,
+    ReplayRecorder,
+    TraceEntry,
+    decode,
+    encode,
+    run_replay,
+    snapshot,
+)
+
+
+def _record(frames: int, seed: int) -> Tuple[Replay, List[TraceEntry]]:
+    jitter = random.Random(seed)
+    random.seed(seed)
+    recorder = ReplayRecorder(Replay(seed))
+    source = ScriptedInput(islice(random_inputs(seed), frames))
+    slider = LevelSlider(
+        NullWindow(),
+        prefetch=False,
+        input_handler=RecordingInput(recorder, source),
+    )
+
+    trace = []
+    for _ in range(frames):
+        # dt variável como no loop sem passo fixo
+        delta_time = 1 / 60 + jitter.uniform(-0.004, 0.004)
+        recorder.begin_frame(delta_time)
+        slider.update(delta_time)
+        trace.append(snapshot(slider.main_character))
+    slider.close()
+    return recorder.replay, trace
+
+
+def test_replay_reproduces_transform_and_movement_bit_for_bit() -> None:
+    replay, recorded_trace = _record(frames=900, seed=3)
+
+    result = run_replay(decode(encode(replay)))
+
+    assert result.frames == 900
+    assert result.trace == recorded_trace
+
+
+def test_encoding_collapses_repeated_frames() -> None:
+    frames = (
+        [(1 / 60, 0)] * 500 + [(1 / 60, KEY_SPACE)] * 30 + [(1 / 60, KEY_RIGHT)] * 200
+    )
+    replay = Replay(seed=42, frames=frames)
+
+    data = encode(replay)
+
+    assert decode(data) == replay
+    # cabeçalho (24) + 3 blocos de 2-3 bytes, só o primeiro com o dt (8)
+    assert len(data) == 24 + (2 + 1 + 8) + (1 + 1) + (2 + 1)
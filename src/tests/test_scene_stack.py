@@ -0,0 +1,96 @@
+import pygame
+from app.core.headless import NullWindow
+from app.core.scene_stack import Scene, SceneStack
+from app.pplay.window import Window
+
+
+class ColorScene(Scene):
+    def __init__(self, window: Window, color) -> None:
+        self.window = window
+        self.color = color
+        self.draws = 0
+        self.updates = 0
+
+    def update(self, delta_time: float) -> None:
+        self.updates += 1
+
+    def draw(self) -> None:
+        self.draws += 1
+        self.window.get_screen().fill(self.color)
+
+
+class ModalScene(Scene):
+    modal = True
+
+    def __init__(self) -> None:
+        self.draws = 0
+
+    def draw(self) -> None:
+        self.draws += 1
+
+
+def test_modal_draws_scene_below_only_once(window: Window) -> None:
+    game = ColorScene(window, (200, 200, 200))
+    pause = ModalScene()
+    scenes = SceneStack(window)
+    scenes.push(game)
+
+    scenes.push(pause)
+    for _ in range(10):
+        scenes.update(1 / 60)
+        scenes.draw()
+
+    assert game.draws == 1
+    assert game.updates == 0
+    assert pause.draws == 10
+    # Fundo já escurecido, como o antigo overlay preto com alpha 180
+    assert window.get_screen().get_at((0, 0))[:3] == (59, 59, 59)
+
+
+def test_modal_over_modal_reuses_background(window: Window) -> None:
+    game = ColorScene(window, (200, 200, 200))
+    scenes = SceneStack(window)
+    scenes.push(game)
+    scenes.push(ModalScene())
+    background = scenes._backgrounds[-1]
+
+    scenes.push(ModalScene())
+
+    assert scenes._backgrounds[-1] is background
+    assert game.draws == 1
+
+
+def test_pop_and_replace(window: Window) -> None:
+    game = ColorScene(window, (0, 0, 0))
+    menu = ColorScene(window, (10, 10, 10))
+    scenes = SceneStack(window)
+    scenes.push(game)
+    scenes.push(ModalScene())
+
+    scenes.pop()
+    assert scenes.top is game
+
+    scenes.replace(menu)
+    assert len(scenes) == 1
+    assert game not in scenes
+    assert scenes._backgrounds == [None]
+
+
+def test_no_snapshot_without_a_screen() -> None:
+    window = NullWindow()
+    scenes = SceneStack(window)
+    scenes.push(Scene())
+
+    scenes.push(ModalScene())
+
+    assert scenes._backgrounds == [None, None]
+
+
+def test_opaque_scene_has_no_background(window: Window) -> None:
+    scenes = SceneStack(window)
+    scenes.push(ColorScene(window, (0, 0, 0)))
+
+    scenes.push(ColorScene(window, (1, 1, 1)))
+
+    assert scenes._backgrounds == [None, None]
+    assert isinstance(window.get_screen(), pygame.Surface)
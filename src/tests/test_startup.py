@@ -0,0 +1,125 @@
+import json
+import sys
+from pathlib import Path
+from typing import Iterator
+import pygame
+import pytest
+from app.pplay.window import Window
+from app.seedwork.startup import (
+    FIRST_FRAME_PHASE,
+    INTERPRETER_PHASE,
+    STARTUP_REPORT_ENV,
+    StartupReport,
+    import_pygame,
+    init_pygame,
+    summarize,
+)
+
+
+@pytest.fixture
+def report(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[StartupReport]:
+    (tmp_path / "slow_parent.py").write_text("import slow_child\n")
+    (tmp_path / "slow_child.py").write_text("import time\ntime.sleep(0.02)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    report = StartupReport()
+    report.install()
+    yield report
+    report.uninstall()
+    for name in ("slow_parent", "slow_child"):
+        sys.modules.pop(name, None)
+
+
+def test_imports_are_timed_per_module(report: StartupReport) -> None:
+    import slow_parent  # noqa: F401
+
+    parent, child = report.modules["slow_parent"], report.modules["slow_child"]
+    assert child.own >= 0.02
+    assert parent.cumulative >= child.cumulative
+    assert parent.own < 0.02
+    assert report.imports == pytest.approx(parent.cumulative)
+
+
+def test_report_is_written_to_the_file_in_the_variable(
+    report: StartupReport, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import slow_parent  # noqa: F401
+
+    report.measure_init("pygame.display", lambda: None)
+    monkeypatch.setenv(STARTUP_REPORT_ENV, str(tmp_path / "startup.txt"))
+    report.write()
+
+    text = (tmp_path / "startup.txt").read_text()
+    assert "slow_child" in text
+    assert "pygame.display" in text
+
+
+def test_init_only_starts_what_is_missing(window: Window) -> None:
+    report = StartupReport()
+
+    init_pygame(report)
+
+    assert report.init == {}
+    assert pygame.display.get_init() and pygame.font.get_init()
+    assert import_pygame() is pygame
+    assert "pkg_resources" not in sys.modules or sys.modules["pkg_resources"]
+
+
+def test_phases_are_recorded_only_when_installed() -> None:
+    idle = StartupReport()
+    with idle.phase("config"):
+        pass
+    assert idle.phases == []
+
+    report = StartupReport()
+    report.install()
+    try:
+        with report.phase("game_init"):
+            with report.phase("menus"):
+                pass
+    finally:
+        report.uninstall()
+
+    names = [(timing.name, timing.depth) for timing in report.phases]
+    assert names == [(INTERPRETER_PHASE, 0), ("game_init", 0), ("menus", 1)]
+    game, menus = report.phases[1:]
+    assert game.start <= menus.start and menus.end <= game.end
+
+
+def test_first_frame_writes_the_json_report_once(
+    report: StartupReport, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = tmp_path / "startup.json"
+    monkeypatch.setenv(STARTUP_REPORT_ENV, str(target))
+    with report.phase("window"):
+        pass
+
+    report.frame_presented()
+    first = json.loads(target.read_text())
+    target.unlink()
+    report.frame_presented()
+
+    assert not target.exists()
+    assert not report.waiting_first_frame
+    phases = [phase["name"] for phase in first["phases"]]
+    assert phases == [INTERPRETER_PHASE, "window", FIRST_FRAME_PHASE]
+    assert first["first_frame_ms"] >= first["phases"][-1]["start_ms"]
+
+
+def test_summary_takes_medians_per_phase() -> None:
+    reports = [
+        {
+            "origin": "process start",
+            "first_frame_ms": frame,
+            "imports_ms": frame / 2,
+            "phases": [
+                {"name": "imports", "depth": 0, "start_ms": 1.0, "duration_ms": frame}
+            ],
+        }
+        for frame in (300.0, 100.0, 200.0)
+    ]
+
+    summary = summarize(reports)
+
+    assert summary["first_frame_ms"] == {"median": 200.0, "min": 100.0, "max": 300.0}
+    assert summary["phases"]["imports"]["duration_ms"] == 200.0
+    assert summary["imports_ms"] == 100.0
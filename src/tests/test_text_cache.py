@@ -0,0 +1,38 @@
+from app.pplay.window import Window
+from app.seedwork.text_cache import FontRegistry, TextCache, font_registry, text_cache
+from app.ui.rescued_friends_hud import RescuedFriendsHUD
+
+
+def test_repeated_text_is_rendered_once(window: Window) -> None:
+    cache = TextCache(FontRegistry())
+
+    first = cache.render("Amigos Resgatados", "Segoe UI", 24, (255, 255, 255))
+    second = cache.render("Amigos Resgatados", "Segoe UI", 24, (255, 255, 255))
+    cache.render("Amigos Resgatados", "Segoe UI", 24, (0, 0, 0))
+
+    assert first is second
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+    assert cache.fonts.lookups == 1
+
+
+def test_lru_eviction_respects_byte_cap(window: Window) -> None:
+    cache = TextCache(FontRegistry(), max_bytes=1)
+
+    cache.render("a", "Arial", 12)
+    cache.render("b", "Arial", 12)
+
+    assert len(cache) == 1
+    assert cache.stats.evictions == 1
+    assert cache.stats.resident_bytes > 0
+
+
+def test_steady_hud_frame_does_no_lookups_or_rasterization(window: Window) -> None:
+    hud = RescuedFriendsHUD(window)
+    hud.draw()
+    lookups, misses = font_registry.lookups, text_cache.stats.misses
+
+    for _ in range(10):
+        hud.draw()
+
+    assert font_registry.lookups == lookups
+    assert text_cache.stats.misses == misses
@@ -0,0 +1,79 @@
+import pygame
+from pytmx import TileFlags
+from app.core.tile_layer import TileLayer
+from app.pplay.window import Window
+from app.seedwork.asset_cache import AssetCache, asset_cache
+from app.seedwork.path_helper import asset_path
+from app.seedwork.tilemap_loader import load_tilemap_groups
+from app.seedwork.tileset_cache import TilesetCache, tileset_cache, tileset_key
+
+TILESET = asset_path("tilemaps", "sprite-esgoto.png")
+RECT = (325, 65, 64, 64)
+
+
+def _images(map_name: str) -> list:
+    images = []
+    for _, layer in load_tilemap_groups(map_name):
+        if isinstance(layer, TileLayer):
+            images += [image for _, image in layer.tiles()]
+        else:
+            images += [sprite.image for sprite in layer.sprites()]
+    return images
+
+
+def test_tiles_are_subsurfaces_of_one_atlas(window: Window) -> None:
+    cache = TilesetCache(AssetCache())
+
+    tile = cache.tile(TILESET, rect=RECT)
+    other = cache.tile(TILESET, rect=(0, 0, 64, 64))
+
+    assert cache.tile(TILESET, rect=RECT) is tile
+    assert tile.get_parent() is other.get_parent()
+    assert tile.get_offset() == RECT[:2]
+    assert cache.stats.atlases == 1
+    assert cache.stats.hits == 1 and cache.stats.misses == 2
+    source = pygame.image.load(TILESET).subsurface(RECT)
+    assert pygame.image.tobytes(tile, "RGBA") == pygame.image.tobytes(source, "RGBA")
+
+
+def test_flipped_tiles_are_cached_copies(window: Window) -> None:
+    cache = TilesetCache(AssetCache())
+    flags = TileFlags(True, False, False)
+
+    flipped = cache.tile(TILESET, rect=RECT, flags=flags)
+
+    assert cache.tile(TILESET, rect=RECT, flags=flags) is flipped
+    assert flipped.get_parent() is None
+    expected = pygame.transform.flip(cache.tile(TILESET, rect=RECT), True, False)
+    assert pygame.image.tobytes(flipped, "RGBA") == pygame.image.tobytes(
+        expected, "RGBA"
+    )
+
+
+def test_maps_with_the_same_tileset_share_surfaces(window: Window) -> None:
+    first = _images("map_1")
+    atlases = tileset_cache.stats.atlases
+    decoded = asset_cache.stats.misses
+
+    second = _images("map_2")
+
+    # map_1 e map_2 usam o mesmo tileset e o mesmo fundo
+    assert tileset_cache.stats.atlases == atlases
+    assert asset_cache.stats.misses == decoded
+    atlases_used = {id(image.get_parent() or image) for image in first}
+    assert {id(image.get_parent() or image) for image in second} <= atlases_used
+
+
+def test_evicted_tileset_is_rebuilt(window: Window) -> None:
+    assets = AssetCache()
+    cache = TilesetCache(assets)
+    tile = cache.tile(TILESET, rect=RECT)
+    assert assets.stats.resident_bytes > 0
+
+    assets.set_budget(0)
+    rebuilt = cache.tile(TILESET, rect=RECT)
+
+    assert tileset_key(TILESET) in assets
+    assert rebuilt is not tile
+    assert cache.stats.atlases == 2
+    assert pygame.image.tobytes(rebuilt, "RGBA") == pygame.image.tobytes(tile, "RGBA")